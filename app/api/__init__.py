@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import FastAPI
 from app.api import (
     auth,
     user,
@@ -12,16 +12,23 @@ from app.api import (
     review,
 )
 
-api_router = APIRouter()
+# (라우터, prefix, 태그)
+# include_router는 등록할 때마다 라우트를 다시 만들기 때문에 중간 APIRouter 없이 앱에 한 번만 등록 (콜드 스타트 단축)
+ROUTERS = [
+    (auth.router, "/auth", "auth"),
+    (user.router, "/users", "users"),
+    (meeting.router, "/meetings", "meetings"),
+    (participant.router, "/participants", "participants"),
+    (time_candidate.router, "/time-candidates", "time-candidates"),
+    (time_vote.router, "/time-votes", "time-votes"),
+    (place.router, "/places", "places"),
+    (place_candidate.router, "/place-candidates", "place-candidates"),
+    (place_vote.router, "/place-votes", "place-votes"),
+    (review.router, "/reviews", "reviews"),
+]
 
-api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
-api_router.include_router(user.router, prefix="/users", tags=["users"])
-api_router.include_router(meeting.router, prefix="/meetings", tags=["meetings"])
-api_router.include_router(participant.router, prefix="/participants", tags=["participants"])
-api_router.include_router(time_candidate.router, prefix="/time-candidates", tags=["time-candidates"])
-api_router.include_router(time_vote.router, prefix="/time-votes", tags=["time-votes"])
-api_router.include_router(place.router, prefix="/places", tags=["places"])
-api_router.include_router(place_candidate.router, prefix="/place-candidates", tags=["place-candidates"])
-api_router.include_router(place_vote.router, prefix="/place-votes", tags=["place-votes"])
-api_router.include_router(review.router, prefix="/reviews", tags=["reviews"])
 
+def include_routers(app: FastAPI, prefix: str) -> None:
+    """모든 API 라우터를 prefix 아래에 등록"""
+    for router, router_prefix, tag in ROUTERS:
+        app.include_router(router, prefix=f"{prefix}{router_prefix}", tags=[tag])
@@ -1,7 +1,7 @@
 """인증 관련 API"""
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app import crud
 from app.schemas.auth import KakaoLoginRequest, KakaoLoginResponse
 from app.services.kakao import KakaoService
@@ -12,7 +12,7 @@ router = APIRouter()
 @router.post("/kakao/login", response_model=KakaoLoginResponse, status_code=status.HTTP_200_OK)
 async def kakao_login(
     request: KakaoLoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Kakao OAuth 로그인
@@ -33,7 +33,7 @@ async def kakao_login(
     user_info = KakaoService.parse_user_info(kakao_data)
     
     # 기존 사용자 확인
-    db_user = crud.user.get_user_by_oauth(
+    db_user = await crud.aio.user.get_user_by_oauth(
         db,
         oauth_provider=user_info["oauth_provider"],
         oauth_id=user_info["oauth_id"]
@@ -47,7 +47,7 @@ async def kakao_login(
         if db_user.name != user_info["name"]:
             from app.schemas.user import UserUpdate
             user_update = UserUpdate(name=user_info["name"])
-            db_user = crud.user.update_user(db, user_id=db_user.id, user_update=user_update)
+            db_user = await crud.aio.user.update_user(db, user_id=db_user.id, user_update=user_update)
     else:
         # 신규 사용자 - 회원가입
         from app.schemas.user import UserCreate
@@ -57,7 +57,7 @@ async def kakao_login(
             oauth_provider=user_info["oauth_provider"],
             oauth_id=user_info["oauth_id"],
         )
-        db_user = crud.user.create_user(db, user=user_create)
+        db_user = await crud.aio.user.create_user(db, user_create=user_create)
         is_new_user = True
     
     return KakaoLoginResponse(
@@ -1,46 +1,68 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from app.database import get_db
+from app.database import get_db, get_async_db, get_async_engine, AsyncSessionLocal, settings
 from app import crud
-from app.schemas.meeting import MeetingCreate, MeetingUpdate, MeetingResponse
+from app.schemas.meeting import MeetingCreate, MeetingUpdate, MeetingResponse, MeetingDashboardResponse
+from app.services.events import stream_events
+from app.api.pagination import set_page_headers
 
 router = APIRouter()
 
 
 @router.post("/", response_model=MeetingResponse, status_code=status.HTTP_201_CREATED)
-def create_meeting(meeting: MeetingCreate, creator_id: int, db: Session = Depends(get_db)):
+async def create_meeting(meeting: MeetingCreate, creator_id: int, db: AsyncSession = Depends(get_async_db)):
     """새 모임 생성"""
     # 생성자 존재 확인
-    db_user = crud.user.get_user(db, user_id=creator_id)
+    db_user = await crud.aio.user.get_user(db, user_id=creator_id)
     if not db_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="생성자를 찾을 수 없습니다."
         )
     
-    return crud.meeting.create_meeting(db=db, meeting=meeting, creator_id=creator_id)
+    return await crud.aio.meeting.create_meeting(db, meeting_create=meeting, creator_id=creator_id)
 
 
 @router.get("/", response_model=List[MeetingResponse])
-def read_meetings(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """모든 모임 목록 조회"""
-    meetings = crud.meeting.get_all_meetings(db, skip=skip, limit=limit)
+async def read_meetings(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """모든 모임 목록 조회 (다음 페이지는 X-Next-Cursor 헤더 값을 cursor로 전달, skip은 deprecated)"""
+    meetings = await crud.aio.meeting.get_all_meetings(db, skip=skip, limit=limit, cursor=cursor)
+    set_page_headers(response, meetings, crud.meeting.MEETING_ORDER, limit, skip)
     return meetings
 
 
 @router.get("/creator/{creator_id}", response_model=List[MeetingResponse])
-def read_meetings_by_creator(creator_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """생성자별 모임 목록 조회"""
-    meetings = crud.meeting.get_meetings_by_creator(db, creator_id=creator_id, skip=skip, limit=limit)
+async def read_meetings_by_creator(
+    creator_id: int,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """생성자별 모임 목록 조회 (다음 페이지는 X-Next-Cursor 헤더 값을 cursor로 전달, skip은 deprecated)"""
+    meetings = await crud.aio.meeting.get_meetings_by_creator(db, creator_id=creator_id, skip=skip, limit=limit, cursor=cursor)
+    set_page_headers(response, meetings, crud.meeting.MEETING_ORDER, limit, skip)
     return meetings
 
 
 @router.get("/share-code/{share_code}", response_model=MeetingResponse)
 def read_meeting_by_share_code(share_code: str, db: Session = Depends(get_db)):
-    """공유 코드로 모임 조회"""
-    db_meeting = crud.meeting.get_meeting_by_share_code(db, share_code=share_code)
+    """공유 코드로 모임 조회 (SHARE_CODE_CACHE_TTL초 동안 캐시)
+
+    캐시 single-flight 대기가 스레드 이벤트로 블로킹되므로 이벤트 루프가 아닌 스레드 풀에서 실행합니다.
+    """
+    db_meeting = crud.meeting.get_meeting_response_by_share_code(db, share_code=share_code)
     if db_meeting is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -50,9 +72,9 @@ def read_meeting_by_share_code(share_code: str, db: Session = Depends(get_db)):
 
 
 @router.get("/{meeting_id}", response_model=MeetingResponse)
-def read_meeting(meeting_id: UUID, db: Session = Depends(get_db)):
+async def read_meeting(meeting_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """모임 조회"""
-    db_meeting = crud.meeting.get_meeting(db, meeting_id=meeting_id)
+    db_meeting = await crud.aio.meeting.get_meeting(db, meeting_id=meeting_id)
     if db_meeting is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -61,10 +83,22 @@ def read_meeting(meeting_id: UUID, db: Session = Depends(get_db)):
     return db_meeting
 
 
+@router.get("/{meeting_id}/full", response_model=MeetingDashboardResponse)
+def read_meeting_full(meeting_id: UUID, db: Session = Depends(get_db)):
+    """모임 화면 전체 데이터 조회 (모임, 생성자, 참가자, 시간 후보/투표, 장소 후보, 장소 투표 집계)"""
+    dashboard = crud.meeting.get_meeting_dashboard(db, meeting_id=meeting_id)
+    if dashboard is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모임을 찾을 수 없습니다."
+        )
+    return dashboard
+
+
 @router.put("/{meeting_id}", response_model=MeetingResponse)
-def update_meeting(meeting_id: UUID, meeting_update: MeetingUpdate, db: Session = Depends(get_db)):
+async def update_meeting(meeting_id: UUID, meeting_update: MeetingUpdate, db: AsyncSession = Depends(get_async_db)):
     """모임 정보 업데이트"""
-    db_meeting = crud.meeting.update_meeting(db, meeting_id=meeting_id, meeting_update=meeting_update)
+    db_meeting = await crud.aio.meeting.update_meeting(db, meeting_id=meeting_id, meeting_update=meeting_update)
     if db_meeting is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -74,9 +108,9 @@ def update_meeting(meeting_id: UUID, meeting_update: MeetingUpdate, db: Session
 
 
 @router.delete("/{meeting_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_meeting(meeting_id: UUID, db: Session = Depends(get_db)):
+async def delete_meeting(meeting_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """모임 삭제"""
-    success = crud.meeting.delete_meeting(db, meeting_id=meeting_id)
+    success = await crud.aio.meeting.delete_meeting(db, meeting_id=meeting_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -84,3 +118,34 @@ def delete_meeting(meeting_id: UUID, db: Session = Depends(get_db)):
         )
     return None
 
+
+
+async def _meeting_exists(meeting_id: UUID) -> bool:
+    # 스트리밍 동안 DB 연결을 잡고 있지 않도록 확인용 세션은 바로 닫음
+    async with AsyncSessionLocal(bind=get_async_engine()) as db:
+        return await crud.aio.meeting.meeting_exists(db, meeting_id)
+
+
+@router.get("/{meeting_id}/events")
+async def stream_meeting_events(
+    meeting_id: UUID,
+    last_event_id: Optional[int] = None,
+    last_event_id_header: Optional[int] = Header(None, alias="Last-Event-ID"),
+):
+    """모임 투표/참가자 변경 이벤트 스트림 (Server-Sent Events)
+
+    이벤트: time_vote(시간별 증감과 현재 투표 수), place_vote, participant, reset(전체 다시 조회 필요)
+    재연결 시 Last-Event-ID 헤더(또는 last_event_id 쿼리)로 놓친 이벤트부터 이어 받습니다.
+    """
+    if not await _meeting_exists(meeting_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모임을 찾을 수 없습니다."
+        )
+    
+    last_seq = last_event_id_header if last_event_id_header is not None else last_event_id
+    return StreamingResponse(
+        stream_events(meeting_id, last_seq, heartbeat_seconds=settings.EVENT_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,19 @@
+"""목록 API 페이지네이션 응답 헤더"""
+from typing import Any, Sequence
+
+from fastapi import Response
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.crud.pagination import next_cursor
+
+
+def set_page_headers(
+    response: Response, items: Sequence[Any], order_by: Sequence[ColumnElement], limit: int, skip: int = 0
+) -> None:
+    """다음 페이지 커서(X-Next-Cursor)와 skip 사용 시 Deprecation 헤더 설정"""
+    cursor = next_cursor(items, order_by, limit)
+    if cursor:
+        response.headers["X-Next-Cursor"] = cursor
+    if skip:
+        # OFFSET 방식은 하위 호환용 (깊은 페이지일수록 느리고 결과가 밀릴 수 있음)
+        response.headers["Deprecation"] = "true"
@@ -1,20 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from uuid import UUID
-from app.database import get_db
+from app.database import get_async_db, settings
 from app import crud
-from app.schemas.participant import ParticipantCreate, ParticipantUpdate, ParticipantResponse
+from app.schemas.participant import (
+    ParticipantCreate,
+    ParticipantUpdate,
+    ParticipantResponse,
+    ParticipantBulkCreate,
+    ParticipantBulkDelete,
+    ParticipantBulkResult,
+)
 
 router = APIRouter()
 
 
 @router.post("/", response_model=ParticipantResponse, status_code=status.HTTP_201_CREATED)
-def create_participant(participant: ParticipantCreate, db: Session = Depends(get_db)):
+async def create_participant(participant: ParticipantCreate, db: AsyncSession = Depends(get_async_db)):
     """새 참가자 생성"""
     # 모임 존재 확인
-    db_meeting = crud.meeting.get_meeting(db, meeting_id=participant.meeting_id)
-    if not db_meeting:
+    meeting_exists = await crud.aio.meeting.meeting_exists(db, participant.meeting_id)
+    if not meeting_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="모임을 찾을 수 없습니다."
@@ -22,34 +29,85 @@ def create_participant(participant: ParticipantCreate, db: Session = Depends(get
     
     # 사용자 존재 확인 (user_id가 있는 경우)
     if participant.user_id:
-        db_user = crud.user.get_user(db, user_id=participant.user_id)
+        db_user = await crud.aio.user.get_user(db, user_id=participant.user_id)
         if not db_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="사용자를 찾을 수 없습니다."
             )
     
-    return crud.participant.create_participant(db=db, participant=participant)
+    return await crud.aio.participant.create_participant(db, participant_create=participant)
+
+
+def _check_bulk_size(count: int) -> None:
+    """일괄 요청 항목 수 확인"""
+    if count == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="항목이 비어 있습니다."
+        )
+    if count > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.BULK_MAX_ITEMS}개까지 처리할 수 있습니다."
+        )
+
+
+@router.post("/bulk", response_model=List[ParticipantResponse], status_code=status.HTTP_201_CREATED)
+async def create_participants(bulk: ParticipantBulkCreate, db: AsyncSession = Depends(get_async_db)):
+    """한 모임에 참가자 일괄 생성"""
+    _check_bulk_size(len(bulk.participants))
+    meeting_exists = await crud.aio.meeting.meeting_exists(db, bulk.meeting_id)
+    if not meeting_exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모임을 찾을 수 없습니다."
+        )
+    
+    # 사용자 존재 확인 (user_id가 있는 항목만, IN 쿼리 한 번)
+    user_ids = {item.user_id for item in bulk.participants if item.user_id}
+    if user_ids and await crud.aio.user.count_users(db, user_ids) != len(user_ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다."
+        )
+    
+    return await crud.aio.participant.create_participants(db, bulk=bulk)
+
+
+@router.get("/batch", response_model=List[ParticipantResponse])
+async def read_participants_batch(ids: List[UUID] = Query(...), db: AsyncSession = Depends(get_async_db)):
+    """참가자 ID 목록으로 한 번에 조회 (?ids=a&ids=b, 요청 순서 유지, 없는 ID는 제외)"""
+    _check_bulk_size(len(ids))
+    return await crud.aio.participant.get_participants(db, participant_ids=ids)
+
+
+@router.post("/bulk-delete", response_model=ParticipantBulkResult)
+async def delete_participants(bulk: ParticipantBulkDelete, db: AsyncSession = Depends(get_async_db)):
+    """참가자 일괄 삭제 (시간 투표 수 차감 포함, 없는 ID는 무시, 삭제된 수 반환)"""
+    _check_bulk_size(len(bulk.ids))
+    count = await crud.aio.participant.delete_participants(db, participant_ids=bulk.ids)
+    return ParticipantBulkResult(count=count)
 
 
 @router.get("/meeting/{meeting_id}", response_model=List[ParticipantResponse])
-def read_participants_by_meeting(meeting_id: UUID, db: Session = Depends(get_db)):
+async def read_participants_by_meeting(meeting_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """모임별 참가자 목록 조회"""
-    participants = crud.participant.get_participants_by_meeting(db, meeting_id=meeting_id)
+    participants = await crud.aio.participant.get_participants_by_meeting(db, meeting_id=meeting_id)
     return participants
 
 
 @router.get("/user/{user_id}", response_model=List[ParticipantResponse])
-def read_participants_by_user(user_id: int, db: Session = Depends(get_db)):
+async def read_participants_by_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
     """사용자별 참가한 모임 목록 조회"""
-    participants = crud.participant.get_participants_by_user(db, user_id=user_id)
+    participants = await crud.aio.participant.get_participants_by_user(db, user_id=user_id)
     return participants
 
 
 @router.get("/{participant_id}", response_model=ParticipantResponse)
-def read_participant(participant_id: UUID, db: Session = Depends(get_db)):
+async def read_participant(participant_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """참가자 조회"""
-    db_participant = crud.participant.get_participant(db, participant_id=participant_id)
+    db_participant = await crud.aio.participant.get_participant(db, participant_id=participant_id)
     if db_participant is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -59,9 +117,9 @@ def read_participant(participant_id: UUID, db: Session = Depends(get_db)):
 
 
 @router.put("/{participant_id}", response_model=ParticipantResponse)
-def update_participant(participant_id: UUID, participant_update: ParticipantUpdate, db: Session = Depends(get_db)):
+async def update_participant(participant_id: UUID, participant_update: ParticipantUpdate, db: AsyncSession = Depends(get_async_db)):
     """참가자 정보 업데이트"""
-    db_participant = crud.participant.update_participant(
+    db_participant = await crud.aio.participant.update_participant(
         db, participant_id=participant_id, participant_update=participant_update
     )
     if db_participant is None:
@@ -73,9 +131,9 @@ def update_participant(participant_id: UUID, participant_update: ParticipantUpda
 
 
 @router.delete("/{participant_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_participant(participant_id: UUID, db: Session = Depends(get_db)):
+async def delete_participant(participant_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """참가자 삭제"""
-    success = crud.participant.delete_participant(db, participant_id=participant_id)
+    success = await crud.aio.participant.delete_participant(db, participant_id=participant_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
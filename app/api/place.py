@@ -1,9 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+from typing import List, Optional
+from app.database import get_db, settings
 from app import crud
-from app.schemas.place import PlaceCreate, PlaceUpdate, PlaceResponse
+from app.api.pagination import set_page_headers
+from app.schemas.place import (
+    PlaceCreate,
+    PlaceUpdate,
+    PlaceResponse,
+    PlaceBulkUpdate,
+    PlaceBulkDelete,
+    PlaceBulkResult,
+)
 
 router = APIRouter()
 
@@ -23,12 +31,76 @@ def create_place(place: PlaceCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=List[PlaceResponse])
-def read_places(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """모든 장소 목록 조회"""
-    places = crud.place.get_all_places(db, skip=skip, limit=limit)
+def read_places(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """모든 장소 목록 조회 (다음 페이지는 X-Next-Cursor 헤더 값을 cursor로 전달, skip은 deprecated)"""
+    places = crud.place.get_all_places(db, skip=skip, limit=limit, cursor=cursor)
+    set_page_headers(response, places, crud.place.PLACE_ORDER, limit, skip)
     return places
 
 
+def _check_bulk_ids(ids: List[str]) -> None:
+    """일괄 요청 항목 수와 중복 ID 확인"""
+    if not ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="항목이 비어 있습니다."
+        )
+    if len(ids) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.BULK_MAX_ITEMS}개까지 처리할 수 있습니다."
+        )
+    if len(set(ids)) != len(ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="중복된 장소 ID가 있습니다."
+        )
+
+
+@router.get("/batch", response_model=List[PlaceResponse])
+def read_places_batch(ids: List[str] = Query(...), db: Session = Depends(get_db)):
+    """장소 ID 목록으로 한 번에 조회 (?ids=a&ids=b, 요청 순서 유지, 없는 ID는 제외)"""
+    _check_bulk_ids(ids)
+    return crud.place.get_places(db, place_ids=ids)
+
+
+@router.post("/bulk", response_model=List[PlaceResponse], status_code=status.HTTP_201_CREATED)
+def create_places(places: List[PlaceCreate], db: Session = Depends(get_db)):
+    """장소 일괄 생성 (하나라도 이미 존재하면 전체 실패)"""
+    ids = [place.id for place in places]
+    _check_bulk_ids(ids)
+    existing = crud.place.get_places(db, place_ids=ids)
+    if existing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"이미 존재하는 장소입니다: {', '.join(db_place.id for db_place in existing)}"
+        )
+    
+    return crud.place.create_places(db=db, place_list=places)
+
+
+@router.patch("/bulk", response_model=PlaceBulkResult)
+def update_places(place_updates: List[PlaceBulkUpdate], db: Session = Depends(get_db)):
+    """장소 일괄 업데이트 (None인 필드는 유지, 없는 장소가 있으면 전체 404)"""
+    _check_bulk_ids([place_update.id for place_update in place_updates])
+    count = crud.place.update_places(db, place_updates=place_updates)
+    return PlaceBulkResult(count=count)
+
+
+@router.post("/bulk-delete", response_model=PlaceBulkResult)
+def delete_places(bulk: PlaceBulkDelete, db: Session = Depends(get_db)):
+    """장소 일괄 삭제 (없는 ID는 무시, 삭제된 수 반환)"""
+    _check_bulk_ids(bulk.ids)
+    count = crud.place.delete_places(db, place_ids=bulk.ids)
+    return PlaceBulkResult(count=count)
+
+
 @router.get("/{place_id}", response_model=PlaceResponse)
 def read_place(place_id: str, db: Session = Depends(get_db)):
     """장소 조회"""
@@ -1,30 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app import crud
+from app.api.versioned import MAX_WAIT_SECONDS, versioned_read
 from app.schemas.place_vote import PlaceVoteCreate, PlaceVoteUpdate, PlaceVoteResponse
 
 router = APIRouter()
 
 
 @router.post("/", response_model=PlaceVoteResponse, status_code=status.HTTP_201_CREATED)
-def create_place_vote(vote: PlaceVoteCreate, db: Session = Depends(get_db)):
+async def create_place_vote(vote: PlaceVoteCreate, db: AsyncSession = Depends(get_async_db)):
     """새 장소 투표 생성 (이미 존재하면 업데이트)"""
+    participant_meeting_id, candidate_meeting_id = await crud.aio.time_vote.get_vote_target_meeting_ids(
+        db, vote.participant_id, vote.time_candidate_id
+    )
     # 참가자 존재 확인
-    db_participant = crud.participant.get_participant(db, participant_id=vote.participant_id)
-    if not db_participant:
+    if participant_meeting_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="참가자를 찾을 수 없습니다."
         )
     
     # 시간 후보 존재 확인
-    db_candidate = crud.meeting_time_candidate.get_time_candidate(
-        db, candidate_id=vote.time_candidate_id
-    )
-    if not db_candidate:
+    if candidate_meeting_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="시간 후보를 찾을 수 없습니다."
@@ -32,15 +33,15 @@ def create_place_vote(vote: PlaceVoteCreate, db: Session = Depends(get_db)):
     
     # 모임 ID 일치 확인
     if (
-        db_participant.meeting_id != vote.meeting_id
-        or db_candidate.meeting_id != vote.meeting_id
+        participant_meeting_id != vote.meeting_id
+        or candidate_meeting_id != vote.meeting_id
     ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="참가자, 시간 후보, 모임 ID가 일치하지 않습니다."
         )
     
-    return crud.place_vote.create_place_vote(db=db, vote=vote)
+    return await crud.aio.place_vote.create_place_vote(db, vote=vote)
 
 
 @router.get("/participant/{participant_id}", response_model=List[PlaceVoteResponse])
@@ -51,10 +52,18 @@ def read_place_votes_by_participant(participant_id: UUID, db: Session = Depends(
 
 
 @router.get("/meeting/{meeting_id}", response_model=List[PlaceVoteResponse])
-def read_place_votes_by_meeting(meeting_id: UUID, db: Session = Depends(get_db)):
-    """모임별 장소 투표 목록 조회"""
-    votes = crud.place_vote.get_place_votes_by_meeting(db, meeting_id=meeting_id)
-    return votes
+async def read_place_votes_by_meeting(
+    meeting_id: UUID,
+    request: Request,
+    response: Response,
+    wait: Optional[int] = Query(None, ge=0, le=MAX_WAIT_SECONDS),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """모임별 장소 투표 목록 조회 (If-None-Match → 304, wait(초) → 롱 폴링)"""
+    return await versioned_read(
+        request, response, db, meeting_id, "place-votes", wait,
+        lambda db: crud.aio.place_vote.get_place_votes_by_meeting(db, meeting_id=meeting_id),
+    )
 
 
 @router.get("/{vote_id}", response_model=PlaceVoteResponse)
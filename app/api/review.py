@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from app.database import get_db
 from app import crud
+from app.api.pagination import set_page_headers
 from app.schemas.review import ReviewCreate, ReviewUpdate, ReviewResponse
 
 router = APIRouter()
@@ -21,12 +22,15 @@ def create_review(
 
 @router.get("/", response_model=List[ReviewResponse])
 def read_reviews(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """모든 리뷰 목록 조회"""
-    reviews = crud.review.get_all_reviews(db, skip=skip, limit=limit)
+    """모든 리뷰 목록 조회 (다음 페이지는 X-Next-Cursor 헤더 값을 cursor로 전달, skip은 deprecated)"""
+    reviews = crud.review.get_all_reviews(db, skip=skip, limit=limit, cursor=cursor)
+    set_page_headers(response, reviews, crud.review.REVIEW_ORDER, limit, skip)
     return reviews
 
 
@@ -45,24 +49,30 @@ def read_review(
 @router.get("/meeting/{meeting_id}", response_model=List[ReviewResponse])
 def read_reviews_by_meeting(
     meeting_id: UUID,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """모임별 리뷰 목록 조회"""
-    reviews = crud.review.get_reviews_by_meeting(db, meeting_id=meeting_id, skip=skip, limit=limit)
+    """모임별 리뷰 목록 조회 (다음 페이지는 X-Next-Cursor 헤더 값을 cursor로 전달, skip은 deprecated)"""
+    reviews = crud.review.get_reviews_by_meeting(db, meeting_id=meeting_id, skip=skip, limit=limit, cursor=cursor)
+    set_page_headers(response, reviews, crud.review.REVIEW_ORDER, limit, skip)
     return reviews
 
 
 @router.get("/user/{user_id}", response_model=List[ReviewResponse])
 def read_reviews_by_user(
     user_id: int,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """사용자별 리뷰 목록 조회"""
-    reviews = crud.review.get_reviews_by_user(db, user_id=user_id, skip=skip, limit=limit)
+    """사용자별 리뷰 목록 조회 (다음 페이지는 X-Next-Cursor 헤더 값을 cursor로 전달, skip은 deprecated)"""
+    reviews = crud.review.get_reviews_by_user(db, user_id=user_id, skip=skip, limit=limit, cursor=cursor)
+    set_page_headers(response, reviews, crud.review.REVIEW_ORDER, limit, skip)
     return reviews
 
 
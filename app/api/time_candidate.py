@@ -1,13 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app import crud
+from app.api.versioned import MAX_WAIT_SECONDS, versioned_read
 from app.schemas.meeting_time_candidate import (
     MeetingTimeCandidateCreate,
     MeetingTimeCandidateResponse,
+    TimeRecommendationResponse,
+    TimeWindowResponse,
+    HeatmapResponse,
 )
+from app.services.availability import find_windows, recommend_slots
+from app.services.heatmap import ENCODING_RLE, ENCODING_UINT16, build_heatmap
 
 router = APIRouter()
 
@@ -27,10 +34,144 @@ def create_time_candidate(candidate: MeetingTimeCandidateCreate, db: Session = D
 
 
 @router.get("/meeting/{meeting_id}", response_model=List[MeetingTimeCandidateResponse])
-def read_time_candidates_by_meeting(meeting_id: UUID, db: Session = Depends(get_db)):
-    """모임별 시간 후보 목록 조회"""
-    candidates = crud.meeting_time_candidate.get_time_candidates_by_meeting(db, meeting_id=meeting_id)
-    return candidates
+async def read_time_candidates_by_meeting(
+    meeting_id: UUID,
+    request: Request,
+    response: Response,
+    wait: Optional[int] = Query(None, ge=0, le=MAX_WAIT_SECONDS),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """모임별 시간 후보 목록 조회
+
+    ETag를 If-None-Match로 보내면 변경이 없을 때 304를 반환하고,
+    wait(초)를 함께 주면 변경이 생기거나 시간이 다 될 때까지 기다립니다 (롱 폴링).
+    """
+    return await versioned_read(
+        request, response, db, meeting_id, "time-candidates", wait,
+        lambda db: crud.aio.meeting_time_candidate.get_time_candidates_by_meeting(db, meeting_id=meeting_id),
+    )
+
+
+@router.get("/meeting/{meeting_id}/recommendations", response_model=TimeRecommendationResponse)
+def read_time_recommendations(
+    meeting_id: UUID,
+    top_k: int = Query(5, ge=1, le=100),
+    min_attendance: int = Query(0, ge=0),
+    required: Optional[List[UUID]] = Query(None),
+    db: Session = Depends(get_db),
+):
+    """참석 인원이 많은 순으로 시간 추천 (필수 참가자, 최소 인원 조건, 동률이면 이른 시간 우선)"""
+    db_meeting = crud.meeting.get_meeting(db, meeting_id=meeting_id)
+    if not db_meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모임을 찾을 수 없습니다."
+        )
+    
+    index = crud.time_vote.get_availability_index(db, meeting_id=meeting_id)
+    required = required or []
+    if not all(index.has_participant(participant_id) for participant_id in required):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="필수 참가자가 모임 참가자가 아닙니다."
+        )
+    
+    return TimeRecommendationResponse(
+        meeting_id=meeting_id,
+        participant_count=index.participant_count,
+        recommendations=recommend_slots(
+            index, top_k=top_k, required=required, min_attendance=min_attendance
+        ),
+    )
+
+
+@router.get("/meeting/{meeting_id}/windows", response_model=TimeWindowResponse)
+def read_time_windows(
+    meeting_id: UUID,
+    duration_minutes: int = Query(..., ge=1, le=24 * 60),
+    granularity_minutes: int = Query(30, ge=1, le=24 * 60),
+    min_attendees: int = Query(1, ge=0),
+    top_k: int = Query(5, ge=1, le=100),
+    required: Optional[List[UUID]] = Query(None),
+    db: Session = Depends(get_db),
+):
+    """duration_minutes 동안 연속으로 참석 가능한 인원이 많은 시간대 추천"""
+    if duration_minutes % granularity_minutes != 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="duration_minutes는 granularity_minutes의 배수여야 합니다."
+        )
+    
+    db_meeting = crud.meeting.get_meeting(db, meeting_id=meeting_id)
+    if not db_meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모임을 찾을 수 없습니다."
+        )
+    
+    index = crud.time_vote.get_availability_index(db, meeting_id=meeting_id)
+    required = required or []
+    if not all(index.has_participant(participant_id) for participant_id in required):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="필수 참가자가 모임 참가자가 아닙니다."
+        )
+    
+    return TimeWindowResponse(
+        meeting_id=meeting_id,
+        duration_minutes=duration_minutes,
+        granularity_minutes=granularity_minutes,
+        participant_count=index.participant_count,
+        windows=find_windows(
+            index,
+            duration_minutes=duration_minutes,
+            granularity_minutes=granularity_minutes,
+            min_attendees=min_attendees,
+            top_k=top_k,
+            required=required,
+        ),
+    )
+
+
+@router.get("/meeting/{meeting_id}/heatmap", response_model=HeatmapResponse)
+def read_time_heatmap(
+    meeting_id: UUID,
+    granularity_minutes: int = Query(60, ge=5, le=24 * 60),
+    tz_offset_minutes: int = Query(0, ge=-12 * 60, le=14 * 60),
+    encoding: str = Query(ENCODING_RLE, regex=f"^({ENCODING_RLE}|{ENCODING_UINT16})$"),
+    include_participants: bool = False,
+    db: Session = Depends(get_db),
+):
+    """날짜 × 시간대 가능 인원 히트맵 (선택적으로 참가자별 행 포함)"""
+    if (24 * 60) % granularity_minutes != 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="granularity_minutes는 하루(1440분)를 나누어 떨어지게 해야 합니다."
+        )
+    
+    db_meeting = crud.meeting.get_meeting(db, meeting_id=meeting_id)
+    if not db_meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모임을 찾을 수 없습니다."
+        )
+    
+    participant_ids, votes, slots = crud.time_vote.get_meeting_vote_inputs(db, meeting_id=meeting_id)
+    heatmap = build_heatmap(
+        participant_ids,
+        votes,
+        slots,
+        granularity_minutes=granularity_minutes,
+        tz_offset_minutes=tz_offset_minutes,
+        encoding=encoding,
+        include_participants=include_participants,
+    )
+    if heatmap is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="히트맵을 만들 모임 후보 시간이 없습니다."
+        )
+    return HeatmapResponse(meeting_id=meeting_id, **heatmap)
 
 
 @router.get("/{candidate_id}", response_model=MeetingTimeCandidateResponse)
@@ -45,6 +186,18 @@ def read_time_candidate(candidate_id: UUID, db: Session = Depends(get_db)):
     return db_candidate
 
 
+@router.post("/{candidate_id}/recount", response_model=MeetingTimeCandidateResponse)
+def recount_time_candidate(candidate_id: UUID, db: Session = Depends(get_db)):
+    """시간 후보 투표 수 전체 재집계 (증분 집계 복구용)"""
+    db_candidate = crud.meeting_time_candidate.update_vote_count(db, candidate_id=candidate_id)
+    if db_candidate is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="시간 후보를 찾을 수 없습니다."
+        )
+    return db_candidate
+
+
 @router.delete("/{candidate_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_time_candidate(candidate_id: UUID, db: Session = Depends(get_db)):
     """시간 후보 삭제"""
@@ -1,61 +1,123 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app import crud
-from app.schemas.time_vote import TimeVoteCreate, TimeVoteUpdate, TimeVoteResponse
+from app.schemas.time_vote import (
+    TimeVoteCreate,
+    TimeVoteUpdate,
+    TimeVoteResponse,
+    MeetingAvailabilityResponse,
+    VoteBulkSubmit,
+    VoteBulkResponse,
+)
+from app.services.slots import parse_slot
 
 router = APIRouter()
 
 
 @router.post("/", response_model=TimeVoteResponse, status_code=status.HTTP_201_CREATED)
-def create_time_vote(vote: TimeVoteCreate, db: Session = Depends(get_db)):
+async def create_time_vote(vote: TimeVoteCreate, db: AsyncSession = Depends(get_async_db)):
     """새 투표 생성 (이미 존재하면 업데이트)"""
+    participant_meeting_id, candidate_meeting_id = await crud.aio.time_vote.get_vote_target_meeting_ids(
+        db, vote.participant_id, vote.time_candidate_id
+    )
     # 참가자 존재 확인
-    db_participant = crud.participant.get_participant(db, participant_id=vote.participant_id)
-    if not db_participant:
+    if participant_meeting_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="참가자를 찾을 수 없습니다."
         )
     
     # 시간 후보 존재 확인
-    db_candidate = crud.meeting_time_candidate.get_time_candidate(db, candidate_id=vote.time_candidate_id)
-    if not db_candidate:
+    if candidate_meeting_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="시간 후보를 찾을 수 없습니다."
         )
     
     # 모임 ID 일치 확인
-    if db_participant.meeting_id != vote.meeting_id or db_candidate.meeting_id != vote.meeting_id:
+    if participant_meeting_id != vote.meeting_id or candidate_meeting_id != vote.meeting_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="참가자, 시간 후보, 모임 ID가 일치하지 않습니다."
         )
     
-    return crud.time_vote.create_time_vote(db=db, vote=vote)
+    return await crud.aio.time_vote.create_time_vote(db, vote=vote)
+
+
+@router.post("/bulk", response_model=VoteBulkResponse)
+async def submit_votes_bulk(submission: VoteBulkSubmit, db: AsyncSession = Depends(get_async_db)):
+    """참가자의 시간 투표(및 장소 투표)를 한 번에 생성/업데이트"""
+    if not submission.time_votes and not submission.place_votes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="투표 항목이 비어 있습니다."
+        )
+    
+    for items in (submission.time_votes, submission.place_votes):
+        candidate_ids = [item.time_candidate_id for item in items]
+        if len(candidate_ids) != len(set(candidate_ids)):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="같은 시간 후보에 대한 투표가 중복되었습니다."
+            )
+    
+    result = await crud.aio.time_vote.submit_votes(db, submission=submission)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="참가자, 시간 후보, 모임 ID가 일치하지 않습니다."
+        )
+    return result
 
 
 @router.get("/participant/{participant_id}", response_model=List[TimeVoteResponse])
-def read_time_votes_by_participant(participant_id: UUID, db: Session = Depends(get_db)):
+async def read_time_votes_by_participant(participant_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """참가자별 투표 목록 조회"""
-    votes = crud.time_vote.get_time_votes_by_participant(db, participant_id=participant_id)
+    votes = await crud.aio.time_vote.get_time_votes_by_participant(db, participant_id=participant_id)
     return votes
 
 
 @router.get("/candidate/{candidate_id}", response_model=List[TimeVoteResponse])
-def read_time_votes_by_candidate(candidate_id: UUID, db: Session = Depends(get_db)):
+async def read_time_votes_by_candidate(candidate_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """시간 후보별 투표 목록 조회"""
-    votes = crud.time_vote.get_time_votes_by_candidate(db, candidate_id=candidate_id)
+    votes = await crud.aio.time_vote.get_time_votes_by_candidate(db, candidate_id=candidate_id)
     return votes
 
 
+@router.get("/candidate/{candidate_id}/available", response_model=List[UUID])
+def read_available_participants(candidate_id: UUID, slot: str, db: Session = Depends(get_db)):
+    """시간 후보에서 특정 시간(slot, 예: 2025-11-01 02:00)에 가능한 참가자 ID 목록 조회"""
+    slot_time = parse_slot(slot)
+    if slot_time is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시간 형식이 올바르지 않습니다. (예: 2025-11-01 02:00)"
+        )
+    return crud.time_vote_slot.get_participant_ids_available_at(
+        db, candidate_id=candidate_id, slot=slot_time
+    )
+
+
+@router.get("/meeting/{meeting_id}/availability", response_model=MeetingAvailabilityResponse)
+async def read_meeting_availability(meeting_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    """모임 시간 격자(available_times) 기준 슬롯별 가능 인원과 모두 가능한 시간 조회"""
+    grid, masks = await crud.aio.time_vote.get_availability_masks(db, meeting_id=meeting_id)
+    return MeetingAvailabilityResponse(
+        slots=grid.mask_to_slots(grid.full_mask),
+        counts=grid.tally(masks.values()),
+        everyone_free=grid.everyone_free(masks.values()),
+        voter_count=len(masks),
+    )
+
+
 @router.get("/{vote_id}", response_model=TimeVoteResponse)
-def read_time_vote(vote_id: UUID, db: Session = Depends(get_db)):
+async def read_time_vote(vote_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """투표 조회"""
-    db_vote = crud.time_vote.get_time_vote(db, vote_id=vote_id)
+    db_vote = await crud.aio.time_vote.get_time_vote(db, vote_id=vote_id)
     if db_vote is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -65,9 +127,9 @@ def read_time_vote(vote_id: UUID, db: Session = Depends(get_db)):
 
 
 @router.put("/{vote_id}", response_model=TimeVoteResponse)
-def update_time_vote(vote_id: UUID, vote_update: TimeVoteUpdate, db: Session = Depends(get_db)):
+async def update_time_vote(vote_id: UUID, vote_update: TimeVoteUpdate, db: AsyncSession = Depends(get_async_db)):
     """투표 정보 업데이트"""
-    db_vote = crud.time_vote.update_time_vote(db, vote_id=vote_id, vote_update=vote_update)
+    db_vote = await crud.aio.time_vote.update_time_vote(db, vote_id=vote_id, vote_update=vote_update)
     if db_vote is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -77,9 +139,9 @@ def update_time_vote(vote_id: UUID, vote_update: TimeVoteUpdate, db: Session = D
 
 
 @router.delete("/{vote_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_time_vote(vote_id: UUID, db: Session = Depends(get_db)):
+async def delete_time_vote(vote_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """투표 삭제"""
-    success = crud.time_vote.delete_time_vote(db, vote_id=vote_id)
+    success = await crud.aio.time_vote.delete_time_vote(db, vote_id=vote_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
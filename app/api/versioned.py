@@ -0,0 +1,141 @@
+"""모임 version 기반 조건부 조회 (ETag / If-None-Match, ?wait= 롱 폴링)
+
+클라이언트가 보낸 ETag가 현재 모임 version과 같으면 집계 테이블을 읽지 않고 304를 반환합니다.
+wait를 주면 version이 바뀌거나 시간이 다 될 때까지 기다립니다.
+같은 모임을 기다리는 요청들은 모임별 감시 작업(_VersionWatch) 하나를 함께 씁니다.
+감시 작업은 같은 인스턴스의 변경(이벤트 브로커)이 오면 바로, 아니면 VERSION_POLL_SECONDS마다
+version을 한 번 조회해 모든 대기 요청을 깨우므로, 대기 요청 수와 관계없이 모임당 조회는 주기마다 한 번입니다.
+"""
+import asyncio
+import contextvars
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import UUID
+
+from fastapi import Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.database import AsyncSessionLocal, get_async_engine
+from app.services.events import get_broker
+
+VERSION_POLL_SECONDS = 1.0
+MAX_WAIT_SECONDS = 60
+
+
+async def _read_version(db: AsyncSession, meeting_id: UUID) -> Optional[int]:
+    try:
+        return await crud.aio.meeting.get_meeting_version(db, meeting_id)
+    finally:
+        # 기다리는 동안 DB 연결을 잡고 있지 않도록 트랜잭션 종료
+        await db.rollback()
+
+
+async def _read_version_once(meeting_id: UUID) -> Optional[int]:
+    """감시 작업용 version 조회 (요청 세션과 별개의 세션)"""
+    async with AsyncSessionLocal(bind=get_async_engine()) as db:
+        return await crud.aio.meeting.get_meeting_version(db, meeting_id)
+
+
+class _VersionWatch:
+    """한 모임의 version 변경을 기다리는 요청들이 함께 쓰는 감시 작업"""
+
+    def __init__(self, meeting_id: UUID, version: Optional[int]):
+        self.meeting_id = meeting_id
+        self.version = version
+        self.waiters = 0
+        self.updated = asyncio.Event()
+        # 요청 컨텍스트(복제본 읽기 여부, SQL 계측)를 물려받지 않도록 빈 컨텍스트에서 실행
+        self.task = asyncio.get_running_loop().create_task(self._run(), context=contextvars.Context())
+
+    async def _run(self) -> None:
+        broker = get_broker()
+        subscription, _, _ = broker.subscribe(str(self.meeting_id))
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(subscription.queue.get(), timeout=VERSION_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                # 한꺼번에 온 이벤트는 조회 한 번으로 처리
+                while not subscription.queue.empty():
+                    subscription.queue.get_nowait()
+                if subscription.overflowed:
+                    broker.unsubscribe(subscription)
+                    subscription, _, _ = broker.subscribe(str(self.meeting_id))
+                self.version = await _read_version_once(self.meeting_id)
+                # 조회할 때마다 대기 요청을 깨워 각자의 version과 비교하게 함
+                updated, self.updated = self.updated, asyncio.Event()
+                updated.set()
+        finally:
+            broker.unsubscribe(subscription)
+
+
+_watches: Dict[UUID, _VersionWatch] = {}
+
+
+def meeting_etag(resource: str, meeting_id: UUID, version: int) -> str:
+    return f'W/"{resource}-{meeting_id}-{version}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]
+
+
+async def wait_for_version_change(meeting_id: UUID, version: int, timeout: float) -> Optional[int]:
+    """version이 바뀔 때까지 최대 timeout초 대기 후 현재 version 반환 (모임별 감시 작업을 함께 사용)"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    watch = _watches.get(meeting_id)
+    if watch is None:
+        watch = _watches[meeting_id] = _VersionWatch(meeting_id, version)
+    watch.waiters += 1
+    try:
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return version
+            try:
+                await asyncio.wait_for(watch.updated.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return version
+            if watch.version != version:
+                return watch.version
+    finally:
+        watch.waiters -= 1
+        if not watch.waiters:
+            watch.task.cancel()
+            del _watches[meeting_id]
+
+
+async def versioned_read(
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    meeting_id: UUID,
+    resource: str,
+    wait: Optional[int],
+    loader: Callable[[AsyncSession], Awaitable[Any]],
+) -> Any:
+    """ETag 조건부 조회 - 변경이 없으면 304 Response, 있으면 loader 결과(ETag 헤더 포함)"""
+    # version을 먼저 읽으므로 그 사이 변경이 있어도 ETag는 응답 데이터보다 오래된 쪽 (다음 요청에서 다시 받음)
+    version = await _read_version(db, meeting_id)
+    if version is None:
+        # 없거나 삭제된 모임은 기존처럼 조회 결과만 반환
+        return await loader(db)
+
+    etag = meeting_etag(resource, meeting_id, version)
+    if etag_matches(request, etag):
+        if wait:
+            version = await wait_for_version_change(meeting_id, version, min(wait, MAX_WAIT_SECONDS))
+            if version is None:
+                return await loader(db)
+            etag = meeting_etag(resource, meeting_id, version)
+        if etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return await loader(db)
@@ -5,11 +5,15 @@ from app.crud import (
     participant,
     meeting_time_candidate,
     time_vote,
+    time_vote_slot,
+    vote_bulk,
     place,
     place_candidate,
     place_vote,
     review,
 )
+# 비동기 버전 (위 모듈을 사용하므로 마지막에 import)
+from app.crud import aio
 
 __all__ = [
     "user",
@@ -17,9 +21,12 @@ __all__ = [
     "participant",
     "meeting_time_candidate",
     "time_vote",
+    "time_vote_slot",
+    "vote_bulk",
     "place",
     "place_candidate",
     "place_vote",
     "review",
+    "aio",
 ]
 
@@ -0,0 +1,24 @@
+"""비동기 crud (AsyncSession용)
+
+자주 호출되는 경로(모임, 참가자, 시간 후보 목록, 투표, 로그인)만 async 버전을 둡니다.
+각 함수는 같은 이름의 동기 crud 함수를 AsyncSession.run_sync로 실행하므로
+쿼리, 잠금, 이벤트 발행, version 증가 로직은 동기 버전과 한 곳에서 관리됩니다.
+DB I/O는 asyncpg 위에서 이벤트 루프를 막지 않고 기다리며, 동시 처리 수는 스레드 풀이 아닌 DB 풀 크기로 제한됩니다.
+"""
+from app.crud.aio import (
+    user,
+    meeting,
+    participant,
+    meeting_time_candidate,
+    time_vote,
+    place_vote,
+)
+
+__all__ = [
+    "user",
+    "meeting",
+    "participant",
+    "meeting_time_candidate",
+    "time_vote",
+    "place_vote",
+]
@@ -0,0 +1,61 @@
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import meeting
+from app.crud.aio.runner import run
+from app.schemas.meeting import MeetingCreate, MeetingResponse, MeetingUpdate
+
+
+async def meeting_exists(db: AsyncSession, meeting_id: UUID) -> bool:
+    """삭제되지 않은 모임이 있는지 확인"""
+    return await run(db, lambda session: meeting.get_meeting(session, meeting_id=meeting_id) is not None)
+
+
+async def get_meeting_version(db: AsyncSession, meeting_id: UUID) -> Optional[int]:
+    """모임 version만 조회 (삭제된 모임은 None)"""
+    return await run(db, meeting.get_meeting_version, meeting_id=meeting_id)
+
+
+async def get_meeting(db: AsyncSession, meeting_id: UUID) -> Optional[MeetingResponse]:
+    """모임 ID로 조회 (삭제된 모임 제외)"""
+    return await run(db, meeting.get_meeting, meeting_id=meeting_id, response=MeetingResponse)
+
+
+async def get_meetings_by_creator(
+    db: AsyncSession, creator_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+) -> List[MeetingResponse]:
+    """생성자별 모임 목록 조회"""
+    return await run(
+        db, meeting.get_meetings_by_creator,
+        creator_id=creator_id, skip=skip, limit=limit, cursor=cursor, response=MeetingResponse,
+    )
+
+
+async def get_all_meetings(
+    db: AsyncSession, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+) -> List[MeetingResponse]:
+    """모든 모임 목록 조회"""
+    return await run(db, meeting.get_all_meetings, skip=skip, limit=limit, cursor=cursor, response=MeetingResponse)
+
+
+async def create_meeting(db: AsyncSession, meeting_create: MeetingCreate, creator_id: int) -> MeetingResponse:
+    """새 모임 생성"""
+    return await run(
+        db, meeting.create_meeting, meeting=meeting_create, creator_id=creator_id, response=MeetingResponse
+    )
+
+
+async def update_meeting(
+    db: AsyncSession, meeting_id: UUID, meeting_update: MeetingUpdate
+) -> Optional[MeetingResponse]:
+    """모임 정보 업데이트"""
+    return await run(
+        db, meeting.update_meeting, meeting_id=meeting_id, meeting_update=meeting_update, response=MeetingResponse
+    )
+
+
+async def delete_meeting(db: AsyncSession, meeting_id: UUID) -> bool:
+    """모임 소프트 삭제"""
+    return await run(db, meeting.delete_meeting, meeting_id=meeting_id)
@@ -0,0 +1,16 @@
+from typing import List
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import meeting_time_candidate
+from app.crud.aio.runner import run
+from app.schemas.meeting_time_candidate import MeetingTimeCandidateResponse
+
+
+async def get_time_candidates_by_meeting(db: AsyncSession, meeting_id: UUID) -> List[MeetingTimeCandidateResponse]:
+    """모임별 시간 후보 목록 조회"""
+    return await run(
+        db, meeting_time_candidate.get_time_candidates_by_meeting,
+        meeting_id=meeting_id, response=MeetingTimeCandidateResponse,
+    )
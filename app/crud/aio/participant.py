@@ -0,0 +1,69 @@
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import participant
+from app.crud.aio.runner import run
+from app.schemas.participant import (
+    ParticipantBulkCreate,
+    ParticipantCreate,
+    ParticipantResponse,
+    ParticipantUpdate,
+)
+
+
+async def get_participant(db: AsyncSession, participant_id: UUID) -> Optional[ParticipantResponse]:
+    """참가자 ID로 조회"""
+    return await run(db, participant.get_participant, participant_id=participant_id, response=ParticipantResponse)
+
+
+async def get_participants(db: AsyncSession, participant_ids: List[UUID]) -> List[ParticipantResponse]:
+    """참가자 ID 목록으로 조회 (요청 순서 유지, 없는 ID는 제외)"""
+    return await run(
+        db, participant.get_participants, participant_ids=participant_ids, response=ParticipantResponse
+    )
+
+
+async def get_participants_by_meeting(db: AsyncSession, meeting_id: UUID) -> List[ParticipantResponse]:
+    """모임별 참가자 목록 조회"""
+    return await run(
+        db, participant.get_participants_by_meeting, meeting_id=meeting_id, response=ParticipantResponse
+    )
+
+
+async def get_participants_by_user(db: AsyncSession, user_id: int) -> List[ParticipantResponse]:
+    """사용자별 참가자 목록 조회"""
+    return await run(db, participant.get_participants_by_user, user_id=user_id, response=ParticipantResponse)
+
+
+async def create_participant(db: AsyncSession, participant_create: ParticipantCreate) -> ParticipantResponse:
+    """새 참가자 생성"""
+    return await run(
+        db, participant.create_participant, participant=participant_create, response=ParticipantResponse
+    )
+
+
+async def create_participants(db: AsyncSession, bulk: ParticipantBulkCreate) -> List[ParticipantResponse]:
+    """한 모임에 참가자 일괄 생성"""
+    return await run(db, participant.create_participants, bulk=bulk, response=ParticipantResponse)
+
+
+async def update_participant(
+    db: AsyncSession, participant_id: UUID, participant_update: ParticipantUpdate
+) -> Optional[ParticipantResponse]:
+    """참가자 정보 업데이트"""
+    return await run(
+        db, participant.update_participant,
+        participant_id=participant_id, participant_update=participant_update, response=ParticipantResponse,
+    )
+
+
+async def delete_participant(db: AsyncSession, participant_id: UUID) -> bool:
+    """참가자 삭제 (시간 투표 수 차감 포함)"""
+    return await run(db, participant.delete_participant, participant_id=participant_id)
+
+
+async def delete_participants(db: AsyncSession, participant_ids: List[UUID]) -> int:
+    """참가자 일괄 삭제, 삭제된 수 반환"""
+    return await run(db, participant.delete_participants, participant_ids=participant_ids)
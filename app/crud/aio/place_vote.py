@@ -0,0 +1,18 @@
+from typing import List
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import place_vote
+from app.crud.aio.runner import run
+from app.schemas.place_vote import PlaceVoteCreate, PlaceVoteResponse
+
+
+async def create_place_vote(db: AsyncSession, vote: PlaceVoteCreate) -> PlaceVoteResponse:
+    """새 장소 투표 생성 (이미 존재하면 업데이트)"""
+    return await run(db, place_vote.create_place_vote, vote=vote, response=PlaceVoteResponse)
+
+
+async def get_place_votes_by_meeting(db: AsyncSession, meeting_id: UUID) -> List[PlaceVoteResponse]:
+    """모임별 장소 투표 목록 조회"""
+    return await run(db, place_vote.get_place_votes_by_meeting, meeting_id=meeting_id, response=PlaceVoteResponse)
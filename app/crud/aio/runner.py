@@ -0,0 +1,28 @@
+from typing import Any, Callable, Optional, Type
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def run(
+    db: AsyncSession,
+    func: Callable[..., Any],
+    *args: Any,
+    response: Optional[Type[BaseModel]] = None,
+    **kwargs: Any,
+) -> Any:
+    """동기 crud 함수를 AsyncSession에서 실행
+
+    response를 주면 결과(단건 또는 목록)를 run_sync 안에서 응답 스키마로 변환합니다.
+    run_sync 밖에서 ORM 객체의 관계에 접근하면 lazy load가 greenlet 밖에서 일어나 실패하므로,
+    관계를 포함하는 응답은 반드시 response로 변환해서 받으세요.
+    """
+    def call(session):
+        result = func(session, *args, **kwargs)
+        if response is None or result is None:
+            return result
+        if isinstance(result, list):
+            return [response.from_orm(item) for item in result]
+        return response.from_orm(result)
+
+    return await db.run_sync(call)
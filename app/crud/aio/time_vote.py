@@ -0,0 +1,79 @@
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import meeting_time_candidate, participant, time_vote, vote_bulk
+from app.crud.aio.runner import run
+from app.schemas.place_vote import PlaceVoteResponse
+from app.schemas.time_vote import TimeVoteCreate, TimeVoteResponse, TimeVoteUpdate, VoteBulkResponse, VoteBulkSubmit
+from app.services.bitmap import SlotGrid
+
+
+async def get_vote_target_meeting_ids(
+    db: AsyncSession, participant_id: UUID, time_candidate_id: UUID
+) -> Tuple[Optional[UUID], Optional[UUID]]:
+    """투표 대상 확인용: (참가자의 모임 ID, 시간 후보의 모임 ID), 없으면 각각 None"""
+    def load(session) -> Tuple[Optional[UUID], Optional[UUID]]:
+        db_participant = participant.get_participant(session, participant_id=participant_id)
+        db_candidate = meeting_time_candidate.get_time_candidate(session, candidate_id=time_candidate_id)
+        return (
+            db_participant.meeting_id if db_participant else None,
+            db_candidate.meeting_id if db_candidate else None,
+        )
+
+    return await run(db, load)
+
+
+async def get_time_vote(db: AsyncSession, vote_id: UUID) -> Optional[TimeVoteResponse]:
+    """투표 ID로 조회"""
+    return await run(db, time_vote.get_time_vote, vote_id=vote_id, response=TimeVoteResponse)
+
+
+async def get_time_votes_by_participant(db: AsyncSession, participant_id: UUID) -> List[TimeVoteResponse]:
+    """참가자별 투표 목록 조회"""
+    return await run(
+        db, time_vote.get_time_votes_by_participant, participant_id=participant_id, response=TimeVoteResponse
+    )
+
+
+async def get_time_votes_by_candidate(db: AsyncSession, candidate_id: UUID) -> List[TimeVoteResponse]:
+    """시간 후보별 투표 목록 조회"""
+    return await run(db, time_vote.get_time_votes_by_candidate, candidate_id=candidate_id, response=TimeVoteResponse)
+
+
+async def get_availability_masks(db: AsyncSession, meeting_id: UUID) -> Tuple[SlotGrid, Dict[UUID, int]]:
+    """모임 시간 격자와 참가자별 가능 시간 비트마스크"""
+    return await run(db, time_vote.get_availability_masks, meeting_id=meeting_id)
+
+
+async def create_time_vote(db: AsyncSession, vote: TimeVoteCreate) -> TimeVoteResponse:
+    """새 투표 생성 (이미 존재하면 업데이트)"""
+    return await run(db, time_vote.create_time_vote, vote=vote, response=TimeVoteResponse)
+
+
+async def submit_votes(db: AsyncSession, submission: VoteBulkSubmit) -> Optional[VoteBulkResponse]:
+    """시간/장소 투표 일괄 생성/업데이트 (참가자, 시간 후보, 모임 ID가 맞지 않으면 None)"""
+    def submit(session) -> Optional[VoteBulkResponse]:
+        result = vote_bulk.submit_votes(session, submission=submission)
+        if result is None:
+            return None
+        time_votes, place_votes = result
+        return VoteBulkResponse(
+            time_votes=[TimeVoteResponse.from_orm(vote) for vote in time_votes],
+            place_votes=[PlaceVoteResponse.from_orm(vote) for vote in place_votes],
+        )
+
+    return await run(db, submit)
+
+
+async def update_time_vote(db: AsyncSession, vote_id: UUID, vote_update: TimeVoteUpdate) -> Optional[TimeVoteResponse]:
+    """투표 정보 업데이트"""
+    return await run(
+        db, time_vote.update_time_vote, vote_id=vote_id, vote_update=vote_update, response=TimeVoteResponse
+    )
+
+
+async def delete_time_vote(db: AsyncSession, vote_id: UUID) -> bool:
+    """투표 삭제"""
+    return await run(db, time_vote.delete_time_vote, vote_id=vote_id)
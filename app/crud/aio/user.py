@@ -0,0 +1,34 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import user
+from app.crud.aio.runner import run
+from app.schemas.user import UserCreate, UserResponse, UserUpdate
+
+
+async def get_user(db: AsyncSession, user_id: int) -> Optional[UserResponse]:
+    """사용자 ID로 조회"""
+    return await run(db, user.get_user, user_id=user_id, response=UserResponse)
+
+
+async def get_user_by_oauth(db: AsyncSession, oauth_provider: str, oauth_id: str) -> Optional[UserResponse]:
+    """OAuth 정보로 사용자 조회"""
+    return await run(
+        db, user.get_user_by_oauth, oauth_provider=oauth_provider, oauth_id=oauth_id, response=UserResponse
+    )
+
+
+async def count_users(db: AsyncSession, user_ids) -> int:
+    """사용자 ID 목록 중 존재하는 사용자 수 (IN 쿼리 한 번)"""
+    return await run(db, lambda session: len(user.get_users(session, user_ids=list(user_ids))))
+
+
+async def create_user(db: AsyncSession, user_create: UserCreate) -> UserResponse:
+    """새 사용자 생성"""
+    return await run(db, user.create_user, user=user_create, response=UserResponse)
+
+
+async def update_user(db: AsyncSession, user_id: int, user_update: UserUpdate) -> Optional[UserResponse]:
+    """사용자 정보 업데이트"""
+    return await run(db, user.update_user, user_id=user_id, user_update=user_update, response=UserResponse)
@@ -0,0 +1,119 @@
+"""모델 공통 CRUD (단건 + 여러 건)
+
+각 crud 모듈은 모델별 CRUDBase 인스턴스를 만들어 기본 조회/생성/수정/삭제를 위임하고,
+이벤트 발행이나 집계 보정처럼 모델마다 다른 부분만 직접 구현합니다.
+
+여러 건 처리는 건수와 관계없이 문장 하나로 보냅니다.
+- get_many: WHERE id IN (...)
+- create_many: 여러 행 INSERT ... RETURNING (insertmanyvalues)
+- update_many: 기본 키별 UPDATE 하나를 executemany
+- delete_many: WHERE id IN (...) (소프트 삭제 모델은 deleted_at UPDATE)
+"""
+from datetime import datetime
+from typing import Any, Dict, Generic, Iterable, List, Optional, Sequence, Type, TypeVar, Union
+
+from pydantic import BaseModel
+from sqlalchemy import delete, insert, inspect, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.crud.writes import changed_fields, insert_returning, update_returning
+from app.models.soft_delete import SoftDeleteMixin
+
+ModelT = TypeVar("ModelT")
+
+Values = Union[BaseModel, Dict[str, Any]]
+
+
+class RowNotFoundError(LookupError):
+    """여러 건 수정 대상 중 없는(또는 삭제된) 행이 있음"""
+
+
+def _values(data: Values, partial: bool = False) -> Dict[str, Any]:
+    if isinstance(data, BaseModel):
+        return changed_fields(data) if partial else data.dict()
+    return dict(data)
+
+
+class CRUDBase(Generic[ModelT]):
+    """모델 하나에 대한 기본 CRUD (쓰기 메서드는 commit하지 않음, commit은 호출한 crud 함수에서)"""
+
+    def __init__(self, model: Type[ModelT], options: Sequence[Any] = ()):
+        self.model = model
+        # 테이블 Column이 아닌 ORM 속성을 써야 소프트 삭제 조건 등 ORM 옵션이 적용됨
+        self.primary_key = getattr(model, inspect(model).primary_key[0].key)
+        self.options = tuple(options)  # 조회 시 기본 로더 옵션 (예: joinedload(Meeting.creator))
+        self.soft_delete = issubclass(model, SoftDeleteMixin)
+
+    def _select(self):
+        return select(self.model).options(*self.options)
+
+    def get(self, db: Session, id: Any) -> Optional[ModelT]:
+        return db.scalars(self._select().where(self.primary_key == id)).first()
+
+    def get_many(self, db: Session, ids: Iterable[Any], options: Sequence[Any] = ()) -> List[ModelT]:
+        """id 목록을 IN 쿼리 한 번으로 조회 (요청 순서 유지, 없는 id는 제외, options는 추가 로더 옵션)"""
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+        stmt = self._select().options(*options).where(self.primary_key.in_(ids))
+        found = {getattr(db_object, self.primary_key.key): db_object for db_object in db.scalars(stmt).unique()}
+        return [found[id] for id in ids if id in found]
+
+    def create(self, db: Session, data: Values) -> ModelT:
+        return insert_returning(db, self.model, _values(data))
+
+    def create_many(self, db: Session, rows: Sequence[Values]) -> List[ModelT]:
+        """여러 행을 INSERT ... RETURNING 한 문장으로 생성 (입력 순서대로 반환)"""
+        if not rows:
+            return []
+        return list(db.scalars(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True),
+            [_values(row) for row in rows],
+            execution_options={"populate_existing": True},
+        ))
+
+    def update(
+        self, db: Session, id: Any, data: Values, joined: Optional[InstrumentedAttribute] = None
+    ) -> Optional[ModelT]:
+        """부분 업데이트 (스키마면 None이 아닌 필드만, UPDATE ... RETURNING 한 번)"""
+        return update_returning(db, self.model, [self.primary_key == id], _values(data, partial=True), joined)
+
+    def update_many(self, db: Session, rows: Sequence[Values]) -> int:
+        """기본 키가 포함된 행 목록으로 여러 건 부분 업데이트 (UPDATE 한 문장을 executemany)
+
+        스키마의 None 필드는 바꾸지 않습니다. 바꿀 필드 구성이 같은 행끼리 한 문장으로 묶입니다.
+        대상 중 하나라도 없으면 rollback하고 RowNotFoundError를 발생시킵니다.
+        """
+        params = [_values(row, partial=True) for row in rows]
+        params = [row for row in params if len(row) > 1]
+        if not params:
+            return 0
+        if self.soft_delete:
+            # 기본 키별 executemany에는 소프트 삭제 조건이 붙지 않으므로 삭제되지 않은 대상인지 먼저 잠가서 확인
+            ids = {row[self.primary_key.key] for row in params}
+            locked = db.scalars(select(self.primary_key).where(self.primary_key.in_(ids)).with_for_update()).all()
+            if len(locked) != len(ids):
+                db.rollback()
+                raise RowNotFoundError("수정할 대상을 찾을 수 없습니다.")
+        try:
+            db.execute(update(self.model), params, execution_options={"synchronize_session": False})
+        except StaleDataError as error:
+            db.rollback()
+            raise RowNotFoundError("수정할 대상을 찾을 수 없습니다.") from error
+        return len(params)
+
+    def delete(self, db: Session, id: Any) -> bool:
+        return self.delete_many(db, [id]) > 0
+
+    def delete_many(self, db: Session, ids: Iterable[Any]) -> int:
+        """id 목록을 한 문장으로 삭제 (소프트 삭제 모델은 deleted_at 설정), 삭제된 행 수 반환"""
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return 0
+        if self.soft_delete:
+            stmt = update(self.model).where(self.primary_key.in_(ids)).values(deleted_at=datetime.utcnow())
+        else:
+            stmt = delete(self.model).where(self.primary_key.in_(ids))
+        return db.execute(stmt, execution_options={"synchronize_session": False}).rowcount
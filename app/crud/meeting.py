@@ -1,124 +1,210 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import case, event, func, update
+from sqlalchemy.orm import Session, joinedload, selectinload
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
+from app.database import settings
+from app.db_routing import read_from_primary
 from app.models.meeting import Meeting, LocationChoiceType
-from app.schemas.meeting import MeetingCreate, MeetingUpdate
+from app.models.soft_delete import INCLUDE_DELETED
+from app.schemas.meeting import MeetingCreate, MeetingUpdate, MeetingResponse
+from app.services.cache import TTLCache
+from app.crud.pagination import paginate
+from app.crud.base import CRUDBase
+from app.crud.writes import changed_fields, update_returning
+from app.services.events import PENDING_EVENTS_KEY
 
+# 목록 정렬 키 (커서 페이지네이션, ix_meeting_active_*created_at_id 부분 인덱스와 같은 순서)
+MEETING_ORDER = (Meeting.created_at, Meeting.id)
 
-def get_meeting(db: Session, meeting_id: UUID) -> Optional[Meeting]:
-    """모임 ID로 조회 (삭제되지 않은 모임만)"""
-    return db.query(Meeting).filter(
-        Meeting.id == meeting_id,
-        Meeting.deleted_at.is_(None)
+meetings = CRUDBase(Meeting, options=[joinedload(Meeting.creator)])
+
+# 공유 코드 → 모임 응답 캐시 (초대 링크 조회용, 없는 코드도 None으로 캐시)
+share_code_cache = TTLCache(maxsize=settings.SHARE_CODE_CACHE_SIZE, ttl=settings.SHARE_CODE_CACHE_TTL)
+
+
+def get_meeting(db: Session, meeting_id: UUID, include_deleted: bool = False) -> Optional[Meeting]:
+    """모임 ID로 조회 (삭제된 모임 제외, 관리자 조회는 include_deleted=True)"""
+    return db.query(Meeting).options(
+        joinedload(Meeting.creator)
+    ).filter(
+        Meeting.id == meeting_id
+    ).execution_options(**{INCLUDE_DELETED: include_deleted}).first()
+
+
+def get_meetings(db: Session, meeting_ids: List[UUID]) -> List[Meeting]:
+    """모임 ID 목록으로 조회 (IN 쿼리 한 번, 삭제된 모임과 없는 ID는 제외)"""
+    return meetings.get_many(db, meeting_ids)
+
+
+def get_meeting_dashboard(db: Session, meeting_id: UUID) -> Optional[dict]:
+    """모임 화면에 필요한 데이터를 모임 크기와 관계없이 고정된 쿼리 수(6개)로 조회
+
+    1. 모임 + 생성자 (JOIN)
+    2. 참가자 (selectin)
+    3. 시간 후보 (selectin)
+    4. 시간 투표 (selectin)
+    5. 장소 후보
+    6. 시간 후보별 장소 투표 집계 (GROUP BY)
+    """
+    from app.models.meeting_time_candidate import MeetingTimeCandidate
+    from app.models.place_candidate import PlaceCandidate
+    from app.models.place_vote import PlaceVote
+    
+    db_meeting = db.query(Meeting).options(
+        joinedload(Meeting.creator),
+        selectinload(Meeting.participants),
+        selectinload(Meeting.time_candidates).selectinload(MeetingTimeCandidate.votes),
+    ).filter(
+        Meeting.id == meeting_id
     ).first()
+    if not db_meeting:
+        return None
+    
+    place_candidates = db.query(PlaceCandidate).filter(PlaceCandidate.meeting_id == meeting_id).all()
+    place_vote_tallies = db.query(
+        PlaceVote.time_candidate_id,
+        func.count(case((PlaceVote.is_available == True, 1))).label("available_count"),
+        func.count(case((PlaceVote.is_available == False, 1))).label("unavailable_count"),
+    ).filter(
+        PlaceVote.meeting_id == meeting_id
+    ).group_by(PlaceVote.time_candidate_id).all()
+    
+    return {
+        "meeting": db_meeting,
+        "participants": db_meeting.participants,
+        "time_candidates": sorted(db_meeting.time_candidates, key=lambda candidate: candidate.created_at or datetime.min),
+        "place_candidates": place_candidates,
+        "place_vote_tallies": [row._asdict() for row in place_vote_tallies],
+    }
+
+
+def get_meeting_version(db: Session, meeting_id: UUID) -> Optional[int]:
+    """모임 version만 조회 (기본 키 조회 한 번, 삭제된 모임은 None)"""
+    return db.query(Meeting.version).filter(
+        Meeting.id == meeting_id
+    ).scalar()
 
 
-def get_meetings_by_creator(db: Session, creator_id: int, skip: int = 0, limit: int = 100) -> List[Meeting]:
-    """생성자별 모임 목록 조회 (삭제되지 않은 모임만)"""
-    return db.query(Meeting).filter(
-        Meeting.creator_id == creator_id,
-        Meeting.deleted_at.is_(None)
-    ).offset(skip).limit(limit).all()
+@event.listens_for(Session, "before_commit")
+def _bump_meeting_versions(session: Session) -> None:
+    """commit 직전, 이번 트랜잭션에서 변경 이벤트를 남긴 모임의 version을 한 번에 증가
 
+    updated_at은 모임 자체의 수정 시각이므로 onupdate로 바뀌지 않게 그대로 둠
+    """
+    meeting_ids = {meeting_id for meeting_id, _, _ in session.info.get(PENDING_EVENTS_KEY, [])}
+    if meeting_ids:
+        session.execute(
+            update(Meeting).where(Meeting.id.in_(meeting_ids)).values(
+                version=Meeting.version + 1, updated_at=Meeting.updated_at
+            ),
+            execution_options={"synchronize_session": False},
+        )
 
-def get_all_meetings(db: Session, skip: int = 0, limit: int = 100) -> List[Meeting]:
-    """모든 모임 목록 조회 (삭제되지 않은 모임만)"""
-    return db.query(Meeting).filter(
-        Meeting.deleted_at.is_(None)
-    ).offset(skip).limit(limit).all()
+
+def get_meetings_by_creator(
+    db: Session, creator_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+) -> List[Meeting]:
+    """생성자별 모임 목록 조회 (삭제된 모임 제외, (created_at, id) 순, cursor 우선)"""
+    query = db.query(Meeting).options(
+        joinedload(Meeting.creator)
+    ).filter(
+        Meeting.creator_id == creator_id
+    )
+    return paginate(query, MEETING_ORDER, limit, cursor=cursor, skip=skip).all()
+
+
+def get_all_meetings(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[Meeting]:
+    """모든 모임 목록 조회 (삭제된 모임 제외, (created_at, id) 순, cursor 우선)"""
+    query = db.query(Meeting).options(
+        joinedload(Meeting.creator)
+    )
+    return paginate(query, MEETING_ORDER, limit, cursor=cursor, skip=skip).all()
 
 
 def get_meeting_by_share_code(db: Session, share_code: str) -> Optional[Meeting]:
-    """공유 코드로 모임 조회 (삭제되지 않은 모임만)"""
-    return db.query(Meeting).filter(
-        Meeting.share_code == share_code,
-        Meeting.deleted_at.is_(None)
+    """공유 코드로 모임 조회 (삭제된 모임 제외)"""
+    return db.query(Meeting).options(
+        joinedload(Meeting.creator)
+    ).filter(
+        Meeting.share_code == share_code
     ).first()
 
 
-def create_meeting(db: Session, meeting: MeetingCreate, creator_id: int) -> Meeting:
-    """새 모임 생성"""
-    # location_choice_type 문자열을 Enum으로 변환
-    location_choice_type_enum = None
-    if meeting.location_choice_type:
-        try:
-            location_choice_type_enum = LocationChoiceType(meeting.location_choice_type)
-        except ValueError:
-            # 유효하지 않은 값인 경우 None으로 설정
-            location_choice_type_enum = None
+def get_meeting_response_by_share_code(db: Session, share_code: str) -> Optional[MeetingResponse]:
+    """공유 코드로 모임 응답 조회 (캐시, 같은 코드의 동시 미스는 쿼리 한 번으로 처리)
+
+    캐시를 채우는 조회는 primary에서 읽습니다. 복제본의 지연된 값이 캐시되면
+    수정/삭제 때의 무효화가 되돌려져 TTL 동안 쓰기 결과가 보이지 않기 때문입니다.
+    """
+    def load() -> Optional[MeetingResponse]:
+        with read_from_primary():
+            db_meeting = get_meeting_by_share_code(db, share_code)
+        return MeetingResponse.from_orm(db_meeting) if db_meeting else None
     
-    db_meeting = Meeting(
-        name=meeting.name,
-        purpose=meeting.purpose,
-        creator_id=creator_id,
-        is_one_place=meeting.is_one_place,
-        location_choice_type=location_choice_type_enum,
-        location_choice_value=meeting.location_choice_value,
-        preference_place=meeting.preference_place,
-        deadline=meeting.deadline,
-        expected_participant_count=meeting.expected_participant_count,
-        share_code=meeting.share_code,
-        status=meeting.status,
-        available_times=meeting.available_times,
-    )
-    db.add(db_meeting)
+    return share_code_cache.get_or_load(share_code, load)
+
+
+def _location_choice_type(value: Optional[str]) -> Optional[LocationChoiceType]:
+    """location_choice_type 문자열을 Enum으로 변환 (유효하지 않은 값은 None)"""
+    if not value:
+        return None
+    try:
+        return LocationChoiceType(value)
+    except ValueError:
+        return None
+
+
+def create_meeting(db: Session, meeting: MeetingCreate, creator_id: int) -> Meeting:
+    """새 모임 생성 (INSERT ... RETURNING 한 번)"""
+    db_meeting = meetings.create(db, {
+        "name": meeting.name,
+        "purpose": meeting.purpose,
+        "creator_id": creator_id,
+        "is_one_place": meeting.is_one_place,
+        "location_choice_type": _location_choice_type(meeting.location_choice_type),
+        "location_choice_value": meeting.location_choice_value,
+        "preference_place": meeting.preference_place,
+        "deadline": meeting.deadline,
+        "expected_participant_count": meeting.expected_participant_count,
+        "share_code": meeting.share_code,
+        "status": meeting.status,
+        "available_times": meeting.available_times,
+    })
     db.commit()
-    db.refresh(db_meeting)
+    if db_meeting.share_code:
+        # 생성 전에 "없음"으로 캐시된 코드 제거
+        share_code_cache.invalidate(db_meeting.share_code)
     return db_meeting
 
 
 def update_meeting(db: Session, meeting_id: UUID, meeting_update: MeetingUpdate) -> Optional[Meeting]:
-    """모임 정보 업데이트"""
-    db_meeting = get_meeting(db, meeting_id)
+    """모임 정보 업데이트 (UPDATE ... RETURNING 한 번, 생성자도 함께 조회)"""
+    values = changed_fields(meeting_update, location_choice_type=_location_choice_type)
+    db_meeting = update_returning(db, Meeting, [Meeting.id == meeting_id], values, joined=Meeting.creator)
     if not db_meeting:
         return None
     
-    if meeting_update.name is not None:
-        db_meeting.name = meeting_update.name
-    if meeting_update.purpose is not None:
-        db_meeting.purpose = meeting_update.purpose
-    if meeting_update.is_one_place is not None:
-        db_meeting.is_one_place = meeting_update.is_one_place
-    if meeting_update.location_choice_type is not None:
-        try:
-            db_meeting.location_choice_type = LocationChoiceType(meeting_update.location_choice_type)
-        except ValueError:
-            # 유효하지 않은 값인 경우 None으로 설정
-            db_meeting.location_choice_type = None
-    if meeting_update.location_choice_value is not None:
-        db_meeting.location_choice_value = meeting_update.location_choice_value
-    if meeting_update.preference_place is not None:
-        db_meeting.preference_place = meeting_update.preference_place
-    if meeting_update.deadline is not None:
-        db_meeting.deadline = meeting_update.deadline
-    if meeting_update.expected_participant_count is not None:
-        db_meeting.expected_participant_count = meeting_update.expected_participant_count
-    if meeting_update.status is not None:
-        db_meeting.status = meeting_update.status
     if meeting_update.available_times is not None:
-        db_meeting.available_times = meeting_update.available_times
-    if meeting_update.confirmed_time is not None:
-        db_meeting.confirmed_time = meeting_update.confirmed_time
-    if meeting_update.confirmed_location is not None:
-        db_meeting.confirmed_location = meeting_update.confirmed_location
-    if meeting_update.confirmed_at is not None:
-        db_meeting.confirmed_at = meeting_update.confirmed_at
+        # 시간 격자가 바뀌면 투표 비트맵도 다시 계산
+        from app.crud.time_vote import reencode_meeting_availability
+        reencode_meeting_availability(db, meeting_id, meeting_update.available_times)
     
     db.commit()
-    db.refresh(db_meeting)
+    # commit 후 무효화 (그 사이 시작된 캐시 로드 결과도 저장되지 않음)
+    if db_meeting.share_code:
+        share_code_cache.invalidate(db_meeting.share_code)
     return db_meeting
 
 
 def delete_meeting(db: Session, meeting_id: UUID) -> bool:
-    """모임 소프트 삭제"""
-    db_meeting = get_meeting(db, meeting_id)
+    """모임 소프트 삭제 (UPDATE ... RETURNING 한 번)"""
+    db_meeting = update_returning(db, Meeting, [Meeting.id == meeting_id], {"deleted_at": datetime.utcnow()})
     if not db_meeting:
         return False
     
-    # 소프트 삭제: deleted_at에 현재 시간 설정
-    from datetime import datetime
-    db_meeting.deleted_at = datetime.utcnow()
     db.commit()
-    db.refresh(db_meeting)
+    if db_meeting.share_code:
+        share_code_cache.invalidate(db_meeting.share_code)
     return True
 
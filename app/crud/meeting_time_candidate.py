@@ -1,31 +1,47 @@
+from sqlalchemy import distinct, func
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
+from datetime import datetime
+from app.database import settings
 from app.models.meeting_time_candidate import MeetingTimeCandidate
 from app.schemas.meeting_time_candidate import MeetingTimeCandidateCreate
+from app.crud.base import CRUDBase
+from app.services.events import queue_event
+from app.services.slots import parse_slot, parse_slots
+
+time_candidates = CRUDBase(MeetingTimeCandidate)
 
 
 def get_time_candidate(db: Session, candidate_id: UUID) -> Optional[MeetingTimeCandidate]:
     """시간 후보 ID로 조회"""
-    return db.query(MeetingTimeCandidate).filter(MeetingTimeCandidate.id == candidate_id).first()
+    return time_candidates.get(db, candidate_id)
 
 
 def get_time_candidates_by_meeting(db: Session, meeting_id: UUID) -> List[MeetingTimeCandidate]:
-    """모임별 시간 후보 목록 조회"""
+    """모임별 시간 후보 목록 조회 (생성 순, candidate_time은 JSON이라 정렬할 수 없음)"""
     return db.query(MeetingTimeCandidate).filter(
         MeetingTimeCandidate.meeting_id == meeting_id
-    ).order_by(MeetingTimeCandidate.candidate_time).all()
+    ).order_by(MeetingTimeCandidate.created_at, MeetingTimeCandidate.id).all()
+
+
+def queue_time_candidate_event(db: Session, db_candidate: MeetingTimeCandidate, action: str) -> None:
+    """commit 후 모임 구독자에게 보낼 시간 후보 이벤트 등록 (현재 시간별 투표 수 포함)"""
+    queue_event(db, db_candidate.meeting_id, "time_candidate", {
+        "action": action,
+        "time_candidate_id": db_candidate.id,
+        "counts": dict(db_candidate.candidate_time or {}),
+    })
 
 
 def create_time_candidate(db: Session, candidate: MeetingTimeCandidateCreate) -> MeetingTimeCandidate:
-    """새 시간 후보 생성"""
-    db_candidate = MeetingTimeCandidate(
-        meeting_id=candidate.meeting_id,
-        candidate_time=candidate.candidate_time,
-    )
-    db.add(db_candidate)
+    """새 시간 후보 생성 (INSERT ... RETURNING 한 번)"""
+    db_candidate = time_candidates.create(db, {
+        "meeting_id": candidate.meeting_id,
+        "candidate_time": candidate.candidate_time,
+    })
+    queue_time_candidate_event(db, db_candidate, "create")
     db.commit()
-    db.refresh(db_candidate)
     return db_candidate
 
 
@@ -35,37 +51,119 @@ def delete_time_candidate(db: Session, candidate_id: UUID) -> bool:
     if not db_candidate:
         return False
     
+    queue_time_candidate_event(db, db_candidate, "delete")
     db.delete(db_candidate)
     db.commit()
     return True
 
 
-def update_vote_count(db: Session, candidate_id: UUID) -> Optional[MeetingTimeCandidate]:
-    """투표 수 업데이트 (투표 생성/삭제 시 호출) - candidate_time JSON 업데이트"""
-    from app.models.time_vote import TimeVote
-    from sqlalchemy import func
+def lock_time_candidate(db: Session, candidate_id: UUID) -> Optional[MeetingTimeCandidate]:
+    """시간 후보 행 잠금 조회 (SELECT ... FOR UPDATE, 투표 수 증감을 트랜잭션 안에서 직렬화)"""
+    return db.query(MeetingTimeCandidate).filter(
+        MeetingTimeCandidate.id == candidate_id
+    ).populate_existing().with_for_update().first()
+
+
+def lock_time_candidates(db: Session, candidate_ids: Iterable[UUID]) -> List[MeetingTimeCandidate]:
+    """여러 시간 후보 행을 한 번의 쿼리로 잠금 (id 순서로 잠가 교착 방지)"""
+    candidate_ids = set(candidate_ids)
+    if not candidate_ids:
+        return []
+    return db.query(MeetingTimeCandidate).filter(
+        MeetingTimeCandidate.id.in_(candidate_ids)
+    ).order_by(MeetingTimeCandidate.id).populate_existing().with_for_update().all()
+
+
+def voted_slots(time_list: Optional[Iterable[str]], is_available: bool) -> Set[str]:
+    """투표가 집계에 기여하는 시간 집합 (불가능 투표는 기여하지 않음)"""
+    return set(time_list or []) if is_available else set()
+
+
+def apply_vote_delta(
+    db_candidate: MeetingTimeCandidate, old_slots: Set[str], new_slots: Set[str]
+) -> Dict[str, int]:
+    """바뀐 시간의 투표 수만 +1/-1 반영 (commit은 호출하는 쪽에서, 잠금 후 호출)
+
+    시간은 parse_slots 기준(같은 시각의 다른 표기는 같은 시간)으로 비교하므로 재집계(tally_candidate_time)와 결과가 같습니다.
+    """
+    candidate_time = dict(db_candidate.candidate_time or {})
+    old_times, new_times = parse_slots(old_slots), parse_slots(new_slots)
+    added, removed = new_times - old_times, old_times - new_times
+    delta = {}
+    for time_string in candidate_time:
+        slot = parse_slot(time_string)
+        if slot in added:
+            delta[time_string] = 1
+        elif slot in removed:
+            delta[time_string] = -1
     
+    if delta:
+        for time_string, change in delta.items():
+            candidate_time[time_string] = max(0, candidate_time[time_string] + change)
+        # JSON 컬럼은 변경 추적이 안 되므로 새 dict를 할당
+        db_candidate.candidate_time = candidate_time
+    return delta
+
+
+def count_votes_by_slot(db: Session, candidate_id: UUID) -> Dict[datetime, int]:
+    """시각별 가능 투표 수 집계 (unnest + GROUP BY 단일 쿼리, 같은 시각의 다른 표기는 투표당 한 번)"""
+    from app.models.time_vote import TimeVote
+
+    slots = db.query(
+        TimeVote.id.label("vote_id"),
+        func.unnest(TimeVote.time_list).label("slot"),
+    ).filter(
+        TimeVote.time_candidate_id == candidate_id,
+        TimeVote.is_available == True,
+    ).subquery()
+
+    rows = db.query(
+        slots.c.slot,
+        func.array_agg(distinct(slots.c.vote_id)),
+    ).group_by(slots.c.slot).all()
+    vote_ids: Dict[datetime, Set[UUID]] = {}
+    for time_string, ids in rows:
+        slot = parse_slot(time_string)
+        if slot is not None:
+            vote_ids.setdefault(slot, set()).update(ids)
+    return {slot: len(ids) for slot, ids in vote_ids.items()}
+
+
+def tally_candidate_time(db: Session, db_candidate: MeetingTimeCandidate) -> Dict[str, int]:
+    """candidate_time의 모든 시간 키에 대한 전체 재집계 결과 (두 경로 모두 parse_slot으로 변환한 시각 기준)"""
+    candidate_time = db_candidate.candidate_time or {}
+    if settings.TIME_VOTE_SLOT_READS:
+        # 정규화된 time_vote_slot 인덱스로 집계
+        from app.crud.time_vote_slot import count_participants_by_slot
+        counts = count_participants_by_slot(db, db_candidate.id)
+    else:
+        counts = count_votes_by_slot(db, db_candidate.id)
+    return {time_string: counts.get(parse_slot(time_string), 0) for time_string in candidate_time}
+
+
+def verify_vote_count(db: Session, candidate_id: UUID) -> Optional[Dict[str, Tuple[int, int]]]:
+    """저장된 투표 수와 전체 재집계 결과 비교 - 어긋난 시간만 {시간: (저장값, 실제값)}으로 반환"""
     db_candidate = get_time_candidate(db, candidate_id)
     if not db_candidate:
         return None
     
-    # candidate_time JSON에서 모든 시간 키 가져오기
-    candidate_time = db_candidate.candidate_time.copy() if db_candidate.candidate_time else {}
-    
-    # 각 시간별로 가능한 투표 수 계산 (is_available=True이고 time_list에 해당 시간이 포함된 투표)
-    for time_string in candidate_time.keys():
-        # time_list에 해당 시간이 포함되고 is_available=True인 투표 수 계산
-        available_votes = db.query(TimeVote).filter(
-            TimeVote.time_candidate_id == candidate_id,
-            TimeVote.is_available == True,
-            func.array_to_string(TimeVote.time_list, ',').contains(time_string)
-        ).count()
-        candidate_time[time_string] = available_votes
+    counts = tally_candidate_time(db, db_candidate)
+    return {
+        time_string: (stored, counts[time_string])
+        for time_string, stored in (db_candidate.candidate_time or {}).items()
+        if stored != counts[time_string]
+    }
+
+
+def update_vote_count(db: Session, candidate_id: UUID) -> Optional[MeetingTimeCandidate]:
+    """투표 수 전체 재집계 (증분 집계가 어긋났을 때 복구용) - candidate_time JSON 업데이트"""
+    db_candidate = lock_time_candidate(db, candidate_id)
+    if not db_candidate:
+        return None
     
-    # candidate_time JSON 업데이트
-    db_candidate.candidate_time = candidate_time
+    # candidate_time JSON의 시간 키마다 가능 투표 수를 한 번의 쿼리로 계산
+    db_candidate.candidate_time = tally_candidate_time(db, db_candidate)
+    queue_time_candidate_event(db, db_candidate, "recount")
     
     db.commit()
-    db.refresh(db_candidate)
     return db_candidate
-
@@ -0,0 +1,78 @@
+"""키셋(커서) 페이지네이션
+
+정렬 키(예: (created_at, id))의 마지막 값을 불투명한 커서 문자열로 인코딩하고,
+다음 페이지는 (created_at, id) > (커서 값) 조건으로 같은 복합 인덱스를 이어서 읽습니다.
+OFFSET과 달리 페이지 깊이와 관계없이 비용이 일정하고, 중간에 행이 추가/삭제되어도 결과가 밀리지 않습니다.
+skip(OFFSET)은 하위 호환용으로만 남겨 둡니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.elements import ColumnElement
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없는 커서"""
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _from_json(column: ColumnElement, value: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([_to_json(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[ColumnElement]) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(columns) or None in values:
+            raise ValueError(cursor)
+        return [_from_json(column, value) for column, value in zip(columns, values)]
+    except (ValueError, TypeError) as error:
+        raise InvalidCursorError("잘못된 커서입니다.") from error
+
+
+def paginate(
+    query: Query,
+    order_by: Sequence[ColumnElement],
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+) -> Query:
+    """정렬 키 순서로 limit개 조회 (cursor가 있으면 키셋, 없으면 skip(OFFSET, deprecated) 사용)"""
+    query = query.order_by(*order_by)
+    if cursor:
+        values = decode_cursor(cursor, order_by)
+        query = query.filter(tuple_(*order_by) > tuple_(*values))
+    elif skip:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def next_cursor(items: Sequence[Any], order_by: Sequence[ColumnElement], limit: int) -> Optional[str]:
+    """가득 찬 페이지면 마지막 행의 정렬 키로 다음 커서 생성 (마지막 페이지면 None)"""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor([getattr(last, column.key) for column in order_by])
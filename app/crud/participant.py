@@ -1,13 +1,34 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import delete
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Optional
 from uuid import UUID
 from app.models.participant import Participant
-from app.schemas.participant import ParticipantCreate, ParticipantUpdate
+from app.models.time_vote import TimeVote
+from app.schemas.participant import ParticipantCreate, ParticipantUpdate, ParticipantBulkCreate
+from app.crud.base import CRUDBase
+from app.crud.meeting_time_candidate import apply_vote_delta, lock_time_candidates, voted_slots
+from app.services.events import queue_event
+
+participants = CRUDBase(Participant)
+
+
+def queue_participant_event(db: Session, db_participant: Participant, action: str, tallies: Optional[list] = None) -> None:
+    """commit 후 모임 구독자에게 보낼 참가자 이벤트 등록 (삭제 시 차감된 투표 수 포함)"""
+    queue_event(db, db_participant.meeting_id, "participant", {
+        "action": action,
+        "participant_id": db_participant.id,
+        "tallies": tallies or [],
+    })
 
 
 def get_participant(db: Session, participant_id: UUID) -> Optional[Participant]:
     """참가자 ID로 조회"""
-    return db.query(Participant).filter(Participant.id == participant_id).first()
+    return participants.get(db, participant_id)
+
+
+def get_participants(db: Session, participant_ids: List[UUID]) -> List[Participant]:
+    """참가자 ID 목록으로 조회 (IN 쿼리 한 번, 없는 ID는 제외)"""
+    return participants.get_many(db, participant_ids)
 
 
 def get_participants_by_meeting(db: Session, meeting_id: UUID) -> List[Participant]:
@@ -21,43 +42,82 @@ def get_participants_by_user(db: Session, user_id: int) -> List[Participant]:
 
 
 def create_participant(db: Session, participant: ParticipantCreate) -> Participant:
-    """새 참가자 생성"""
-    db_participant = Participant(
-        meeting_id=participant.meeting_id,
-        user_id=participant.user_id,
-        location=participant.location,
-    )
-    db.add(db_participant)
+    """새 참가자 생성 (INSERT ... RETURNING 한 번)"""
+    db_participant = participants.create(db, {
+        "meeting_id": participant.meeting_id,
+        "user_id": participant.user_id,
+        "location": participant.location,
+    })
+    queue_participant_event(db, db_participant, "create")
     db.commit()
-    db.refresh(db_participant)
     return db_participant
 
 
+def create_participants(db: Session, bulk: ParticipantBulkCreate) -> List[Participant]:
+    """한 모임에 참가자 여러 명 생성 (여러 행 INSERT 한 문장)"""
+    db_participants = participants.create_many(db, [
+        {"meeting_id": bulk.meeting_id, "user_id": item.user_id, "location": item.location}
+        for item in bulk.participants
+    ])
+    for db_participant in db_participants:
+        queue_participant_event(db, db_participant, "create")
+    db.commit()
+    return db_participants
+
+
 def update_participant(db: Session, participant_id: UUID, participant_update: ParticipantUpdate) -> Optional[Participant]:
-    """참가자 정보 업데이트"""
-    db_participant = get_participant(db, participant_id)
+    """참가자 정보 업데이트 (UPDATE ... RETURNING 한 번)"""
+    db_participant = participants.update(db, participant_id, participant_update)
     if not db_participant:
         return None
     
-    if participant_update.location is not None:
-        db_participant.location = participant_update.location
-    if participant_update.has_responded is not None:
-        db_participant.has_responded = participant_update.has_responded
-    if participant_update.is_invited is not None:
-        db_participant.is_invited = participant_update.is_invited
-    
+    queue_participant_event(db, db_participant, "update")
     db.commit()
-    db.refresh(db_participant)
     return db_participant
 
 
 def delete_participant(db: Session, participant_id: UUID) -> bool:
     """참가자 삭제"""
-    db_participant = get_participant(db, participant_id)
-    if not db_participant:
-        return False
+    return delete_participants(db, [participant_id]) > 0
+
+
+def delete_participants(db: Session, participant_ids: List[UUID]) -> int:
+    """참가자 여러 명 삭제 (시간 투표 수 차감 포함), 삭제된 수 반환
+
+    참가자와 시간 투표는 각각 DELETE 한 문장으로, 투표한 시간 후보는 한 번에 잠급니다.
+    """
+    db_participants = participants.get_many(db, participant_ids, options=[selectinload(Participant.time_votes)])
+    if not db_participants:
+        return 0
+    
+    # 함께 삭제되는 시간 투표만큼 각 시간 후보의 투표 수 차감
+    # 투표한 시간 후보를 한 번의 쿼리로 잠금 (id 순으로 잠가 교착 방지)
+    candidates = {
+        db_candidate.id: db_candidate
+        for db_candidate in lock_time_candidates(db, [
+            db_vote.time_candidate_id for db_participant in db_participants for db_vote in db_participant.time_votes
+        ])
+    }
+    for db_participant in db_participants:
+        tallies = []
+        for db_vote in db_participant.time_votes:
+            db_candidate = candidates.get(db_vote.time_candidate_id)
+            if db_candidate:
+                delta = apply_vote_delta(db_candidate, voted_slots(db_vote.time_list, db_vote.is_available), set())
+                tallies.append({
+                    "time_candidate_id": db_candidate.id,
+                    "delta": delta,
+                    "counts": {time_string: db_candidate.candidate_time[time_string] for time_string in delta},
+                })
+        queue_participant_event(db, db_participant, "delete", tallies)
     
-    db.delete(db_participant)
+    ids = [db_participant.id for db_participant in db_participants]
+    db.execute(
+        delete(TimeVote).where(TimeVote.participant_id.in_(ids)),
+        execution_options={"synchronize_session": False},
+    )
+    count = participants.delete_many(db, ids)
+    for db_participant in db_participants:
+        db.expunge(db_participant)
     db.commit()
-    return True
-
+    return count
@@ -1,67 +1,68 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.models.place import Place
-from app.schemas.place import PlaceCreate, PlaceUpdate
+from app.schemas.place import PlaceCreate, PlaceUpdate, PlaceBulkUpdate
+from app.crud.base import CRUDBase
+from app.crud.pagination import paginate
+
+# 목록 정렬 키 (place에는 created_at이 없어 기본 키 순)
+PLACE_ORDER = (Place.id,)
+
+places = CRUDBase(Place)
 
 
 def get_place(db: Session, place_id: str) -> Optional[Place]:
     """장소 ID로 조회"""
-    return db.query(Place).filter(Place.id == place_id).first()
+    return places.get(db, place_id)
+
 
+def get_places(db: Session, place_ids: List[str]) -> List[Place]:
+    """장소 ID 목록으로 조회 (IN 쿼리 한 번, 요청 순서 유지, 없는 ID는 제외)"""
+    return places.get_many(db, place_ids)
 
-def get_all_places(db: Session, skip: int = 0, limit: int = 100) -> List[Place]:
-    """모든 장소 목록 조회"""
-    return db.query(Place).offset(skip).limit(limit).all()
+
+def get_all_places(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[Place]:
+    """모든 장소 목록 조회 (id 순, cursor 우선)"""
+    return paginate(db.query(Place), PLACE_ORDER, limit, cursor=cursor, skip=skip).all()
 
 
 def create_place(db: Session, place: PlaceCreate) -> Place:
-    """새 장소 생성"""
-    db_place = Place(
-        id=place.id,
-        name=place.name,
-        category=place.category,
-        address=place.address,
-        location=place.location,
-        rating=place.rating,
-        thumbnail=place.thumbnail,
-    )
-    db.add(db_place)
+    """새 장소 생성 (INSERT ... RETURNING 한 번)"""
+    db_place = places.create(db, place)
     db.commit()
-    db.refresh(db_place)
     return db_place
 
 
+def create_places(db: Session, place_list: List[PlaceCreate]) -> List[Place]:
+    """장소 여러 개 생성 (여러 행 INSERT 한 문장)"""
+    db_places = places.create_many(db, place_list)
+    db.commit()
+    return db_places
+
+
 def update_place(db: Session, place_id: str, place_update: PlaceUpdate) -> Optional[Place]:
-    """장소 정보 업데이트"""
-    db_place = get_place(db, place_id)
-    if not db_place:
-        return None
-    
-    if place_update.name is not None:
-        db_place.name = place_update.name
-    if place_update.category is not None:
-        db_place.category = place_update.category
-    if place_update.address is not None:
-        db_place.address = place_update.address
-    if place_update.location is not None:
-        db_place.location = place_update.location
-    if place_update.rating is not None:
-        db_place.rating = place_update.rating
-    if place_update.thumbnail is not None:
-        db_place.thumbnail = place_update.thumbnail
-    
+    """장소 정보 업데이트 (UPDATE ... RETURNING 한 번)"""
+    db_place = places.update(db, place_id, place_update)
     db.commit()
-    db.refresh(db_place)
     return db_place
 
 
+def update_places(db: Session, place_updates: List[PlaceBulkUpdate]) -> int:
+    """장소 여러 개 부분 업데이트 (UPDATE 한 문장 executemany, 없는 ID가 있으면 RowNotFoundError)"""
+    count = places.update_many(db, place_updates)
+    db.commit()
+    return count
+
+
 def delete_place(db: Session, place_id: str) -> bool:
     """장소 삭제"""
-    db_place = get_place(db, place_id)
-    if not db_place:
-        return False
-    
-    db.delete(db_place)
+    success = places.delete(db, place_id)
     db.commit()
-    return True
+    return success
+
 
+def delete_places(db: Session, place_ids: List[str]) -> int:
+    """장소 여러 개 삭제 (DELETE 한 문장), 삭제된 수 반환"""
+    count = places.delete_many(db, place_ids)
+    db.commit()
+    return count
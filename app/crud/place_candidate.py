@@ -3,11 +3,15 @@ from typing import List, Optional
 from uuid import UUID
 from app.models.place_candidate import PlaceCandidate, LocationType
 from app.schemas.place_candidate import PlaceCandidateCreate, PlaceCandidateUpdate
+from app.crud.base import CRUDBase
+from app.crud.writes import changed_fields
+
+place_candidates = CRUDBase(PlaceCandidate)
 
 
 def get_place_candidate(db: Session, candidate_id: str) -> Optional[PlaceCandidate]:
     """장소 후보 ID로 조회"""
-    return db.query(PlaceCandidate).filter(PlaceCandidate.id == candidate_id).first()
+    return place_candidates.get(db, candidate_id)
 
 
 def get_place_candidates_by_meeting(db: Session, meeting_id: UUID) -> List[PlaceCandidate]:
@@ -15,70 +19,45 @@ def get_place_candidates_by_meeting(db: Session, meeting_id: UUID) -> List[Place
     return db.query(PlaceCandidate).filter(PlaceCandidate.meeting_id == meeting_id).all()
 
 
+def _location_type(value: Optional[str]) -> Optional[LocationType]:
+    """location_type 문자열을 Enum으로 변환 (유효하지 않은 값은 None)"""
+    if not value:
+        return None
+    try:
+        return LocationType(value)
+    except ValueError:
+        return None
+
+
 def create_place_candidate(db: Session, candidate: PlaceCandidateCreate) -> PlaceCandidate:
-    """새 장소 후보 생성"""
-    # location_type 문자열을 Enum으로 변환
-    location_type_enum = None
-    if candidate.location_type:
-        try:
-            location_type_enum = LocationType(candidate.location_type)
-        except ValueError:
-            # 유효하지 않은 값인 경우 None으로 설정
-            location_type_enum = None
-    
-    db_candidate = PlaceCandidate(
-        id=candidate.id,
-        meeting_id=candidate.meeting_id,
-        location=candidate.location,
-        preference_subway=candidate.preference_subway,
-        preference_area=candidate.preference_area,
-        food=candidate.food,
-        condition=candidate.condition,
-        location_type=location_type_enum,
-    )
-    db.add(db_candidate)
+    """새 장소 후보 생성 (INSERT ... RETURNING 한 번)"""
+    db_candidate = place_candidates.create(db, {
+        "id": candidate.id,
+        "meeting_id": candidate.meeting_id,
+        "location": candidate.location,
+        "preference_subway": candidate.preference_subway,
+        "preference_area": candidate.preference_area,
+        "food": candidate.food,
+        "condition": candidate.condition,
+        "location_type": _location_type(candidate.location_type),
+    })
     db.commit()
-    db.refresh(db_candidate)
     return db_candidate
 
 
 def update_place_candidate(
     db: Session, candidate_id: str, candidate_update: PlaceCandidateUpdate
 ) -> Optional[PlaceCandidate]:
-    """장소 후보 정보 업데이트"""
-    db_candidate = get_place_candidate(db, candidate_id)
-    if not db_candidate:
-        return None
-    
-    if candidate_update.location is not None:
-        db_candidate.location = candidate_update.location
-    if candidate_update.preference_subway is not None:
-        db_candidate.preference_subway = candidate_update.preference_subway
-    if candidate_update.preference_area is not None:
-        db_candidate.preference_area = candidate_update.preference_area
-    if candidate_update.food is not None:
-        db_candidate.food = candidate_update.food
-    if candidate_update.condition is not None:
-        db_candidate.condition = candidate_update.condition
-    if candidate_update.location_type is not None:
-        try:
-            db_candidate.location_type = LocationType(candidate_update.location_type)
-        except ValueError:
-            # 유효하지 않은 값인 경우 None으로 설정
-            db_candidate.location_type = None
-    
+    """장소 후보 정보 업데이트 (UPDATE ... RETURNING 한 번)"""
+    values = changed_fields(candidate_update, location_type=_location_type)
+    db_candidate = place_candidates.update(db, candidate_id, values)
     db.commit()
-    db.refresh(db_candidate)
     return db_candidate
 
 
 def delete_place_candidate(db: Session, candidate_id: str) -> bool:
-    """장소 후보 삭제"""
-    db_candidate = get_place_candidate(db, candidate_id)
-    if not db_candidate:
-        return False
-    
-    db.delete(db_candidate)
+    """장소 후보 삭제 (DELETE 한 번)"""
+    success = place_candidates.delete(db, candidate_id)
     db.commit()
-    return True
+    return success
 
@@ -1,13 +1,20 @@
+from datetime import datetime
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 from app.models.place_vote import PlaceVote
 from app.schemas.place_vote import PlaceVoteCreate, PlaceVoteUpdate
+from app.crud.base import CRUDBase
+from app.services.events import queue_event
+
+place_votes = CRUDBase(PlaceVote)
 
 
 def get_place_vote(db: Session, vote_id: UUID) -> Optional[PlaceVote]:
     """장소 투표 ID로 조회"""
-    return db.query(PlaceVote).filter(PlaceVote.id == vote_id).first()
+    return place_votes.get(db, vote_id)
 
 
 def get_place_votes_by_participant(db: Session, participant_id: UUID) -> List[PlaceVote]:
@@ -25,53 +32,64 @@ def get_place_votes_by_time_candidate(db: Session, time_candidate_id: UUID) -> L
     return db.query(PlaceVote).filter(PlaceVote.time_candidate_id == time_candidate_id).all()
 
 
+def upsert_place_votes(db: Session, rows: List[dict]) -> List[PlaceVote]:
+    """장소 투표 여러 건을 INSERT ... ON CONFLICT DO UPDATE ... RETURNING 한 번으로 저장
+
+    memo가 None이면 기존 메모를 유지합니다.
+    """
+    stmt = insert(PlaceVote).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_participant_place_time_candidate",
+        set_={
+            "is_available": stmt.excluded.is_available,
+            "memo": func.coalesce(stmt.excluded.memo, PlaceVote.memo),
+            "updated_at": stmt.excluded.updated_at,
+        },
+    ).returning(PlaceVote)
+    return db.scalars(stmt, execution_options={"populate_existing": True}).all()
+
+
+def place_vote_row(vote, participant_id: UUID, meeting_id: UUID) -> dict:
+    """upsert_place_votes에 넘길 행 (스키마 → 컬럼 값)"""
+    return {
+        "participant_id": participant_id,
+        "meeting_id": meeting_id,
+        "time_candidate_id": vote.time_candidate_id,
+        "is_available": vote.is_available,
+        "memo": vote.memo,
+        "updated_at": datetime.utcnow(),
+    }
+
+
+def queue_place_vote_event(db: Session, db_vote: PlaceVote, action: str) -> None:
+    """commit 후 모임 구독자에게 보낼 장소 투표 이벤트 등록"""
+    queue_event(db, db_vote.meeting_id, "place_vote", {
+        "action": action,
+        "vote_id": db_vote.id,
+        "participant_id": db_vote.participant_id,
+        "time_candidate_id": db_vote.time_candidate_id,
+        "is_available": db_vote.is_available,
+    })
+
+
 def create_place_vote(db: Session, vote: PlaceVoteCreate) -> PlaceVote:
-    """새 장소 투표 생성 (이미 존재하면 업데이트)"""
-    # 기존 투표 확인 (participant_id와 time_candidate_id 조합)
-    existing_vote = db.query(PlaceVote).filter(
-        PlaceVote.participant_id == vote.participant_id,
-        PlaceVote.time_candidate_id == vote.time_candidate_id
-    ).first()
-    
-    if existing_vote:
-        # 기존 투표 업데이트
-        if vote.is_available is not None:
-            existing_vote.is_available = vote.is_available
-        if vote.memo is not None:
-            existing_vote.memo = vote.memo
-        db.commit()
-        db.refresh(existing_vote)
-        return existing_vote
-    
-    # 새 투표 생성
-    db_vote = PlaceVote(
-        participant_id=vote.participant_id,
-        meeting_id=vote.meeting_id,
-        time_candidate_id=vote.time_candidate_id,
-        is_available=vote.is_available,
-        memo=vote.memo,
-    )
-    db.add(db_vote)
+    """새 장소 투표 생성 (이미 존재하면 업데이트, 한 문장으로 처리)"""
+    [db_vote] = upsert_place_votes(db, [place_vote_row(vote, vote.participant_id, vote.meeting_id)])
+    queue_place_vote_event(db, db_vote, "upsert")
     db.commit()
-    db.refresh(db_vote)
     return db_vote
 
 
 def update_place_vote(
     db: Session, vote_id: UUID, vote_update: PlaceVoteUpdate
 ) -> Optional[PlaceVote]:
-    """장소 투표 정보 업데이트"""
-    db_vote = get_place_vote(db, vote_id)
+    """장소 투표 정보 업데이트 (UPDATE ... RETURNING 한 번)"""
+    db_vote = place_votes.update(db, vote_id, vote_update)
     if not db_vote:
         return None
     
-    if vote_update.is_available is not None:
-        db_vote.is_available = vote_update.is_available
-    if vote_update.memo is not None:
-        db_vote.memo = vote_update.memo
-    
+    queue_place_vote_event(db, db_vote, "update")
     db.commit()
-    db.refresh(db_vote)
     return db_vote
 
 
@@ -81,6 +99,7 @@ def delete_place_vote(db: Session, vote_id: UUID) -> bool:
     if not db_vote:
         return False
     
+    queue_place_vote_event(db, db_vote, "delete")
     db.delete(db_vote)
     db.commit()
     return True
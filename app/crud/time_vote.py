@@ -1,14 +1,32 @@
+from datetime import datetime
+from sqlalchemy import literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
+from app.database import settings
+from app.models.meeting import Meeting
 from app.models.time_vote import TimeVote
 from app.schemas.time_vote import TimeVoteCreate, TimeVoteUpdate
-from app.crud.meeting_time_candidate import update_vote_count
+from app.crud.base import CRUDBase
+from app.crud.meeting_time_candidate import apply_vote_delta, lock_time_candidate, voted_slots
+from app.crud.time_vote_slot import sync_vote_slots
+from app.services.bitmap import SlotGrid
+from app.services.availability import AvailabilityIndex
+from app.services.slots import format_slot
+from app.services.events import queue_event
+
+time_votes = CRUDBase(TimeVote)
 
 
 def get_time_vote(db: Session, vote_id: UUID) -> Optional[TimeVote]:
     """투표 ID로 조회"""
-    return db.query(TimeVote).filter(TimeVote.id == vote_id).first()
+    return time_votes.get(db, vote_id)
+
+
+def reload_time_vote(db: Session, vote_id: UUID) -> Optional[TimeVote]:
+    """잠금을 잡은 뒤 최신 투표 값을 다시 조회 (그 사이 다른 요청이 삭제했으면 None)"""
+    return db.query(TimeVote).filter(TimeVote.id == vote_id).populate_existing().first()
 
 
 def get_time_votes_by_participant(db: Session, participant_id: UUID) -> List[TimeVote]:
@@ -31,39 +49,192 @@ def get_time_vote_by_participant_and_candidate(
     ).first()
 
 
+def get_availability_grid(db: Session, meeting_id: UUID) -> Optional[SlotGrid]:
+    """비트맵 인코딩에 쓸 모임 시간 격자 (TIME_VOTE_BITMAP 설정이 꺼져 있거나 격자가 없으면 None)"""
+    if not settings.TIME_VOTE_BITMAP:
+        return None
+    available_times = db.query(Meeting.available_times).filter(
+        Meeting.id == meeting_id
+    ).scalar()
+    return SlotGrid(available_times) if available_times else None
+
+
+def encode_availability(db: Session, db_vote: TimeVote, slots: Iterable[str]) -> None:
+    """모임 시간 격자 기준 가능 시간 비트맵 저장 (설정이 꺼져 있으면 이전 비트맵이 남지 않도록 비움)"""
+    grid = get_availability_grid(db, db_vote.meeting_id)
+    db_vote.availability_bitmap = grid.encode(slots) if grid else None
+
+
+def reencode_meeting_availability(db: Session, meeting_id: UUID, available_times) -> None:
+    """모임 시간 격자가 바뀌었을 때 투표 비트맵 재계산 (commit은 호출하는 쪽에서)
+
+    설정이 꺼져 있으면 이전 격자 기준 비트맵을 모두 비움 (길이가 같은 격자로 바뀌어도 잘못 읽지 않도록)
+    """
+    if not settings.TIME_VOTE_BITMAP:
+        db.query(TimeVote).filter(
+            TimeVote.meeting_id == meeting_id, TimeVote.availability_bitmap.isnot(None)
+        ).update({TimeVote.availability_bitmap: None}, synchronize_session=False)
+        return
+    grid = SlotGrid(available_times)
+    for db_vote in db.query(TimeVote).filter(TimeVote.meeting_id == meeting_id).all():
+        slots = voted_slots(db_vote.time_list, db_vote.is_available)
+        db_vote.availability_bitmap = grid.encode(slots) if len(grid) else None
+
+
+def get_availability_masks(db: Session, meeting_id: UUID) -> Tuple[SlotGrid, Dict[UUID, int]]:
+    """모임 시간 격자와 참가자별 가능 시간 비트마스크 (비트맵이 없는 투표는 time_list로 변환)
+
+    비트맵은 TIME_VOTE_BITMAP이 켜져 있는 동안에만 최신으로 유지되므로 꺼져 있으면 항상 time_list를 사용
+    """
+    available_times = db.query(Meeting.available_times).filter(Meeting.id == meeting_id).scalar()
+    grid = SlotGrid(available_times)
+    rows = db.query(
+        TimeVote.participant_id,
+        TimeVote.time_list,
+        TimeVote.is_available,
+        TimeVote.availability_bitmap,
+    ).filter(TimeVote.meeting_id == meeting_id).all()
+    
+    masks: Dict[UUID, int] = {}
+    for participant_id, time_list, is_available, bitmap in rows:
+        if settings.TIME_VOTE_BITMAP and bitmap is not None and len(bitmap) == grid.byte_length:
+            mask = grid.to_mask(bitmap)
+        else:
+            mask = grid.encode_mask(voted_slots(time_list, is_available))
+        masks[participant_id] = masks.get(participant_id, 0) | mask
+    return grid, masks
+
+
+def get_meeting_vote_inputs(
+    db: Session, meeting_id: UUID
+) -> Tuple[List[UUID], List[Tuple[UUID, List[str], bool]], List[str]]:
+    """모임 분석용 입력: (참가자 ID 목록, (참가자 ID, time_list, is_available) 목록, 후보 시간 목록)
+
+    후보 시간은 시간 후보(candidate_time 키)와 모임의 available_times이며, 분석 격자의 범위가 됩니다.
+    """
+    from app.models.participant import Participant
+    from app.models.meeting_time_candidate import MeetingTimeCandidate
+    
+    participant_ids = [
+        participant_id for (participant_id,) in db.query(Participant.id).filter(
+            Participant.meeting_id == meeting_id
+        ).order_by(Participant.created_at, Participant.id).all()
+    ]
+    votes = [
+        tuple(row) for row in db.query(
+            TimeVote.participant_id,
+            TimeVote.time_list,
+            TimeVote.is_available,
+        ).filter(TimeVote.meeting_id == meeting_id).all()
+    ]
+    slots = [
+        time_string
+        for (candidate_time,) in db.query(MeetingTimeCandidate.candidate_time).filter(
+            MeetingTimeCandidate.meeting_id == meeting_id
+        ).all()
+        for time_string in (candidate_time or {})
+    ]
+    available_times = db.query(Meeting.available_times).filter(Meeting.id == meeting_id).scalar()
+    slots.extend(format_slot(slot) for slot in available_times or [])
+    return participant_ids, votes, slots
+
+
+def get_availability_index(db: Session, meeting_id: UUID) -> AvailabilityIndex:
+    """모임 참가자 전체와 투표로 슬롯별 가능 참가자 비트셋 생성"""
+    return AvailabilityIndex.from_votes(*get_meeting_vote_inputs(db, meeting_id))
+
+
+def upsert_time_votes(db: Session, rows: List[dict]) -> List[Tuple[TimeVote, Set[str]]]:
+    """시간 투표 여러 건을 INSERT ... ON CONFLICT DO UPDATE ... RETURNING 한 번으로 저장
+
+    같은 문장의 CTE로 덮어쓰기 전 값을 함께 돌려받아 (투표, 이전 가능 시간) 목록을 반환합니다.
+    투표 수 증감이 어긋나지 않도록 호출 전에 해당 시간 후보 행을 잠가야 합니다.
+    """
+    old_vote = select(
+        TimeVote.participant_id,
+        TimeVote.time_candidate_id,
+        TimeVote.time_list,
+        TimeVote.is_available,
+    ).where(
+        tuple_(TimeVote.participant_id, TimeVote.time_candidate_id).in_(
+            [(row["participant_id"], row["time_candidate_id"]) for row in rows]
+        )
+    ).cte("old_vote")
+    
+    def old_value(column):
+        # RETURNING 안의 서브쿼리는 자동 상관되지 않으므로 대상 행 컬럼을 직접 참조
+        return select(column).where(
+            old_vote.c.participant_id == literal_column("time_vote.participant_id"),
+            old_vote.c.time_candidate_id == literal_column("time_vote.time_candidate_id"),
+        ).scalar_subquery()
+    
+    stmt = insert(TimeVote).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_participant_time_candidate",
+        set_={
+            "time_list": stmt.excluded.time_list,
+            "is_available": stmt.excluded.is_available,
+            "memo": stmt.excluded.memo,
+            "availability_bitmap": stmt.excluded.availability_bitmap,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    ).add_cte(old_vote).returning(
+        TimeVote, old_value(old_vote.c.time_list), old_value(old_vote.c.is_available)
+    )
+    result = db.execute(stmt, execution_options={"populate_existing": True})
+    return [
+        (db_vote, voted_slots(old_time_list, bool(old_is_available)))
+        for db_vote, old_time_list, old_is_available in result.all()
+    ]
+
+
+def time_vote_row(vote, participant_id: UUID, meeting_id: UUID, grid: Optional[SlotGrid]) -> dict:
+    """upsert_time_votes에 넘길 행 (스키마 → 컬럼 값)"""
+    return {
+        "participant_id": participant_id,
+        "meeting_id": meeting_id,
+        "time_candidate_id": vote.time_candidate_id,
+        "time_list": vote.time_list,
+        "is_available": vote.is_available,
+        "memo": getattr(vote, 'memo', None),
+        "availability_bitmap": grid.encode(voted_slots(vote.time_list, vote.is_available)) if grid else None,
+        "updated_at": datetime.utcnow(),
+    }
+
+
+def queue_time_vote_event(
+    db: Session, db_vote: TimeVote, action: str, db_candidate=None, delta: Optional[Dict[str, int]] = None
+) -> None:
+    """commit 후 모임 구독자에게 보낼 투표 이벤트 등록 (바뀐 시간의 증감과 현재 투표 수 포함)"""
+    delta = delta or {}
+    candidate_time = db_candidate.candidate_time if db_candidate else {}
+    queue_event(db, db_vote.meeting_id, "time_vote", {
+        "action": action,
+        "vote_id": db_vote.id,
+        "participant_id": db_vote.participant_id,
+        "time_candidate_id": db_vote.time_candidate_id,
+        "delta": delta,
+        "counts": {time_string: candidate_time.get(time_string, 0) for time_string in delta},
+    })
+
+
 def create_time_vote(db: Session, vote: TimeVoteCreate) -> TimeVote:
     """새 투표 생성 (이미 존재하면 업데이트)"""
-    # 기존 투표 확인
-    existing_vote = get_time_vote_by_participant_and_candidate(
-        db, vote.participant_id, vote.time_candidate_id
-    )
-    
-    if existing_vote:
-        # 기존 투표 업데이트
-        existing_vote.time_list = vote.time_list
-        existing_vote.is_available = vote.is_available
-        if hasattr(vote, 'memo'):
-            existing_vote.memo = vote.memo
-        db.commit()
-        db.refresh(existing_vote)
-        # 투표 수 업데이트
-        update_vote_count(db, vote.time_candidate_id)
-        return existing_vote
+    # 시간 후보 행을 잠가 같은 후보에 대한 투표 쓰기를 직렬화
+    db_candidate = lock_time_candidate(db, vote.time_candidate_id)
     
-    # 새 투표 생성
-    db_vote = TimeVote(
-        participant_id=vote.participant_id,
-        meeting_id=vote.meeting_id,
-        time_candidate_id=vote.time_candidate_id,
-        time_list=vote.time_list,
-        is_available=vote.is_available,
-        memo=getattr(vote, 'memo', None),
+    # 기존 투표 확인 없이 한 문장으로 생성/업데이트 (동시 요청도 유니크 제약 위반 없이 처리)
+    grid = get_availability_grid(db, vote.meeting_id)
+    [(db_vote, old_slots)] = upsert_time_votes(
+        db, [time_vote_row(vote, vote.participant_id, vote.meeting_id, grid)]
     )
-    db.add(db_vote)
+    
+    # 바뀐 시간의 투표 수와 슬롯 행만 같은 트랜잭션에서 반영
+    new_slots = voted_slots(db_vote.time_list, db_vote.is_available)
+    delta = apply_vote_delta(db_candidate, old_slots, new_slots) if db_candidate else {}
+    sync_vote_slots(db, db_vote, old_slots, new_slots)
+    queue_time_vote_event(db, db_vote, "upsert", db_candidate, delta)
     db.commit()
-    db.refresh(db_vote)
-    # 투표 수 업데이트
-    update_vote_count(db, vote.time_candidate_id)
     return db_vote
 
 
@@ -73,6 +244,14 @@ def update_time_vote(db: Session, vote_id: UUID, vote_update: TimeVoteUpdate) ->
     if not db_vote:
         return None
     
+    # 시간 후보를 잠근 뒤 최신 투표 값을 다시 읽어 증감 기준으로 사용 (그 사이 삭제됐으면 404)
+    db_candidate = lock_time_candidate(db, db_vote.time_candidate_id)
+    db_vote = reload_time_vote(db, vote_id)
+    if not db_vote:
+        db.rollback()
+        return None
+    old_slots = voted_slots(db_vote.time_list, db_vote.is_available)
+    
     if vote_update.time_list is not None:
         db_vote.time_list = vote_update.time_list
     if vote_update.is_available is not None:
@@ -80,10 +259,12 @@ def update_time_vote(db: Session, vote_id: UUID, vote_update: TimeVoteUpdate) ->
     if vote_update.memo is not None:
         db_vote.memo = vote_update.memo
     
+    new_slots = voted_slots(db_vote.time_list, db_vote.is_available)
+    delta = apply_vote_delta(db_candidate, old_slots, new_slots) if db_candidate else {}
+    sync_vote_slots(db, db_vote, old_slots, new_slots)
+    encode_availability(db, db_vote, new_slots)
+    queue_time_vote_event(db, db_vote, "update", db_candidate, delta)
     db.commit()
-    db.refresh(db_vote)
-    # 투표 수 업데이트
-    update_vote_count(db, db_vote.time_candidate_id)
     return db_vote
 
 
@@ -93,10 +274,15 @@ def delete_time_vote(db: Session, vote_id: UUID) -> bool:
     if not db_vote:
         return False
     
-    candidate_id = db_vote.time_candidate_id
+    # 시간 후보를 잠근 뒤 다시 조회 (동시 삭제 요청이 먼저 지웠으면 404)
+    db_candidate = lock_time_candidate(db, db_vote.time_candidate_id)
+    db_vote = reload_time_vote(db, vote_id)
+    if not db_vote:
+        db.rollback()
+        return False
+    old_slots = voted_slots(db_vote.time_list, db_vote.is_available)
+    delta = apply_vote_delta(db_candidate, old_slots, set()) if db_candidate else {}
+    queue_time_vote_event(db, db_vote, "delete", db_candidate, delta)
     db.delete(db_vote)
     db.commit()
-    # 투표 수 업데이트
-    update_vote_count(db, candidate_id)
     return True
-
@@ -0,0 +1,51 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Dict, List, Set
+from uuid import UUID
+from datetime import datetime
+from app.models.time_vote import TimeVote
+from app.models.time_vote_slot import TimeVoteSlot
+from app.services.slots import parse_slots
+
+
+def sync_vote_slots(db: Session, db_vote: TimeVote, old_slots: Set[str], new_slots: Set[str]) -> None:
+    """time_list 변경분을 time_vote_slot에 반영 (이중 쓰기, commit은 호출하는 쪽에서)
+
+    변경분은 시각으로 변환한 뒤 계산하므로 같은 시각의 다른 표기("… 02:00", "…T02:00")가 남아 있으면 행을 지우지 않습니다.
+    """
+    old_times, new_times = parse_slots(old_slots), parse_slots(new_slots)
+    removed = old_times - new_times
+    added = new_times - old_times
+
+    if removed and db_vote.id is not None:
+        db.query(TimeVoteSlot).filter(
+            TimeVoteSlot.time_vote_id == db_vote.id,
+            TimeVoteSlot.slot.in_(removed)
+        ).delete(synchronize_session=False)
+    for slot in added:
+        db.add(TimeVoteSlot(
+            time_vote=db_vote,
+            slot=slot,
+            time_candidate_id=db_vote.time_candidate_id,
+            participant_id=db_vote.participant_id,
+        ))
+
+
+def get_participant_ids_available_at(db: Session, candidate_id: UUID, slot: datetime) -> List[UUID]:
+    """해당 시간에 가능한 참가자 ID 목록 (인덱스 조회)"""
+    rows = db.query(TimeVoteSlot.participant_id).filter(
+        TimeVoteSlot.time_candidate_id == candidate_id,
+        TimeVoteSlot.slot == slot
+    ).all()
+    return [participant_id for (participant_id,) in rows]
+
+
+def count_participants_by_slot(db: Session, candidate_id: UUID) -> Dict[datetime, int]:
+    """시간별 가능 인원 집계 (인덱스 조회)"""
+    rows = db.query(
+        TimeVoteSlot.slot,
+        func.count(TimeVoteSlot.participant_id)
+    ).filter(
+        TimeVoteSlot.time_candidate_id == candidate_id
+    ).group_by(TimeVoteSlot.slot).all()
+    return {slot: count for slot, count in rows}
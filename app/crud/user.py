@@ -1,12 +1,20 @@
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
 from app.models.user import User, OAuthProvider
 from app.schemas.user import UserCreate, UserUpdate
+from app.crud.base import CRUDBase
+
+users = CRUDBase(User)
 
 
 def get_user(db: Session, user_id: int) -> Optional[User]:
     """사용자 ID로 조회"""
-    return db.query(User).filter(User.id == user_id).first()
+    return users.get(db, user_id)
+
+
+def get_users(db: Session, user_ids: List[int]) -> List[User]:
+    """사용자 ID 목록으로 조회 (IN 쿼리 한 번, 없는 ID는 제외)"""
+    return users.get_many(db, user_ids)
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
@@ -27,28 +35,19 @@ def create_user(db: Session, user: UserCreate) -> User:
     # oauth_provider Enum을 문자열로 변환
     oauth_provider_str = user.oauth_provider.value if isinstance(user.oauth_provider, OAuthProvider) else str(user.oauth_provider)
     
-    db_user = User(
-        name=user.name,
-        email=user.email,
-        oauth_provider=oauth_provider_str,
-        oauth_id=user.oauth_id,
-    )
-    db.add(db_user)
+    db_user = users.create(db, {
+        "name": user.name,
+        "email": user.email,
+        "oauth_provider": oauth_provider_str,
+        "oauth_id": user.oauth_id,
+    })
     db.commit()
-    db.refresh(db_user)
     return db_user
 
 
 def update_user(db: Session, user_id: int, user_update: UserUpdate) -> Optional[User]:
-    """사용자 정보 업데이트"""
-    db_user = get_user(db, user_id)
-    if not db_user:
-        return None
-    
-    if user_update.name is not None:
-        db_user.name = user_update.name
-    
+    """사용자 정보 업데이트 (UPDATE ... RETURNING 한 번)"""
+    db_user = users.update(db, user_id, user_update)
     db.commit()
-    db.refresh(db_user)
     return db_user
 
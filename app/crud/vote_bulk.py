@@ -0,0 +1,80 @@
+from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from app.models.meeting_time_candidate import MeetingTimeCandidate
+from app.models.participant import Participant
+from app.models.place_vote import PlaceVote
+from app.models.time_vote import TimeVote
+from app.schemas.time_vote import VoteBulkSubmit
+from app.crud.meeting_time_candidate import apply_vote_delta, voted_slots
+from app.crud.place_vote import place_vote_row, queue_place_vote_event, upsert_place_votes
+from app.crud.time_vote import get_availability_grid, queue_time_vote_event, time_vote_row, upsert_time_votes
+from app.crud.time_vote_slot import sync_vote_slots
+
+
+def lock_candidates_for_participant(
+    db: Session, participant_id, meeting_id, candidate_ids
+) -> List[MeetingTimeCandidate]:
+    """참가자·모임과 일치하는 시간 후보를 한 번의 쿼리로 검증하고 잠금 (SELECT ... FOR UPDATE)"""
+    return db.query(MeetingTimeCandidate).join(
+        Participant, Participant.meeting_id == MeetingTimeCandidate.meeting_id
+    ).filter(
+        Participant.id == participant_id,
+        Participant.meeting_id == meeting_id,
+        MeetingTimeCandidate.id.in_(candidate_ids)
+    ).order_by(MeetingTimeCandidate.id).populate_existing().with_for_update(of=MeetingTimeCandidate).all()
+
+
+def submit_votes(db: Session, submission: VoteBulkSubmit) -> Optional[Tuple[List[TimeVote], List[PlaceVote]]]:
+    """참가자의 시간/장소 투표 일괄 저장 (하나의 트랜잭션)
+
+    참가자·시간 후보·모임이 일치하지 않으면 None을 반환합니다.
+    """
+    candidate_ids = {item.time_candidate_id for item in submission.time_votes}
+    candidate_ids |= {item.time_candidate_id for item in submission.place_votes}
+    candidates = {
+        db_candidate.id: db_candidate
+        for db_candidate in lock_candidates_for_participant(
+            db, submission.participant_id, submission.meeting_id, candidate_ids
+        )
+    }
+    if len(candidates) != len(candidate_ids):
+        db.rollback()
+        return None
+    
+    db_time_votes = _upsert_time_votes(db, submission, candidates)
+    db_place_votes = _upsert_place_votes(db, submission)
+    db.commit()
+    return db_time_votes, db_place_votes
+
+
+def _upsert_time_votes(db: Session, submission: VoteBulkSubmit, candidates) -> List[TimeVote]:
+    if not submission.time_votes:
+        return []
+    
+    # 여러 행을 하나의 INSERT ... ON CONFLICT DO UPDATE ... RETURNING으로 저장 (이전 값도 함께 반환)
+    grid = get_availability_grid(db, submission.meeting_id)
+    upserted = upsert_time_votes(db, [
+        time_vote_row(item, submission.participant_id, submission.meeting_id, grid)
+        for item in submission.time_votes
+    ])
+    
+    # 바뀐 시간의 투표 수와 슬롯 행만 반영 (후보별 한 번)
+    for db_vote, old_slots in upserted:
+        new_slots = voted_slots(db_vote.time_list, db_vote.is_available)
+        db_candidate = candidates[db_vote.time_candidate_id]
+        delta = apply_vote_delta(db_candidate, old_slots, new_slots)
+        sync_vote_slots(db, db_vote, old_slots, new_slots)
+        queue_time_vote_event(db, db_vote, "upsert", db_candidate, delta)
+    return [db_vote for db_vote, _ in upserted]
+
+
+def _upsert_place_votes(db: Session, submission: VoteBulkSubmit) -> List[PlaceVote]:
+    if not submission.place_votes:
+        return []
+    db_votes = upsert_place_votes(db, [
+        place_vote_row(item, submission.participant_id, submission.meeting_id)
+        for item in submission.place_votes
+    ])
+    for db_vote in db_votes:
+        queue_place_vote_event(db, db_vote, "upsert")
+    return db_votes
@@ -0,0 +1,69 @@
+"""RETURNING 기반 쓰기 (한 번의 왕복으로 쓰고 결과 행 받기)
+
+add → commit → refresh(SELECT)와 get(SELECT) → 수정 → commit → refresh 대신
+INSERT ... RETURNING / UPDATE ... WHERE ... RETURNING 한 문장으로 쓰고 결과 행을 바로 ORM 객체로 받습니다.
+세션이 expire_on_commit=False이므로 commit 후에도 refresh 없이 응답 스키마로 변환할 수 있습니다.
+"""
+from typing import Any, Dict, Optional, Sequence, Type, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session, aliased, contains_eager, joinedload
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+ModelT = TypeVar("ModelT")
+
+# RETURNING 결과로 세션에 있던 같은 객체의 값을 덮어씀
+_RETURNING_OPTIONS = {"populate_existing": True}
+
+
+def changed_fields(update_schema: BaseModel, **converters: Any) -> Dict[str, Any]:
+    """부분 업데이트 스키마에서 None이 아닌 필드만 추출 (converters로 필드별 값 변환)"""
+    values = update_schema.dict(exclude_none=True)
+    for field, convert in converters.items():
+        if field in values:
+            values[field] = convert(values[field])
+    return values
+
+
+def insert_returning(db: Session, model: Type[ModelT], values: Dict[str, Any]) -> ModelT:
+    """INSERT ... RETURNING 한 번으로 행 생성 후 ORM 객체 반환 (commit은 호출한 쪽에서)"""
+    return db.scalars(
+        insert(model).values(**values).returning(model),
+        execution_options=_RETURNING_OPTIONS,
+    ).one()
+
+
+def update_returning(
+    db: Session,
+    model: Type[ModelT],
+    where: Sequence[Any],
+    values: Dict[str, Any],
+    joined: Optional[InstrumentedAttribute] = None,
+) -> Optional[ModelT]:
+    """UPDATE ... WHERE ... RETURNING 한 번으로 수정 후 ORM 객체 반환 (조건에 맞는 행이 없으면 None)
+
+    joined에 다대일 관계(예: Meeting.creator)를 주면
+    WITH updated AS (UPDATE ... RETURNING ...) SELECT ... JOIN 한 문장으로 관계 대상 행도 함께 받아
+    응답 변환 시 lazy load가 생기지 않게 합니다.
+    values가 비어 있으면 수정 없이 같은 조건으로 조회만 합니다.
+    """
+    if not values:
+        stmt = select(model).where(*where)
+        if joined is not None:
+            stmt = stmt.options(joinedload(joined))
+        return db.scalars(stmt, execution_options=_RETURNING_OPTIONS).first()
+
+    stmt = update(model).where(*where).values(**values)
+    if joined is None:
+        return db.scalars(
+            stmt.returning(model),
+            execution_options={**_RETURNING_OPTIONS, "synchronize_session": False},
+        ).first()
+
+    updated = aliased(model, stmt.returning(*model.__table__.c).cte("updated"))
+    relationship = getattr(updated, joined.key)
+    return db.scalars(
+        select(updated).join(relationship).options(contains_eager(relationship)),
+        execution_options=_RETURNING_OPTIONS,
+    ).first()
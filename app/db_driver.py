@@ -0,0 +1,59 @@
+"""PostgreSQL 드라이버 선택 (DB_DRIVER)
+
+- pg8000: 순수 파이썬 드라이버 (기본값, 설치 크기가 작아 서버리스 번들에 유리)
+- psycopg: psycopg 3 (libpq 기반). psycopg[c] 또는 psycopg[binary]가 설치되어 있으면
+  결과 디코딩과 파라미터 인코딩을 C 확장으로 처리해 목록 API의 CPU 사용량이 줄어듭니다.
+
+비동기 엔진은 asyncpg를 사용합니다.
+
+SSL은 드라이버마다 받는 형식이 다르므로 여기서 맞춰 줍니다.
+현재 설정(Supabase 연결)은 암호화는 하되 인증서 검증은 하지 않는 방식이며, 드라이버별로 같은 의미로 변환합니다.
+- pg8000: ssl_context (검증하지 않는 SSLContext)
+- psycopg: libpq의 sslmode=require (암호화만, 인증서 검증 안 함)
+- asyncpg: ssl (검증하지 않는 SSLContext)
+"""
+import ssl
+from typing import Any, Dict
+
+DRIVER_PG8000 = "pg8000"
+DRIVER_PSYCOPG = "psycopg"
+DRIVER_ASYNCPG = "asyncpg"
+
+SYNC_DRIVERS = (DRIVER_PG8000, DRIVER_PSYCOPG)
+
+_URL_PREFIXES = ("postgresql://", "postgres://")
+
+
+def sync_driver(name: str) -> str:
+    """DB_DRIVER 값 확인 (대소문자 무시)"""
+    driver = name.lower()
+    if driver not in SYNC_DRIVERS:
+        raise ValueError(f"지원하지 않는 DB_DRIVER입니다: {name} (pg8000 | psycopg)")
+    return driver
+
+
+def driver_url(url: str, driver: str) -> str:
+    """postgresql://, postgres://, postgresql+드라이버:// URL을 지정한 드라이버 URL로 변환"""
+    scheme, separator, rest = url.partition("://")
+    if not separator:
+        raise ValueError("DATABASE_URL 형식이 올바르지 않습니다.")
+    if f"{scheme}://" not in _URL_PREFIXES and not scheme.startswith("postgresql+"):
+        return url
+    return f"postgresql+{driver}://{rest}"
+
+
+def unverified_ssl_context() -> ssl.SSLContext:
+    """암호화만 하고 인증서는 검증하지 않는 SSL 컨텍스트 (Supabase 연결용)"""
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+def build_connect_args(driver: str) -> Dict[str, Any]:
+    """드라이버별 SSL 연결 인자"""
+    if driver == DRIVER_PSYCOPG:
+        return {"sslmode": "require"}
+    if driver == DRIVER_ASYNCPG:
+        return {"ssl": unverified_ssl_context()}
+    return {"ssl_context": unverified_ssl_context()}
@@ -0,0 +1,161 @@
+"""데이터베이스 커넥션 풀 설정 및 지표 수집
+
+서버리스(Vercel) 환경에서는 요청마다 연결을 새로 맺는 NullPool을,
+uvicorn 같은 상주 프로세스에서는 연결을 재사용하는 QueuePool을 사용합니다.
+풀 크기를 정할 수 있도록 체크아웃 대기 시간과 연결 나이(age)를 기록합니다.
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+POOL_MODE_NULL = "null"
+POOL_MODE_QUEUE = "queue"
+
+
+class PoolMetrics:
+    """커넥션 풀 체크아웃 지표 (스레드 안전)"""
+
+    def __init__(self, sample_size: int = 1000):
+        self._lock = threading.Lock()
+        self._wait_samples = deque(maxlen=sample_size)
+        self._age_samples = deque(maxlen=sample_size)
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.max_wait_ms = 0.0
+        self.max_age_s = 0.0
+
+    def record_wait(self, wait_ms: float) -> None:
+        with self._lock:
+            self._wait_samples.append(wait_ms)
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def record_checkout(self, age_s: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self._age_samples.append(age_s)
+            self.max_age_s = max(self.max_age_s, age_s)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_invalidate(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    @staticmethod
+    def _percentile(samples, ratio: float) -> float:
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))
+        return ordered[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재까지 수집한 지표 요약"""
+        with self._lock:
+            waits = list(self._wait_samples)
+            ages = list(self._age_samples)
+            return {
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "checkout_wait_ms": {
+                    "p50": round(self._percentile(waits, 0.5), 3),
+                    "p95": round(self._percentile(waits, 0.95), 3),
+                    "max": round(self.max_wait_ms, 3),
+                },
+                "connection_age_s": {
+                    "p50": round(self._percentile(ages, 0.5), 3),
+                    "p95": round(self._percentile(ages, 0.95), 3),
+                    "max": round(self.max_age_s, 3),
+                },
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class TimedQueuePool(QueuePool):
+    """체크아웃 대기 시간을 기록하는 QueuePool
+
+    대기 시간에는 풀이 비어 있어 새 연결을 맺는 시간까지 포함됩니다.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_metrics.record_wait((time.perf_counter() - start) * 1000)
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """비동기 엔진용 TimedQueuePool (대기는 이벤트 루프를 막지 않음)"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_metrics.record_wait((time.perf_counter() - start) * 1000)
+
+
+def build_pool_kwargs(settings, use_async: bool = False) -> Dict[str, Any]:
+    """설정값(DB_POOL_MODE 등)으로 create_engine / create_async_engine 풀 인자 구성"""
+    mode = settings.DB_POOL_MODE.lower()
+    if mode == POOL_MODE_NULL:
+        return {"poolclass": NullPool}
+    if mode == POOL_MODE_QUEUE:
+        return {
+            "poolclass": TimedAsyncQueuePool if use_async else TimedQueuePool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            "pool_use_lifo": True,
+        }
+    raise ValueError(
+        f"지원하지 않는 DB_POOL_MODE입니다: {settings.DB_POOL_MODE} "
+        f"({POOL_MODE_NULL} 또는 {POOL_MODE_QUEUE}만 가능)"
+    )
+
+
+def install_pool_listeners(engine: Engine) -> None:
+    """연결 생성 시각을 기록하고 체크아웃 시 연결 나이를 집계"""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        connection_record.info["connected_at"] = time.monotonic()
+        pool_metrics.record_connect()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connected_at = connection_record.info.get("connected_at", time.monotonic())
+        pool_metrics.record_checkout(time.monotonic() - connected_at)
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        pool_metrics.record_invalidate()
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """현재 풀 상태와 누적 지표"""
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        })
+    status.update(pool_metrics.snapshot())
+    return status
@@ -0,0 +1,175 @@
+"""읽기 복제본 라우팅
+
+DATABASE_REPLICA_URLS를 설정하면 읽기 전용 요청(GET/HEAD)의 SELECT를 복제본으로 보내고,
+쓰기(flush, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE)와 그 밖의 요청은 기본(primary) DB로 보냅니다.
+
+- read-your-writes: 쓰기 요청에 성공한 클라이언트에게 DB_REPLICA_STICKY_SECONDS 동안 유지되는 쿠키를 주고,
+  쿠키가 있는 동안의 읽기는 primary에서 처리해 방금 쓴 내용이 바로 보이도록 합니다.
+- 프로세스 캐시를 채우는 읽기는 read_from_primary()로 항상 primary에서 처리합니다.
+  복제본에서 읽은 오래된 값이 캐시되면 쓰기 직후의 무효화가 TTL 동안 무의미해지기 때문입니다.
+- 지연/장애 대응: 복제본마다 DB_REPLICA_CHECK_SECONDS 간격으로 복제 지연을 조회해
+  DB_REPLICA_MAX_LAG_SECONDS를 넘거나 연결에 실패하면 다음 확인까지 제외합니다.
+  쓸 수 있는 복제본이 없으면 primary에서 읽습니다.
+"""
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger("app.db")
+
+# Session.info 키: bind가 없을 때 쓸 primary 엔진을 돌려주는 함수
+PRIMARY = "primary"
+# Session.info 키: 복제본 목록(ReplicaSet 또는 None)을 돌려주는 함수
+REPLICAS = "replicas"
+# 한 세션은 처음 고른 복제본(없으면 primary)을 계속 사용
+_PICKED_REPLICA = "picked_replica"
+
+# 최근에 쓰기한 클라이언트 표시 (있는 동안 읽기도 primary)
+STICKY_COOKIE = "db_primary"
+READ_METHODS = ("GET", "HEAD")
+
+# 복제 지연 (초). primary(복구 중이 아님)이거나 받은 WAL을 모두 적용했으면 0
+REPLICATION_LAG_SQL = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+_read_only: ContextVar[bool] = ContextVar("db_read_only", default=False)
+
+
+def begin_read_only(read_only: bool) -> Token:
+    """현재 컨텍스트(요청)를 복제본 읽기 가능 여부와 연결"""
+    return _read_only.set(read_only)
+
+
+def end_read_only(token: Token) -> None:
+    _read_only.reset(token)
+
+
+@contextmanager
+def read_from_primary() -> Iterator[None]:
+    """블록 안의 읽기는 읽기 전용 요청이어도 primary에서 처리"""
+    token = _read_only.set(False)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+class Replica:
+    """복제본 하나의 엔진과 상태"""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.healthy = False
+        self.lag_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        self.checked_at = 0.0  # 0이면 처음 사용할 때 확인
+        self._checking = threading.Lock()
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def _handle_error(self, exception_context) -> None:
+        # 쿼리 중 연결이 끊기면 다음 확인 전까지 제외
+        if exception_context.is_disconnect:
+            self.mark_down(str(exception_context.original_exception))
+
+    def mark_down(self, reason: str) -> None:
+        if self.healthy:
+            logger.warning("읽기 복제본 제외 (%s): %s", self.engine.url.host, reason)
+        self.healthy = False
+        self.error = reason
+        self.checked_at = time.monotonic()
+
+    def refresh(self, check_seconds: float, max_lag_seconds: float) -> None:
+        """확인 주기가 지났으면 복제 지연을 다시 조회 (동시에 한 호출만 조회하고 나머지는 이전 상태 사용)"""
+        if time.monotonic() - self.checked_at < check_seconds:
+            return
+        if not self._checking.acquire(blocking=False):
+            return
+        try:
+            with self.engine.connect() as conn:
+                lag = float(conn.execute(REPLICATION_LAG_SQL).scalar())
+        except Exception as error:
+            self.mark_down(str(error))
+            return
+        finally:
+            self._checking.release()
+        self.lag_seconds = lag
+        if lag > max_lag_seconds:
+            self.mark_down(f"복제 지연 {lag:.1f}초")
+            return
+        self.healthy = True
+        self.error = None
+        self.checked_at = time.monotonic()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "host": self.engine.url.host,
+            "healthy": self.healthy,
+            "lag_seconds": self.lag_seconds,
+            "error": self.error,
+        }
+
+
+class ReplicaSet:
+    """읽기 복제본 목록 (정상인 복제본을 돌아가며 사용)"""
+
+    def __init__(self, engines: List[Engine], max_lag_seconds: float, check_seconds: float):
+        self.replicas = [Replica(engine) for engine in engines]
+        self.max_lag_seconds = max_lag_seconds
+        self.check_seconds = check_seconds
+        self._counter = itertools.count()
+
+    def pick(self) -> Optional[Engine]:
+        """쓸 수 있는 복제본 엔진 (없으면 None → primary 사용)"""
+        for replica in self.replicas:
+            replica.refresh(self.check_seconds, self.max_lag_seconds)
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)].engine
+
+    def status(self) -> List[Dict[str, Any]]:
+        return [replica.status() for replica in self.replicas]
+
+
+def _is_plain_read(clause: Any) -> bool:
+    return (
+        clause is not None
+        and not isinstance(clause, UpdateBase)
+        and getattr(clause, "_for_update_arg", None) is None
+    )
+
+
+class RoutingSession(Session):
+    """읽기 전용 요청의 SELECT는 복제본으로, 나머지는 bind(primary)로 보내는 세션
+
+    AsyncSession에서도 sync_session_class로 쓸 수 있습니다 (복제본은 AsyncEngine.sync_engine).
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if _read_only.get() and not self._flushing and _is_plain_read(clause):
+            engine = self._replica_engine()
+            if engine is not None:
+                return engine
+        if self.bind is None and PRIMARY in self.info:
+            self.bind = self.info[PRIMARY]()
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def _replica_engine(self) -> Optional[Engine]:
+        if _PICKED_REPLICA not in self.info:
+            replicas = self.info.get(REPLICAS)
+            replica_set = replicas() if replicas else None
+            self.info[_PICKED_REPLICA] = replica_set.pick() if replica_set else None
+        return self.info[_PICKED_REPLICA]
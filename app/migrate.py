@@ -0,0 +1,492 @@
+"""스키마 마이그레이션 (migrations/NNNN_이름.up.sql, NNNN_이름.down.sql, NNNN_이름.py)
+
+사용법:
+    python -m app.migrate status
+    python -m app.migrate up                # 적용하지 않은 마이그레이션 모두 적용
+    python -m app.migrate up --to 5
+    python -m app.migrate down              # 마지막 마이그레이션 하나 되돌리기
+    python -m app.migrate down --to 3
+    python -m app.migrate stamp 6           # DDL 없이 버전만 기록 (create_all/psql로 이미 적용한 DB)
+
+적용한 버전은 schema_version 테이블에 기록합니다.
+- SQL 마이그레이션은 파일 전체와 버전 기록을 한 트랜잭션에서 실행합니다.
+- CONCURRENTLY가 있는 파일(CREATE/DROP INDEX CONCURRENTLY)은 트랜잭션 안에서 실행할 수 없으므로
+  문장마다 따로(autocommit) 실행하고, 모두 성공한 뒤 버전을 기록합니다.
+  중간에 실패하면 앞 문장은 반영된 채로 남으므로 IF NOT EXISTS / IF EXISTS로 다시 실행할 수 있게 작성하세요.
+  실패로 남은 INVALID 인덱스는 다시 실행할 때 지우고 새로 만듭니다.
+- 파이썬 마이그레이션(NNNN_이름.py)은 up(ctx), down(ctx) 함수를 정의합니다.
+  큰 테이블(time_vote 등) 백필은 ctx.backfill로 나눠 실행해 배치마다 커밋합니다 (긴 트랜잭션/행 잠금 방지).
+
+서버 시작 시에는 check_schema_version으로 버전만 확인하고 DDL은 실행하지 않습니다.
+"""
+import argparse
+import importlib.util
+import logging
+import re
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import NullPool
+
+logger = logging.getLogger("app.migrate")
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+
+VERSION_TABLE = "schema_version"
+CREATE_VERSION_TABLE = (
+    "CREATE TABLE IF NOT EXISTS schema_version ("
+    "version INTEGER PRIMARY KEY, "
+    "name VARCHAR(255) NOT NULL, "
+    "applied_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT (now() AT TIME ZONE 'UTC'))"
+)
+
+# 동시에 두 곳(예: 배포 두 건)에서 마이그레이션하지 않도록 잡는 pg_advisory_lock 키
+ADVISORY_LOCK_KEY = 4_201_025
+
+# SCHEMA_VERSION_CHECK 값
+CHECK_OFF = "off"
+CHECK_WARN = "warn"
+CHECK_STRICT = "strict"
+CHECK_MODES = (CHECK_OFF, CHECK_WARN, CHECK_STRICT)
+
+_FILE_NAME = re.compile(r"^(\d{4})_(\w+?)\.(up\.sql|down\.sql|py)$")
+_CONCURRENTLY = re.compile(r"\bCONCURRENTLY\b", re.IGNORECASE)
+_CREATE_INDEX_CONCURRENTLY = re.compile(
+    r"^CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)", re.IGNORECASE
+)
+_DOLLAR_TAG = re.compile(r"\$(\w*)\$")
+
+
+class MigrationError(RuntimeError):
+    """마이그레이션 파일 구성이나 적용 순서가 잘못된 경우"""
+
+
+@dataclass
+class Migration:
+    version: int
+    name: str
+    up_sql: Optional[Path] = None
+    down_sql: Optional[Path] = None
+    script: Optional[Path] = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.version:04d}_{self.name}"
+
+
+def discover(directory: Path = MIGRATIONS_DIR) -> List[Migration]:
+    """마이그레이션 파일 목록 (버전 순)"""
+    migrations: Dict[int, Migration] = {}
+    for path in sorted(directory.iterdir()):
+        match = _FILE_NAME.match(path.name)
+        if not match:
+            continue
+        version, name, kind = int(match.group(1)), match.group(2), match.group(3)
+        migration = migrations.setdefault(version, Migration(version, name))
+        if migration.name != name:
+            raise MigrationError(f"버전 {version:04d}의 파일 이름이 서로 다릅니다: {migration.name}, {name}")
+        if kind == "up.sql":
+            migration.up_sql = path
+        elif kind == "down.sql":
+            migration.down_sql = path
+        else:
+            migration.script = path
+    for migration in migrations.values():
+        if migration.script is not None and (migration.up_sql or migration.down_sql):
+            raise MigrationError(f"{migration.label}: .py와 .sql 마이그레이션을 함께 둘 수 없습니다.")
+        if migration.script is None and migration.up_sql is None:
+            raise MigrationError(f"{migration.label}: up 파일이 없습니다.")
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def latest_version(directory: Path = MIGRATIONS_DIR) -> Optional[int]:
+    """마이그레이션 파일의 최신 버전 (파일이 없으면 None)"""
+    if not directory.is_dir():
+        return None
+    versions = [int(match.group(1)) for match in (_FILE_NAME.match(path.name) for path in directory.iterdir()) if match]
+    return max(versions) if versions else None
+
+
+def split_statements(sql: str) -> List[str]:
+    """SQL 파일을 문장 단위로 나눔 (주석 제거, 문자열/식별자/$$ 안의 세미콜론은 무시)"""
+    statements = []
+    current: List[str] = []
+    i = 0
+    while i < len(sql):
+        char = sql[i]
+        if sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = len(sql) if end == -1 else end
+            continue
+        if sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            i = len(sql) if end == -1 else end + 2
+            current.append(" ")
+            continue
+        if char in ("'", '"'):
+            end = i + 1
+            while end < len(sql):
+                if sql[end] == char:
+                    # '' / "" 는 따옴표 문자 자체
+                    if sql.startswith(char * 2, end):
+                        end += 2
+                        continue
+                    break
+                end += 1
+            current.append(sql[i:end + 1])
+            i = end + 1
+            continue
+        if char == "$":
+            tag = _DOLLAR_TAG.match(sql, i)
+            if tag:
+                end = sql.find(tag.group(0), tag.end())
+                end = len(sql) if end == -1 else end + len(tag.group(0))
+                current.append(sql[i:end])
+                i = end
+                continue
+        if char == ";":
+            statements.append("".join(current).strip())
+            current = []
+        else:
+            current.append(char)
+        i += 1
+    statements.append("".join(current).strip())
+    return [statement for statement in statements if statement]
+
+
+@contextmanager
+def _transaction(conn: Connection) -> Iterator[None]:
+    """autocommit 연결에서 명시적 트랜잭션"""
+    conn.exec_driver_sql("BEGIN")
+    try:
+        yield
+    except BaseException:
+        conn.exec_driver_sql("ROLLBACK")
+        raise
+    conn.exec_driver_sql("COMMIT")
+
+
+class MigrationContext:
+    """파이썬 마이그레이션의 up(ctx)/down(ctx)에 전달되는 실행 도구
+
+    연결은 autocommit이므로 execute는 문장마다 커밋됩니다. 여러 문장을 묶으려면 `with ctx.transaction():`
+    """
+
+    def __init__(self, conn: Connection, batch_sleep: float = 0.0):
+        self.conn = conn
+        self.batch_sleep = batch_sleep
+
+    def execute(self, sql: str, params: Optional[Dict[str, Any]] = None):
+        return self.conn.execute(text(sql), params or {})
+
+    def transaction(self):
+        return _transaction(self.conn)
+
+    def execute_concurrently(self, sql: str) -> None:
+        """CREATE/DROP INDEX CONCURRENTLY 등 트랜잭션 밖에서 실행할 문장들 (SQL 마이그레이션의 온라인 실행과 동일)"""
+        _run_online(self.conn, split_statements(sql))
+
+    def backfill(
+        self,
+        sql: str,
+        table: str,
+        key: str = "id",
+        where: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """table을 key 순서로 batch_size행씩 나눠 sql을 실행하고 배치마다 커밋 (반영된 행 수 반환)
+
+        sql은 이번 배치의 key 목록을 :ids로 받습니다. where를 주면 그 조건에 맞는 행만 배치에 넣습니다.
+            ctx.backfill(
+                "UPDATE time_vote SET slot_count = cardinality(time_list) WHERE id = ANY(:ids)",
+                table="time_vote",
+                where="slot_count IS NULL",
+            )
+        배치 경계는 key 기준(keyset)으로 찾으므로 앞 배치를 다시 훑지 않습니다.
+        중간에 실패해도 커밋한 배치는 남으므로 sql은 다시 실행해도 결과가 같아야 합니다.
+        """
+        condition = f" AND ({where})" if where else ""
+        first_batch = text(f"SELECT {key} FROM {table} WHERE TRUE{condition} ORDER BY {key} LIMIT :limit")
+        next_batch = text(f"SELECT {key} FROM {table} WHERE {key} > :after{condition} ORDER BY {key} LIMIT :limit")
+        total = 0
+        after = None
+        while True:
+            if after is None:
+                rows = self.conn.execute(first_batch, {"limit": batch_size})
+            else:
+                rows = self.conn.execute(next_batch, {"after": after, "limit": batch_size})
+            ids = [row[0] for row in rows]
+            if not ids:
+                break
+            with self.transaction():
+                result = self.conn.execute(text(sql), {"ids": ids})
+            total += max(result.rowcount, 0)
+            after = ids[-1]
+            logger.info("%s 백필: %d행 반영 (마지막 %s=%s)", table, total, key, after)
+            if len(ids) < batch_size:
+                break
+            if self.batch_sleep:
+                time.sleep(self.batch_sleep)
+        return total
+
+
+def _drop_invalid_index(conn: Connection, name: str) -> None:
+    """CREATE INDEX CONCURRENTLY가 실패하면 INVALID 인덱스가 남아 IF NOT EXISTS가 건너뛰므로 먼저 삭제"""
+    invalid = conn.execute(
+        text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND pg_table_is_visible(c.oid) AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).first()
+    if invalid:
+        logger.warning("INVALID 인덱스 %s를 삭제하고 다시 만듭니다.", name)
+        conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def _run_sql(conn: Connection, path: Path, record) -> None:
+    statements = split_statements(path.read_text(encoding="utf-8"))
+    if not any(_CONCURRENTLY.search(statement) for statement in statements):
+        with _transaction(conn):
+            for statement in statements:
+                conn.exec_driver_sql(statement)
+            record()
+        return
+    # 온라인 작업: 문장마다 따로 실행
+    _run_online(conn, statements)
+    record()
+
+
+def _run_online(conn: Connection, statements: List[str]) -> None:
+    """CONCURRENTLY 문장을 트랜잭션 없이 하나씩 실행 (실패로 남은 INVALID 인덱스는 먼저 삭제)"""
+    for statement in statements:
+        index = _CREATE_INDEX_CONCURRENTLY.match(statement)
+        if index:
+            _drop_invalid_index(conn, index.group(1))
+        conn.exec_driver_sql(statement)
+
+
+def _load_script(path: Path):
+    spec = importlib.util.spec_from_file_location(f"migrations.{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _applied(conn: Connection) -> Dict[int, datetime]:
+    rows = conn.execute(text("SELECT version, applied_at FROM schema_version ORDER BY version"))
+    return {version: applied_at for version, applied_at in rows}
+
+
+def _record(conn: Connection, migration: Migration):
+    def record():
+        conn.execute(
+            text("INSERT INTO schema_version (version, name) VALUES (:version, :name)"),
+            {"version": migration.version, "name": migration.name},
+        )
+    return record
+
+
+def _unrecord(conn: Connection, migration: Migration):
+    def unrecord():
+        conn.execute(text("DELETE FROM schema_version WHERE version = :version"), {"version": migration.version})
+    return unrecord
+
+
+def apply(conn: Connection, migration: Migration, batch_sleep: float = 0.0) -> None:
+    """마이그레이션 하나 적용"""
+    started = time.perf_counter()
+    logger.info("적용: %s", migration.label)
+    if migration.script is not None:
+        _load_script(migration.script).up(MigrationContext(conn, batch_sleep))
+        _record(conn, migration)()
+    else:
+        _run_sql(conn, migration.up_sql, _record(conn, migration))
+    logger.info("완료: %s (%.1f초)", migration.label, time.perf_counter() - started)
+
+
+def revert(conn: Connection, migration: Migration, batch_sleep: float = 0.0) -> None:
+    """마이그레이션 하나 되돌리기"""
+    logger.info("되돌리기: %s", migration.label)
+    if migration.script is not None:
+        module = _load_script(migration.script)
+        if not hasattr(module, "down"):
+            raise MigrationError(f"{migration.label}: down 함수가 없어 되돌릴 수 없습니다.")
+        module.down(MigrationContext(conn, batch_sleep))
+        _unrecord(conn, migration)()
+    elif migration.down_sql is None:
+        raise MigrationError(f"{migration.label}: down 파일이 없어 되돌릴 수 없습니다.")
+    else:
+        _run_sql(conn, migration.down_sql, _unrecord(conn, migration))
+
+
+def upgrade(conn: Connection, migrations: List[Migration], target: Optional[int] = None, batch_sleep: float = 0.0) -> int:
+    """target 버전까지 적용하지 않은 마이그레이션을 순서대로 적용 (적용한 개수 반환)"""
+    applied = _applied(conn)
+    pending = [m for m in migrations if m.version not in applied and (target is None or m.version <= target)]
+    if pending and applied and pending[0].version < max(applied):
+        raise MigrationError(
+            f"{pending[0].label}이 이미 적용된 버전 {max(applied):04d}보다 앞섭니다. 파일 번호를 다시 매기세요."
+        )
+    for migration in pending:
+        apply(conn, migration, batch_sleep)
+    return len(pending)
+
+
+def downgrade(conn: Connection, migrations: List[Migration], target: Optional[int] = None, batch_sleep: float = 0.0) -> int:
+    """target 버전보다 뒤의 마이그레이션을 역순으로 되돌림 (target이 없으면 마지막 하나, 되돌린 개수 반환)"""
+    applied = _applied(conn)
+    by_version = {m.version: m for m in migrations}
+    unknown = [version for version in applied if version not in by_version]
+    if unknown:
+        raise MigrationError(f"파일이 없는 적용 버전이 있습니다: {', '.join(f'{v:04d}' for v in unknown)}")
+    versions = sorted(applied, reverse=True)
+    if target is None:
+        versions = versions[:1]
+    else:
+        versions = [version for version in versions if version > target]
+    for version in versions:
+        revert(conn, by_version[version], batch_sleep)
+    return len(versions)
+
+
+def stamp(conn: Connection, migrations: List[Migration], target: int) -> None:
+    """DDL을 실행하지 않고 target 버전까지 적용된 것으로 기록"""
+    if target not in {m.version for m in migrations}:
+        raise MigrationError(f"버전 {target:04d}의 마이그레이션 파일이 없습니다.")
+    applied = _applied(conn)
+    with _transaction(conn):
+        conn.execute(text("DELETE FROM schema_version WHERE version > :target"), {"target": target})
+        for migration in migrations:
+            if migration.version <= target and migration.version not in applied:
+                _record(conn, migration)()
+
+
+def current_version(conn: Connection) -> Optional[int]:
+    """DB에 기록된 스키마 버전 (schema_version 테이블이 없거나 비어 있으면 None)"""
+    if conn.execute(text("SELECT to_regclass('schema_version')")).scalar() is None:
+        return None
+    return conn.execute(text("SELECT max(version) FROM schema_version")).scalar()
+
+
+def check_schema_version(engine: Engine, mode: str = CHECK_WARN) -> Dict[str, Any]:
+    """서버 시작 시 DB 스키마 버전이 마이그레이션 파일의 최신 버전과 같은지 확인 (DDL은 실행하지 않음)
+
+    warn: 다르면 경고 로그만 남김, strict: 다르거나 확인할 수 없으면 RuntimeError, off: 확인하지 않음
+    """
+    if mode not in CHECK_MODES:
+        raise ValueError(f"지원하지 않는 SCHEMA_VERSION_CHECK입니다: {mode} (off | warn | strict)")
+    status: Dict[str, Any] = {"expected": latest_version(), "current": None, "ok": None}
+    if mode == CHECK_OFF or status["expected"] is None:
+        return status
+    try:
+        with engine.connect() as conn:
+            status["current"] = current_version(conn)
+    except Exception as error:
+        if mode == CHECK_STRICT:
+            raise
+        logger.warning("스키마 버전을 확인하지 못했습니다: %s", error)
+        status["error"] = str(error)
+        return status
+    status["ok"] = status["current"] == status["expected"]
+    if not status["ok"]:
+        message = (
+            f"DB 스키마 버전({status['current']})이 마이그레이션 최신 버전({status['expected']})과 다릅니다. "
+            "`python -m app.migrate up`을 실행하세요."
+        )
+        if mode == CHECK_STRICT:
+            raise RuntimeError(message)
+        logger.warning(message)
+    return status
+
+
+@contextmanager
+def connect(url: str, lock_timeout: str) -> Iterator[Connection]:
+    """마이그레이션용 연결 (autocommit, 풀 없음, advisory lock으로 동시 실행 방지)"""
+    from app.database import db_driver
+    from app.db_driver import build_connect_args, driver_url
+
+    engine = create_engine(
+        driver_url(url, db_driver),
+        connect_args=build_connect_args(db_driver),
+        poolclass=NullPool,
+        isolation_level="AUTOCOMMIT",
+    )
+    try:
+        with engine.connect() as conn:
+            # DDL이 오래 실행 중인 트랜잭션 뒤에서 잠금을 기다리며 다른 요청까지 막지 않도록 lock_timeout 설정
+            # 인덱스 생성/백필은 오래 걸릴 수 있으므로 statement_timeout은 끔
+            conn.execute(text("SELECT set_config('lock_timeout', :value, false)"), {"value": lock_timeout})
+            conn.exec_driver_sql("SET statement_timeout = 0")
+            if not conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": ADVISORY_LOCK_KEY}).scalar():
+                raise MigrationError("다른 곳에서 마이그레이션이 실행 중입니다.")
+            try:
+                conn.exec_driver_sql(CREATE_VERSION_TABLE)
+                yield conn
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY})
+    finally:
+        engine.dispose()
+
+
+def print_status(conn: Connection, migrations: List[Migration]) -> None:
+    applied = _applied(conn)
+    current = max(applied) if applied else None
+    print(f"현재 버전: {'-' if current is None else f'{current:04d}'} / 최신: {migrations[-1].version:04d}")
+    print(f"{'migration':<45} {'kind':<8} {'applied_at':<20}")
+    print("=" * 75)
+    for migration in migrations:
+        kind = "py" if migration.script else "sql"
+        applied_at = applied.get(migration.version)
+        state = f"{applied_at:%Y-%m-%d %H:%M:%S}" if applied_at else "(대기)"
+        print(f"{migration.label:<45} {kind:<8} {state:<20}")
+    known = {m.version for m in migrations}
+    for version in sorted(set(applied) - known):
+        print(f"{version:04d} (파일 없음)")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.migrate", description="스키마 마이그레이션")
+    parser.add_argument("--database-url", default=None, help="기본값: 설정의 DATABASE_URL (primary)")
+    parser.add_argument("--lock-timeout", default="5s", help="DDL 잠금 대기 한도 (0이면 무제한)")
+    parser.add_argument("--batch-sleep", type=float, default=0.0, help="백필 배치 사이 대기 시간 (초)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="적용 현황")
+    up = commands.add_parser("up", help="적용하지 않은 마이그레이션 적용")
+    up.add_argument("--to", type=int, default=None, help="이 버전까지만 적용")
+    down = commands.add_parser("down", help="마이그레이션 되돌리기 (기본: 마지막 하나)")
+    down.add_argument("--to", type=int, default=None, help="이 버전만 남기고 뒤의 버전을 모두 되돌림")
+    stamp_parser = commands.add_parser("stamp", help="DDL 없이 버전만 기록")
+    stamp_parser.add_argument("version", type=int)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    if args.database_url is None:
+        from app.database import base_url
+        args.database_url = base_url
+
+    migrations = discover()
+    try:
+        with connect(args.database_url, args.lock_timeout) as conn:
+            if args.command == "up":
+                count = upgrade(conn, migrations, args.to, args.batch_sleep)
+                print(f"{count}개 적용")
+            elif args.command == "down":
+                count = downgrade(conn, migrations, args.to, args.batch_sleep)
+                print(f"{count}개 되돌림")
+            elif args.command == "stamp":
+                stamp(conn, migrations, args.version)
+            print_status(conn, migrations)
+    except MigrationError as error:
+        sys.exit(f"[실패] {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from app.models.meeting import Meeting
 from app.models.participant import Participant
 from app.models.meeting_time_candidate import MeetingTimeCandidate
 from app.models.time_vote import TimeVote
+from app.models.time_vote_slot import TimeVoteSlot
 from app.models.place import Place
 from app.models.place_candidate import PlaceCandidate
 from app.models.place_vote import PlaceVote
@@ -14,6 +15,7 @@ __all__ = [
     "Participant",
     "MeetingTimeCandidate",
     "TimeVote",
+    "TimeVoteSlot",
     "Place",
     "PlaceCandidate",
     "PlaceVote",
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Enum, Integer
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Enum, Integer, Index, text
 from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSON
 from sqlalchemy.orm import relationship
 import uuid
@@ -6,6 +6,7 @@ from datetime import datetime
 import enum
 
 from app.database import Base
+from app.models.soft_delete import SoftDeleteMixin
 
 
 class LocationChoiceType(str, enum.Enum):
@@ -15,9 +16,17 @@ class LocationChoiceType(str, enum.Enum):
     PREFERENCE_SUBWAY = "preference_subway"
 
 
-class Meeting(Base):
+class Meeting(SoftDeleteMixin, Base):
     """모임 모델"""
     __tablename__ = "meeting"
+    __table_args__ = (
+        # 목록 커서 페이지네이션 정렬 키 (created_at, id), 삭제되지 않은 모임만 (부분 인덱스)
+        Index("ix_meeting_active_created_at_id", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index(
+            "ix_meeting_active_creator_created_at_id", "creator_id", "created_at", "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     name = Column(String(255), nullable=False)  # 모임 이름
@@ -44,10 +53,12 @@ class Meeting(Base):
     confirmed_location = Column(String(255), nullable=True)  # 확정된 장소
     confirmed_at = Column(DateTime, nullable=True)  # 주최자가 "확정하기!" 누른 시간
     
+    # 투표/참가자/시간 후보가 바뀔 때마다 1씩 증가 (집계 조회의 ETag, 롱 폴링 기준)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # 메타 정보
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    deleted_at = Column(DateTime, nullable=True)  # 소프트 삭제 시간
 
     # 관계
     creator = relationship("User", back_populates="meetings")
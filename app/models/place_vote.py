@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -10,6 +10,9 @@ from app.database import Base
 class PlaceVote(Base):
     """장소 투표 모델"""
     __tablename__ = "place_vote"
+    __table_args__ = (
+        UniqueConstraint('participant_id', 'time_candidate_id', name='uq_participant_place_time_candidate'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     participant_id = Column(UUID(as_uuid=True), ForeignKey("participant.id"), nullable=False, index=True)
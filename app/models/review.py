@@ -1,18 +1,31 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
 import uuid
 from datetime import datetime
 
 from app.database import Base
+from app.models.soft_delete import SoftDeleteMixin
 
 
-class Review(Base):
+class Review(SoftDeleteMixin, Base):
     """모임 리뷰 모델"""
     __tablename__ = "review"
+    __table_args__ = (
+        # 목록 커서 페이지네이션 정렬 키 (created_at, id), 삭제되지 않은 리뷰만 (부분 인덱스)
+        Index("ix_review_active_created_at_id", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index(
+            "ix_review_active_meeting_created_at_id", "meeting_id", "created_at", "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_review_active_user_created_at_id", "user_id", "created_at", "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    meeting_id = Column(UUID(as_uuid=True), ForeignKey("meeting.id"), nullable=False)  # 모임 ID
+    meeting_id = Column(UUID(as_uuid=True), ForeignKey("meeting.id"), nullable=False, index=True)  # 모임 ID
     user_id = Column(Integer, ForeignKey("user.id"), nullable=False)  # 리뷰 작성자 ID
     
     rating = Column(Integer, nullable=True)  # 평가 점수
@@ -23,7 +36,6 @@ class Review(Base):
     # 메타 정보
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    deleted_at = Column(DateTime, nullable=True)  # 소프트 삭제 시간
 
     # 관계
     meeting = relationship("Meeting", back_populates="reviews")
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, DateTime, event
+from sqlalchemy.orm import Session, with_loader_criteria
+
+# 삭제된 행도 조회할 때 쓰는 실행 옵션 (관리자용 조회)
+#   db.query(Meeting).execution_options(include_deleted=True)
+INCLUDE_DELETED = "include_deleted"
+
+
+class SoftDeleteMixin:
+    """소프트 삭제 모델 공통 컬럼
+
+    이 믹스인을 쓰는 모델은 모든 ORM SELECT(관계 lazy load 포함)와 UPDATE에
+    deleted_at IS NULL 조건이 자동으로 붙습니다.
+    """
+    deleted_at = Column(DateTime, nullable=True)  # 소프트 삭제 시간
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(execute_state) -> None:
+    if execute_state.execution_options.get(INCLUDE_DELETED, False):
+        return
+    if execute_state.is_update or (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                SoftDeleteMixin,
+                lambda cls: cls.deleted_at.is_(None),
+                include_aliases=True,
+            )
+        )
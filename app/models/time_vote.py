@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Text, UniqueConstraint
+from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Text, UniqueConstraint, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
 import uuid
@@ -19,6 +19,7 @@ class TimeVote(Base):
     meeting_id = Column(UUID(as_uuid=True), ForeignKey("meeting.id"), nullable=False, index=True)
     time_candidate_id = Column(UUID(as_uuid=True), ForeignKey("meeting_time_candidate.id"), nullable=False, index=True)
     time_list = Column(ARRAY(Text), nullable=False)  # 투표한 시간 목록 (예: ["2025-11-01 02:00", "2025-11-01 03:00"])
+    availability_bitmap = Column(LargeBinary, nullable=True)  # 모임 available_times 격자 기준 가능 시간 비트맵 (TIME_VOTE_BITMAP 설정 시)
     
     # 투표 정보
     is_available = Column(Boolean, nullable=False, default=True)  # 가능 여부 (True: 가능, False: 불가능)
@@ -32,4 +33,5 @@ class TimeVote(Base):
     participant = relationship("Participant", back_populates="time_votes")
     meeting = relationship("Meeting")
     time_candidate = relationship("MeetingTimeCandidate", back_populates="votes")
+    slots = relationship("TimeVoteSlot", back_populates="time_vote", cascade="all, delete-orphan", passive_deletes=True)
 
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+
+
+class TimeVoteSlot(Base):
+    """시간 투표 슬롯 모델 (TimeVote.time_list 중 가능한 시간을 한 행씩 정규화)"""
+    __tablename__ = "time_vote_slot"
+    __table_args__ = (
+        # "슬롯 X에 가능한 사람" / "슬롯별 인원" 조회를 인덱스만으로 처리
+        Index("ix_time_vote_slot_candidate_slot", "time_candidate_id", "slot", "participant_id"),
+    )
+
+    time_vote_id = Column(UUID(as_uuid=True), ForeignKey("time_vote.id", ondelete="CASCADE"), primary_key=True)
+    slot = Column(DateTime, primary_key=True)  # 투표한 시간 (예: 2025-11-01 02:00)
+    time_candidate_id = Column(UUID(as_uuid=True), ForeignKey("meeting_time_candidate.id", ondelete="CASCADE"), nullable=False)
+    participant_id = Column(UUID(as_uuid=True), ForeignKey("participant.id", ondelete="CASCADE"), nullable=False)
+
+    # 관계
+    time_vote = relationship("TimeVote", back_populates="slots")
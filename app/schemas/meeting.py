@@ -4,6 +4,10 @@ from uuid import UUID
 from typing import Optional, List
 
 from app.schemas.user import UserResponse
+from app.schemas.participant import ParticipantResponse
+from app.schemas.meeting_time_candidate import MeetingTimeCandidateWithVotes
+from app.schemas.time_vote import TimeVoteResponse
+from app.schemas.place_candidate import PlaceCandidateResponse
 from app.models.meeting import LocationChoiceType
 
 
@@ -67,3 +71,22 @@ class MeetingResponse(MeetingBase):
     class Config:
         orm_mode = True
         use_enum_values = True
+
+
+MeetingTimeCandidateWithVotes.update_forward_refs(TimeVoteResponse=TimeVoteResponse)
+
+
+class PlaceVoteTally(BaseModel):
+    """시간 후보별 장소 투표 집계 스키마"""
+    time_candidate_id: UUID
+    available_count: int
+    unavailable_count: int
+
+
+class MeetingDashboardResponse(BaseModel):
+    """모임 화면 전체 데이터 응답 스키마 (모임, 참가자, 시간 후보/투표, 장소 후보, 장소 투표 집계)"""
+    meeting: MeetingResponse
+    participants: List[ParticipantResponse]
+    time_candidates: List[MeetingTimeCandidateWithVotes]
+    place_candidates: List[PlaceCandidateResponse]
+    place_vote_tallies: List[PlaceVoteTally]
@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 from datetime import datetime
 from uuid import UUID
-from typing import Optional, List, Dict, TYPE_CHECKING
+from typing import Optional, List, Dict, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.schemas.time_vote import TimeVoteResponse
@@ -31,3 +31,60 @@ class MeetingTimeCandidateWithVotes(MeetingTimeCandidateResponse):
     """투표 정보를 포함한 시간 후보 응답 스키마"""
     votes: Optional[List["TimeVoteResponse"]] = None
 
+
+
+class SlotRecommendation(BaseModel):
+    """추천 시간 스키마"""
+    slot: str  # 시간 (예: "2025-11-01 02:00")
+    attendee_count: int  # 참석 가능 인원
+    attendees: List[UUID]  # 참석 가능한 참가자 ID
+    missing: List[UUID]  # 참석할 수 없거나 응답하지 않은 참가자 ID
+
+
+class TimeRecommendationResponse(BaseModel):
+    """모임 시간 추천 응답 스키마"""
+    meeting_id: UUID
+    participant_count: int
+    recommendations: List[SlotRecommendation]
+
+
+class TimeWindow(BaseModel):
+    """연속 시간대 스키마"""
+    start: str  # 시작 시간 (예: "2025-11-01 18:00")
+    end: str  # 종료 시간 (예: "2025-11-01 21:00")
+    attendee_count: int  # 시간대 전체에 참석 가능한 인원
+    attendees: List[UUID]
+    missing: List[UUID]
+
+
+class TimeWindowResponse(BaseModel):
+    """연속 시간대 추천 응답 스키마"""
+    meeting_id: UUID
+    duration_minutes: int
+    granularity_minutes: int
+    participant_count: int
+    windows: List[TimeWindow]
+
+
+class HeatmapParticipantRow(BaseModel):
+    """참가자별 히트맵 행 (bit i = i번째 칸 가능 여부, little-endian 비트 패킹 후 base64)"""
+    participant_id: UUID
+    bitmap: str
+
+
+class HeatmapResponse(BaseModel):
+    """날짜 × 시간대 가능 인원 히트맵 응답 스키마
+
+    counts는 행 우선(날짜 → 시간대) 순서이며,
+    encoding이 rle면 [값, 길이, 값, 길이, ...], uint16이면 little-endian uint16 배열의 base64입니다.
+    """
+    meeting_id: UUID
+    start_date: str  # 첫 번째 행의 날짜 (예: "2025-11-01")
+    days: int  # 행 수
+    columns: int  # 하루 시간대(열) 수
+    granularity_minutes: int
+    tz_offset_minutes: int
+    encoding: str
+    counts: Union[List[int], str]
+    max_count: int
+    participants: Optional[List[HeatmapParticipantRow]] = None
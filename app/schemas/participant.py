@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 from datetime import datetime
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
 
 
 class ParticipantBase(BaseModel):
@@ -35,3 +35,24 @@ class ParticipantResponse(ParticipantBase):
     class Config:
         orm_mode = True
 
+
+
+class ParticipantBulkItem(ParticipantBase):
+    """참가자 일괄 생성 항목 스키마"""
+    user_id: Optional[int] = None
+
+
+class ParticipantBulkCreate(BaseModel):
+    """한 모임에 참가자 여러 명 일괄 생성 스키마"""
+    meeting_id: UUID
+    participants: List[ParticipantBulkItem]
+
+
+class ParticipantBulkDelete(BaseModel):
+    """참가자 일괄 삭제 스키마"""
+    ids: List[UUID]
+
+
+class ParticipantBulkResult(BaseModel):
+    """참가자 일괄 삭제 결과 스키마"""
+    count: int
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -36,3 +36,18 @@ class PlaceResponse(PlaceBase):
     class Config:
         orm_mode = True
 
+
+
+class PlaceBulkUpdate(PlaceUpdate):
+    """장소 일괄 업데이트 항목 스키마 (None인 필드는 바꾸지 않음)"""
+    id: str
+
+
+class PlaceBulkDelete(BaseModel):
+    """장소 일괄 삭제 스키마"""
+    ids: List[str]
+
+
+class PlaceBulkResult(BaseModel):
+    """장소 일괄 수정/삭제 결과 스키마"""
+    count: int
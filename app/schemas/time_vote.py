@@ -1,14 +1,16 @@
 from pydantic import BaseModel
 from datetime import datetime
 from uuid import UUID
-from typing import List
+from typing import List, Optional
+
+from app.schemas.place_vote import PlaceVoteResponse
 
 
 class TimeVoteBase(BaseModel):
     """시간 투표 기본 스키마"""
     time_list: List[str]  # 투표한 시간 목록 (예: ["2025-11-01 02:00", "2025-11-01 03:00"])
     is_available: bool = True  # True: 가능, False: 불가능
-    memo: str | None = None  # 메모
+    memo: Optional[str] = None  # 메모
 
 
 class TimeVoteCreate(TimeVoteBase):
@@ -22,7 +24,7 @@ class TimeVoteUpdate(BaseModel):
     """시간 투표 업데이트 스키마"""
     time_list: List[str] | None = None
     is_available: bool | None = None
-    memo: str | None = None
+    memo: Optional[str] = None
 
 
 class TimeVoteResponse(TimeVoteBase):
@@ -37,3 +39,37 @@ class TimeVoteResponse(TimeVoteBase):
     class Config:
         orm_mode = True
 
+
+
+class MeetingAvailabilityResponse(BaseModel):
+    """모임 시간 격자 기준 가능 인원 집계 응답 스키마"""
+    slots: List[str]  # 모임 시간 격자 (available_times 정렬 순)
+    counts: List[int]  # 슬롯별 가능 인원
+    everyone_free: List[str]  # 투표한 모든 참가자가 가능한 시간
+    voter_count: int  # 투표한 참가자 수
+
+
+class TimeVoteBulkItem(TimeVoteBase):
+    """일괄 투표의 시간 투표 항목"""
+    time_candidate_id: UUID
+
+
+class PlaceVoteBulkItem(BaseModel):
+    """일괄 투표의 장소 투표 항목"""
+    time_candidate_id: UUID
+    is_available: bool = True
+    memo: Optional[str] = None
+
+
+class VoteBulkSubmit(BaseModel):
+    """참가자 한 명의 시간/장소 투표 일괄 제출 스키마"""
+    participant_id: UUID
+    meeting_id: UUID
+    time_votes: List[TimeVoteBulkItem] = []
+    place_votes: List[PlaceVoteBulkItem] = []
+
+
+class VoteBulkResponse(BaseModel):
+    """일괄 투표 응답 스키마"""
+    time_votes: List[TimeVoteResponse]
+    place_votes: List[PlaceVoteResponse]
@@ -0,0 +1,180 @@
+"""모임 가능 시간 분석
+
+참가자 i를 bit i로 두고, 슬롯마다 가능한 참가자 집합을 정수 비트셋으로 표현합니다.
+참석 인원은 popcount, 필수 참가자 포함 여부와 불참자 계산은 비트 연산으로 처리하므로
+50명 × 300슬롯 규모도 밀리초 단위로 계산됩니다.
+"""
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from app.services.slots import MAX_GRID_CELLS, SlotRangeTooLargeError, format_slot, parse_slot
+
+
+class AvailabilityIndex:
+    """슬롯별 가능 참가자 비트셋"""
+
+    def __init__(self, participant_ids: Sequence[UUID]):
+        self.participant_ids: List[UUID] = list(dict.fromkeys(participant_ids))
+        self._bit: Dict[UUID, int] = {pid: i for i, pid in enumerate(self.participant_ids)}
+        self.slot_masks: Dict[datetime, int] = {}
+        # 모임이 정한 후보 시간 (find_windows의 격자 범위, 투표 시간은 검증되지 않으므로 범위에 쓰지 않음)
+        self.candidate_slots: Set[datetime] = set()
+
+    @classmethod
+    def from_votes(
+        cls,
+        participant_ids: Sequence[UUID],
+        votes: Iterable[Tuple[UUID, Optional[Iterable[str]], bool]],
+        slots: Iterable[str] = (),
+    ) -> "AvailabilityIndex":
+        """(참가자 ID, time_list, is_available) 목록으로 인덱스 생성
+
+        slots에는 아무도 투표하지 않았어도 후보로 둘 시간(candidate_time 키, available_times)을 넘깁니다.
+        """
+        index = cls(participant_ids)
+        for slot in slots:
+            index.add_slot(slot)
+        for participant_id, time_list, is_available in votes:
+            if is_available:
+                index.add(participant_id, time_list or [])
+        return index
+
+    @property
+    def participant_count(self) -> int:
+        return len(self.participant_ids)
+
+    @property
+    def all_mask(self) -> int:
+        return (1 << len(self.participant_ids)) - 1
+
+    def add_slot(self, time_string: str) -> None:
+        parsed = parse_slot(time_string)
+        if parsed is not None:
+            self.slot_masks.setdefault(parsed, 0)
+            self.candidate_slots.add(parsed)
+
+    def add(self, participant_id: UUID, time_list: Iterable[str]) -> None:
+        """참가자의 가능 시간 추가 (모임 참가자가 아니면 무시)"""
+        bit = self._bit.get(participant_id)
+        if bit is None:
+            return
+        for time_string in time_list:
+            parsed = parse_slot(time_string)
+            if parsed is not None:
+                self.slot_masks[parsed] = self.slot_masks.get(parsed, 0) | (1 << bit)
+
+    def has_participant(self, participant_id: UUID) -> bool:
+        return participant_id in self._bit
+
+    def mask_of(self, participant_ids: Iterable[UUID]) -> int:
+        mask = 0
+        for participant_id in participant_ids:
+            mask |= 1 << self._bit[participant_id]
+        return mask
+
+    def members(self, mask: int) -> List[UUID]:
+        """비트셋 → 참가자 ID 목록"""
+        result = []
+        while mask:
+            low_bit = mask & -mask
+            result.append(self.participant_ids[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return result
+
+
+def recommend_slots(
+    index: AvailabilityIndex,
+    top_k: int = 5,
+    required: Iterable[UUID] = (),
+    min_attendance: int = 0,
+) -> List[dict]:
+    """참석 인원 순 상위 k개 시간 추천 (동률이면 이른 시간 우선)
+
+    Args:
+        index: 슬롯별 가능 참가자 비트셋
+        top_k: 반환할 추천 개수
+        required: 반드시 참석해야 하는 참가자 ID
+        min_attendance: 최소 참석 인원
+    """
+    required_mask = index.mask_of(required)
+    candidates = (
+        (slot, mask)
+        for slot, mask in index.slot_masks.items()
+        if mask & required_mask == required_mask and mask.bit_count() >= min_attendance
+    )
+    best = heapq.nsmallest(top_k, candidates, key=lambda item: (-item[1].bit_count(), item[0]))
+    return [
+        {
+            "slot": format_slot(slot),
+            "attendee_count": mask.bit_count(),
+            "attendees": index.members(mask),
+            "missing": index.members(index.all_mask & ~mask),
+        }
+        for slot, mask in best
+    ]
+
+
+def find_windows(
+    index: AvailabilityIndex,
+    duration_minutes: int,
+    granularity_minutes: int,
+    min_attendees: int = 1,
+    top_k: int = 5,
+    required: Iterable[UUID] = (),
+) -> List[dict]:
+    """duration_minutes 동안 연속으로 가능한 인원이 많은 시간대 상위 k개
+
+    모임 후보 시간의 처음부터 끝까지 granularity_minutes 간격의 격자를 만들고
+    (격자에 맞지 않거나 범위 밖인 투표 시간은 제외), 윈도우 크기 w마다 블록 단위 prefix/suffix AND를 미리 구해
+    각 윈도우의 참석 가능 집합을 suffix[i] & prefix[i+w-1] 한 번으로 계산합니다.
+    전체 비용은 격자 칸 수(후보 시간 범위 / 간격)에 선형이며 (van Herk/Gil-Werman 슬라이딩 윈도우),
+    칸 수가 MAX_GRID_CELLS를 넘으면 SlotRangeTooLargeError를 발생시킵니다.
+    """
+    if not index.candidate_slots:
+        return []
+    width = duration_minutes // granularity_minutes
+    step = timedelta(minutes=granularity_minutes)
+    start = min(index.candidate_slots)
+    size = (max(index.candidate_slots) - start) // step + 1
+    if size > MAX_GRID_CELLS:
+        raise SlotRangeTooLargeError()
+    if width > size:
+        return []
+
+    masks = [0] * size
+    for slot, mask in index.slot_masks.items():
+        offset, remainder = divmod(slot - start, step)
+        if not remainder and 0 <= offset < size:
+            masks[offset] = mask
+
+    prefix = [0] * size
+    suffix = [0] * size
+    for i in range(size):
+        prefix[i] = masks[i] if i % width == 0 else prefix[i - 1] & masks[i]
+    for i in range(size - 1, -1, -1):
+        is_block_end = (i + 1) % width == 0 or i == size - 1
+        suffix[i] = masks[i] if is_block_end else suffix[i + 1] & masks[i]
+
+    required_mask = index.mask_of(required)
+    windows = (
+        (i, suffix[i] & prefix[i + width - 1])
+        for i in range(size - width + 1)
+    )
+    candidates = (
+        (i, mask)
+        for i, mask in windows
+        if mask & required_mask == required_mask and mask.bit_count() >= min_attendees
+    )
+    best = heapq.nsmallest(top_k, candidates, key=lambda item: (-item[1].bit_count(), item[0]))
+    return [
+        {
+            "start": format_slot(start + step * i),
+            "end": format_slot(start + step * (i + width)),
+            "attendee_count": mask.bit_count(),
+            "attendees": index.members(mask),
+            "missing": index.members(index.all_mask & ~mask),
+        }
+        for i, mask in best
+    ]
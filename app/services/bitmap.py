@@ -0,0 +1,119 @@
+"""모임 시간 격자 기반 비트맵 인코딩
+
+모임의 available_times를 정렬한 순서를 슬롯 격자로 보고,
+참가자의 가능 시간을 격자 위의 비트맵(bit i = i번째 슬롯)으로 표현합니다.
+API는 기존처럼 시간 문자열 목록을 주고받고, 변환은 이 모듈에서만 합니다.
+"""
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from app.services.slots import format_slot, parse_slot
+
+
+def _normalize(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class SlotGrid:
+    """정렬된 슬롯 격자와 비트맵 변환/연산"""
+
+    def __init__(self, times: Optional[Iterable[datetime]]):
+        self.times: List[datetime] = sorted({_normalize(t) for t in times or []})
+        self._index: Dict[datetime, int] = {t: i for i, t in enumerate(self.times)}
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def byte_length(self) -> int:
+        return (len(self.times) + 7) // 8
+
+    @property
+    def full_mask(self) -> int:
+        return (1 << len(self.times)) - 1
+
+    def index_of(self, time_string: str) -> Optional[int]:
+        """시간 문자열의 격자 위치 (격자에 없으면 None)"""
+        parsed = parse_slot(time_string)
+        return self._index.get(parsed) if parsed is not None else None
+
+    def encode_mask(self, time_list: Iterable[str]) -> int:
+        """시간 문자열 목록 → 정수 비트마스크 (격자 밖의 시간은 무시)"""
+        mask = 0
+        for time_string in time_list:
+            index = self.index_of(time_string)
+            if index is not None:
+                mask |= 1 << index
+        return mask
+
+    def encode(self, time_list: Iterable[str]) -> bytes:
+        """시간 문자열 목록 → bytea 저장용 비트맵 (little-endian)"""
+        return self.to_bytes(self.encode_mask(time_list))
+
+    def to_bytes(self, mask: int) -> bytes:
+        return mask.to_bytes(self.byte_length, "little")
+
+    @staticmethod
+    def to_mask(bitmap: Optional[bytes]) -> int:
+        return int.from_bytes(bitmap, "little") if bitmap else 0
+
+    def decode(self, bitmap: Optional[bytes]) -> List[str]:
+        """비트맵 → 시간 문자열 목록"""
+        return self.mask_to_slots(self.to_mask(bitmap))
+
+    def mask_to_slots(self, mask: int) -> List[str]:
+        slots = []
+        while mask:
+            low_bit = mask & -mask
+            index = low_bit.bit_length() - 1
+            if index >= len(self.times):
+                break
+            slots.append(format_slot(self.times[index]))
+            mask ^= low_bit
+        return slots
+
+    def tally(self, masks: Iterable[int]) -> List[int]:
+        """슬롯별 가능 인원 수
+
+        비트 슬라이스 카운터(counters[j] = 인원 수의 j번째 비트)에 마스크를 더해
+        참가자 수 P에 대해 O(P log P)번의 정수 비트 연산으로 집계합니다.
+        """
+        counters: List[int] = []
+        for mask in masks:
+            carry = mask
+            for j, counter in enumerate(counters):
+                counters[j] = counter ^ carry
+                carry &= counter
+                if not carry:
+                    break
+            if carry:
+                counters.append(carry)
+
+        counts = [0] * len(self.times)
+        for j, counter in enumerate(counters):
+            weight = 1 << j
+            while counter:
+                low_bit = counter & -counter
+                index = low_bit.bit_length() - 1
+                if index < len(counts):
+                    counts[index] += weight
+                counter ^= low_bit
+        return counts
+
+    def intersect(self, masks: Iterable[int]) -> int:
+        """모두가 가능한 슬롯 마스크"""
+        result = self.full_mask
+        for mask in masks:
+            result &= mask
+            if not result:
+                break
+        return result
+
+    def everyone_free(self, masks: Iterable[int]) -> List[str]:
+        """모든 참가자가 가능한 시간 문자열 목록"""
+        masks = list(masks)
+        if not masks:
+            return []
+        return self.mask_to_slots(self.intersect(masks))
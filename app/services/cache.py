@@ -0,0 +1,115 @@
+"""프로세스 내 TTL + LRU 캐시 (동시 미스 병합)
+
+같은 키에 대한 동시 미스는 한 스레드만 loader를 실행하고 나머지는 그 결과를 기다립니다.
+loader 실행 중에 invalidate된 키는 결과를 돌려주기만 하고 캐시에 저장하지 않으므로,
+무효화 직전에 읽은 오래된 값이 다시 캐시되지 않습니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _InFlight:
+    """진행 중인 loader 실행 (결과를 기다리는 스레드와 공유)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.stale = False
+
+
+class TTLCache:
+    """키별 만료 시간이 있는 LRU 캐시"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, _InFlight] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """캐시된 값 반환, 없거나 만료되었으면 loader 결과를 저장 후 반환 (None도 캐시)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                self.misses += 1
+                in_flight = self._in_flight[key] = _InFlight()
+                leader = True
+
+        if not leader:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.value
+
+        try:
+            in_flight.value = loader()
+        except BaseException as error:
+            in_flight.error = error
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+                if in_flight.error is None and not in_flight.stale:
+                    self._store(key, in_flight.value)
+            in_flight.done.set()
+        return in_flight.value
+
+    def invalidate(self, key: Hashable) -> None:
+        """키 삭제 (진행 중인 loader 결과도 저장하지 않음)"""
+        with self._lock:
+            self.invalidations += 1
+            self._entries.pop(key, None)
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                in_flight.stale = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for in_flight in self._in_flight.values():
+                in_flight.stale = True
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+            }
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """잠금 안에서 호출"""
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,271 @@
+"""모임별 실시간 이벤트 (투표 집계 변경 push)
+
+crud에서 commit 전에 queue_event로 이벤트를 세션에 쌓아 두면
+commit이 성공한 뒤에만 발행되고, rollback되면 버려집니다.
+
+발행된 이벤트는 백엔드(EVENT_BACKEND)를 거쳐 각 인스턴스의 브로커로 전달되고,
+브로커가 모임별 구독자(SSE 연결)에게 나눠 줍니다.
+- 구독자 버퍼는 EVENT_BUFFER_SIZE개로 제한되며, 넘치면 reset 이벤트 후 연결을 끊습니다.
+- 모임별 최근 EVENT_HISTORY_SIZE개 이벤트를 보관해 재연결 시 Last-Event-ID 이후부터 이어 보냅니다.
+"""
+import asyncio
+from abc import ABC, abstractmethod
+import importlib
+import json
+import logging
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger("app.events")
+
+PENDING_EVENTS_KEY = "pending_meeting_events"
+RESET_EVENT = "reset"
+
+
+@dataclass
+class MeetingEvent:
+    """모임 이벤트 (seq는 모임별로 1씩 증가)"""
+    meeting_id: str
+    type: str
+    data: dict
+    seq: int = 0
+
+    def to_sse(self) -> str:
+        payload = json.dumps(self.data, default=str, ensure_ascii=False)
+        return f"id: {self.seq}\nevent: {self.type}\ndata: {payload}\n\n"
+
+
+class Subscription:
+    """SSE 연결 하나의 이벤트 버퍼 (구독한 이벤트 루프에서만 읽고 씀)"""
+
+    def __init__(self, meeting_id: str, loop: asyncio.AbstractEventLoop, buffer_size: int):
+        self.meeting_id = meeting_id
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.overflowed = False
+
+    def offer(self, meeting_event: MeetingEvent) -> None:
+        """버퍼에 이벤트 추가 (가득 차면 버퍼를 비우고 종료 표시(None)만 남김)"""
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(meeting_event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class EventBroker:
+    """프로세스 안의 모임별 구독자 관리와 이벤트 분배"""
+
+    def __init__(self, buffer_size: int = 100, history_size: int = 200, max_meetings: int = 1000):
+        self.buffer_size = buffer_size
+        self.history_size = history_size
+        self.max_meetings = max_meetings
+        self._lock = threading.Lock()
+        self._seq: Dict[str, int] = {}
+        self._history: "OrderedDict[str, Deque[MeetingEvent]]" = OrderedDict()
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+
+    def deliver(self, meeting_id: str, event_type: str, data: dict) -> MeetingEvent:
+        """이벤트에 시퀀스를 붙여 기록하고 구독자에게 전달 (어느 스레드에서든 호출 가능)"""
+        with self._lock:
+            seq = self._seq.get(meeting_id, 0) + 1
+            self._seq[meeting_id] = seq
+            meeting_event = MeetingEvent(meeting_id=meeting_id, type=event_type, data=data, seq=seq)
+            history = self._history.get(meeting_id)
+            if history is None:
+                history = self._history[meeting_id] = deque(maxlen=self.history_size)
+            history.append(meeting_event)
+            self._history.move_to_end(meeting_id)
+            self._evict()
+            subscribers = list(self._subscribers.get(meeting_id, ()))
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, meeting_event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힌 연결
+                self.unsubscribe(subscription)
+        return meeting_event
+
+    def subscribe(
+        self, meeting_id: str, last_seq: Optional[int] = None
+    ) -> Tuple[Subscription, List[MeetingEvent], bool]:
+        """구독 등록 후 (구독, 놓친 이벤트, 이어 받기 가능 여부) 반환
+
+        last_seq 이후 이벤트가 기록에 모두 남아 있지 않으면 이어 받기 불가(False)로,
+        클라이언트는 reset 이벤트를 받고 전체 상태를 다시 조회해야 합니다.
+        """
+        subscription = Subscription(meeting_id, asyncio.get_running_loop(), self.buffer_size)
+        with self._lock:
+            self._subscribers.setdefault(meeting_id, set()).add(subscription)
+            replay, complete = self._replay(meeting_id, last_seq)
+        return subscription, replay, complete
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.meeting_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.meeting_id]
+
+    def current_seq(self, meeting_id: str) -> int:
+        with self._lock:
+            return self._seq.get(meeting_id, 0)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def _replay(self, meeting_id: str, last_seq: Optional[int]) -> Tuple[List[MeetingEvent], bool]:
+        current = self._seq.get(meeting_id, 0)
+        if last_seq is None or last_seq == current:
+            return [], True
+        if last_seq > current:
+            # 다른 인스턴스/재시작 전의 시퀀스
+            return [], False
+        history = self._history.get(meeting_id, ())
+        if not history or history[0].seq > last_seq + 1:
+            return [], False
+        return [meeting_event for meeting_event in history if meeting_event.seq > last_seq], True
+
+    def _evict(self) -> None:
+        """구독자가 없는 오래된 모임의 기록부터 정리 (잠금 안에서 호출)"""
+        while len(self._history) > self.max_meetings:
+            for meeting_id in self._history:
+                if meeting_id not in self._subscribers:
+                    del self._history[meeting_id]
+                    self._seq.pop(meeting_id, None)
+                    break
+            else:
+                return
+
+
+class EventBackend(ABC):
+    """인스턴스 간 이벤트 전달 백엔드
+
+    여러 인스턴스로 배포할 때는 publish에서 외부 메시지 버스(Redis pub/sub, Postgres NOTIFY 등)로
+    보내고, 수신한 이벤트를 start에서 받은 deliver로 넘기는 백엔드를 구현해
+    EVENT_BACKEND="모듈경로:클래스명"으로 지정합니다.
+    publish를 구현하지 않은 클래스는 생성할 때(서버 시작 시) TypeError가 발생합니다.
+    """
+
+    def start(self, deliver: Callable[[str, str, dict], MeetingEvent]) -> None:
+        self._deliver = deliver
+
+    @abstractmethod
+    def publish(self, meeting_id: str, event_type: str, data: dict) -> None:
+        """이벤트를 모든 인스턴스의 deliver로 전달"""
+
+
+class MemoryBackend(EventBackend):
+    """단일 인스턴스용 백엔드 (같은 프로세스의 브로커로 바로 전달)"""
+
+    def publish(self, meeting_id: str, event_type: str, data: dict) -> None:
+        self._deliver(meeting_id, event_type, data)
+
+
+def load_backend(name: str) -> EventBackend:
+    """EVENT_BACKEND 값으로 백엔드 생성 (memory 또는 "모듈경로:클래스명")"""
+    if name == "memory":
+        return MemoryBackend()
+    module_name, _, class_name = name.partition(":")
+    if not class_name:
+        raise ValueError(f"EVENT_BACKEND 형식이 올바르지 않습니다: {name} (memory 또는 모듈경로:클래스명)")
+    backend_class = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(backend_class, type) and issubclass(backend_class, EventBackend)):
+        raise TypeError(f"EVENT_BACKEND는 EventBackend를 상속한 클래스여야 합니다: {name}")
+    return backend_class()
+
+
+_broker: Optional[EventBroker] = None
+_backend: Optional[EventBackend] = None
+_init_lock = threading.Lock()
+
+
+def get_broker() -> EventBroker:
+    """설정값으로 브로커와 백엔드를 처음 사용할 때 생성"""
+    global _broker, _backend
+    if _broker is None:
+        with _init_lock:
+            if _broker is None:
+                from app.database import settings
+                broker = EventBroker(
+                    buffer_size=settings.EVENT_BUFFER_SIZE,
+                    history_size=settings.EVENT_HISTORY_SIZE,
+                )
+                backend = load_backend(settings.EVENT_BACKEND)
+                backend.start(broker.deliver)
+                _backend = backend
+                _broker = broker
+    return _broker
+
+
+def publish(meeting_id, event_type: str, data: dict) -> None:
+    """이벤트 발행 (실패해도 이미 commit된 쓰기에는 영향을 주지 않음)"""
+    get_broker()
+    try:
+        _backend.publish(str(meeting_id), event_type, data)
+    except Exception:
+        logger.exception("모임 이벤트 발행 실패: meeting_id=%s type=%s", meeting_id, event_type)
+
+
+def queue_event(db: Session, meeting_id, event_type: str, data: dict) -> None:
+    """commit 후 발행할 이벤트 등록 (rollback되면 버려짐)"""
+    db.info.setdefault(PENDING_EVENTS_KEY, []).append((meeting_id, event_type, data))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session: Session) -> None:
+    for meeting_id, event_type, data in session.info.pop(PENDING_EVENTS_KEY, []):
+        publish(meeting_id, event_type, data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    session.info.pop(PENDING_EVENTS_KEY, None)
+
+
+async def stream_events(
+    meeting_id, last_seq: Optional[int] = None, heartbeat_seconds: float = 15.0
+) -> AsyncIterator[str]:
+    """모임 이벤트를 SSE 형식 문자열로 스트리밍
+
+    놓친 이벤트를 먼저 보내고, 이어 받을 수 없거나 버퍼가 넘치면 reset 이벤트를 보낸 뒤 종료합니다.
+    이벤트가 없는 동안에는 heartbeat_seconds마다 주석 줄을 보내 연결을 유지합니다.
+    """
+    broker = get_broker()
+    meeting_id = str(meeting_id)
+    subscription, replay, complete = broker.subscribe(meeting_id, last_seq)
+    try:
+        if not complete:
+            yield _reset_message(broker.current_seq(meeting_id))
+            return
+        for meeting_event in replay:
+            yield meeting_event.to_sse()
+
+        while True:
+            try:
+                meeting_event = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if meeting_event is None:
+                yield _reset_message(broker.current_seq(meeting_id))
+                return
+            yield meeting_event.to_sse()
+    finally:
+        broker.unsubscribe(subscription)
+
+
+def _reset_message(seq: int) -> str:
+    return MeetingEvent(meeting_id="", type=RESET_EVENT, data={"seq": seq}, seq=seq).to_sse()
@@ -0,0 +1,127 @@
+"""모임 가능 시간 히트맵 (날짜 × 시간대)
+
+투표를 (참가자, 슬롯) 좌표 배열로 펼친 뒤 NumPy 배열 연산으로
+참가자 × 슬롯 불리언 행렬과 날짜 × 시간대 인원 행렬을 만듭니다.
+응답 크기를 줄이기 위해 인원 행렬은 런 길이 인코딩 또는 uint16 배열(base64)로,
+참가자별 행은 비트 패킹(base64)으로 내보냅니다.
+"""
+import base64
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.services.slots import MAX_GRID_CELLS, SlotRangeTooLargeError, parse_slot
+
+if TYPE_CHECKING:
+    import numpy as np
+
+ENCODING_RLE = "rle"
+ENCODING_UINT16 = "uint16"
+
+
+def run_length_encode(values: "np.ndarray") -> List[int]:
+    """1차원 배열 → [값, 길이, 값, 길이, ...]"""
+    import numpy as np
+
+    if values.size == 0:
+        return []
+    boundaries = np.flatnonzero(np.diff(values)) + 1
+    starts = np.concatenate(([0], boundaries))
+    lengths = np.diff(np.concatenate((starts, [values.size])))
+    return np.column_stack((values[starts], lengths)).ravel().tolist()
+
+
+def build_heatmap(
+    participant_ids: Sequence[UUID],
+    votes: Iterable[Tuple[UUID, Optional[Iterable[str]], bool]],
+    slots: Iterable[str] = (),
+    granularity_minutes: int = 60,
+    tz_offset_minutes: int = 0,
+    encoding: str = ENCODING_RLE,
+    include_participants: bool = False,
+) -> Optional[dict]:
+    """날짜 × 시간대 가능 인원 행렬 생성 (모임 후보 시간이 없으면 None)
+
+    날짜 범위는 모임 후보 시간(slots)으로 정하고 범위 밖의 투표 시간은 버립니다.
+    (투표 시간 문자열은 검증되지 않으므로 범위에 쓰면 행렬 크기를 임의로 키울 수 있음)
+    날짜 수 × 열 수가 MAX_GRID_CELLS를 넘으면 SlotRangeTooLargeError를 발생시킵니다.
+
+    Args:
+        participant_ids: 행 순서가 될 모임 참가자 ID
+        votes: (참가자 ID, time_list, is_available) 목록
+        slots: 날짜 범위를 정할 모임 후보 시간(candidate_time 키, available_times)
+        granularity_minutes: 시간대(열) 간격
+        tz_offset_minutes: 날짜/시간대 계산에 쓸 UTC 오프셋 (KST는 540)
+        encoding: 인원 행렬 인코딩 (rle | uint16)
+        include_participants: 참가자별 가능 여부 행 포함 여부
+    """
+    # NumPy는 import 비용이 커서(콜드 스타트) 히트맵을 만들 때 불러옴
+    import numpy as np
+
+    row_of = {participant_id: i for i, participant_id in enumerate(participant_ids)}
+    epoch = datetime(1970, 1, 1)
+    minute_of: Dict[str, Optional[int]] = {}
+
+    def to_minute(time_string: str) -> Optional[int]:
+        """시간 문자열 → 오프셋을 적용한 epoch 기준 분 (문자열별로 한 번만 변환)"""
+        if time_string not in minute_of:
+            parsed = parse_slot(time_string)
+            minute_of[time_string] = (
+                (parsed - epoch) // timedelta(minutes=1) + tz_offset_minutes
+                if parsed is not None else None
+            )
+        return minute_of[time_string]
+
+    rows: List[int] = []
+    minutes: List[int] = []
+    for participant_id, time_list, is_available in votes:
+        row = row_of.get(participant_id)
+        if row is None or not is_available:
+            continue
+        for time_string in time_list or []:
+            minute = to_minute(time_string)
+            if minute is not None:
+                rows.append(row)
+                minutes.append(minute)
+    range_minutes = [minute for minute in map(to_minute, slots) if minute is not None]
+    if not range_minutes:
+        return None
+
+    minutes_per_day = 24 * 60
+    start_day = min(range_minutes) // minutes_per_day
+    day_count = max(range_minutes) // minutes_per_day - start_day + 1
+    columns = minutes_per_day // granularity_minutes
+    if day_count * columns > MAX_GRID_CELLS:
+        raise SlotRangeTooLargeError()
+
+    day_index, minute_of_day = np.divmod(np.array(minutes, dtype=np.int64), minutes_per_day)
+    in_range = (day_index >= start_day) & (day_index < start_day + day_count)
+    cell_index = (day_index[in_range] - start_day) * columns + minute_of_day[in_range] // granularity_minutes
+
+    presence = np.zeros((len(participant_ids), day_count * columns), dtype=bool)
+    presence[np.array(rows, dtype=np.int64)[in_range], cell_index] = True
+    counts = presence.sum(axis=0, dtype=np.uint16)
+
+    if encoding == ENCODING_UINT16:
+        encoded_counts = base64.b64encode(counts.astype("<u2").tobytes()).decode()
+    else:
+        encoded_counts = run_length_encode(counts)
+
+    heatmap = {
+        "start_date": (epoch + timedelta(days=start_day)).date().isoformat(),
+        "days": day_count,
+        "columns": columns,
+        "granularity_minutes": granularity_minutes,
+        "tz_offset_minutes": tz_offset_minutes,
+        "encoding": encoding,
+        "counts": encoded_counts,
+        "max_count": int(counts.max()) if counts.size else 0,
+        "participants": None,
+    }
+    if include_participants:
+        packed = np.packbits(presence, axis=1, bitorder="little")
+        heatmap["participants"] = [
+            {"participant_id": participant_id, "bitmap": base64.b64encode(packed[i].tobytes()).decode()}
+            for i, participant_id in enumerate(participant_ids)
+        ]
+    return heatmap
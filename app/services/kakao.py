@@ -1,5 +1,4 @@
 """Kakao OAuth 서비스"""
-import httpx
 from typing import Optional, Dict
 from app.models.user import OAuthProvider
 
@@ -25,6 +24,9 @@ class KakaoService:
             "Content-Type": "application/x-www-form-urlencoded;charset=utf-8"
         }
         
+        # httpx는 import 비용이 커서(콜드 스타트) 로그인 요청 때 불러옴
+        import httpx
+
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.get(
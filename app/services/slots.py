@@ -0,0 +1,54 @@
+"""시간 슬롯 문자열 변환 유틸리티
+
+투표 API는 "2025-11-01 02:00" 형식의 문자열을 주고받고,
+DB 정규화 테이블은 timestamp로 저장하므로 그 사이의 변환을 담당합니다.
+"""
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Iterable, Optional, Set
+
+SLOT_FORMAT = "%Y-%m-%d %H:%M"
+
+# 분석용 시간 격자의 최대 칸 수 (1분 간격 약 5주, 15분 간격 약 1년)
+MAX_GRID_CELLS = 50_000
+
+
+class SlotRangeTooLargeError(ValueError):
+    """모임 시간 범위를 요청한 간격으로 나눈 격자가 MAX_GRID_CELLS를 넘는 경우"""
+
+    def __init__(self):
+        super().__init__(f"모임 시간 범위가 너무 넓습니다. granularity_minutes를 늘려 주세요. (최대 {MAX_GRID_CELLS}칸)")
+
+
+@lru_cache(maxsize=8192)
+def parse_slot(value: str) -> Optional[datetime]:
+    """시간 문자열을 naive(UTC) datetime으로 변환 (해석할 수 없으면 None)
+
+    같은 시간 문자열이 참가자마다 반복되므로 결과를 캐시합니다.
+    """
+    try:
+        return datetime.strptime(value, SLOT_FORMAT)
+    except (TypeError, ValueError):
+        pass
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def parse_slots(values: Iterable[str]) -> Set[datetime]:
+    """시간 문자열 집합을 시각 집합으로 변환 (같은 시각의 다른 표기는 하나로, 해석할 수 없는 값은 제외)
+
+    투표 수 증감, time_vote_slot 반영, 재집계가 모두 이 기준으로 시간을 비교합니다.
+    """
+    slots = {parse_slot(value) for value in values}
+    slots.discard(None)
+    return slots
+
+
+def format_slot(value: datetime) -> str:
+    """datetime을 API에서 쓰는 시간 문자열로 변환"""
+    return value.strftime(SLOT_FORMAT)
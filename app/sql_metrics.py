@@ -0,0 +1,137 @@
+"""요청 단위 SQL 계측
+
+SQLAlchemy 엔진 이벤트로 요청마다 쿼리 수, 총 DB 시간, 가장 느린 쿼리를 집계합니다.
+echo=True 대신 설정한 임계값(DB_SLOW_QUERY_MS)을 넘는 쿼리만 로그로 남깁니다.
+
+N+1 감지: 한 요청에서 같은 형태(파라미터 자리를 제외한 SQL)의 쿼리가
+SQL_N_PLUS_ONE_THRESHOLD번을 넘으면 경고 로그를 남기고,
+SQL_N_PLUS_ONE_RAISE=true(테스트 모드)면 NPlusOneQueryError로 요청을 실패시킵니다.
+"""
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from typing import Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("app.sql")
+
+# IN (...) / VALUES (...) 처럼 파라미터 개수만 다른 목록은 같은 형태로 봄
+_PARAMETER_LIST = re.compile(r"\((?:\s*(?:%s|%\(\w+\)s|\$\d+|\?|:\w+)\s*,?)+\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class NPlusOneQueryError(RuntimeError):
+    """한 요청에서 같은 형태의 쿼리가 임계값보다 많이 실행됨 (테스트 모드)"""
+
+
+def statement_shape(statement: str) -> str:
+    """쿼리 형태 (공백 정리, 파라미터 목록 축약)"""
+    return _PARAMETER_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class RequestQueryStats:
+    """한 요청 동안 실행된 쿼리 통계"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+    def count_shape(self, statement: str) -> int:
+        """같은 형태의 쿼리 실행 횟수 증가 후 반환"""
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        return self.shapes[shape]
+
+    @property
+    def max_repeat(self) -> int:
+        return max(self.shapes.values(), default=0)
+
+    def as_headers(self, include_max_repeat: bool = False) -> dict:
+        """응답 헤더로 내보낼 값
+
+        쿼리 형태는 N+1 감지가 켜져 있을 때만 세므로 X-DB-Max-Repeat는 include_max_repeat일 때만 포함
+        """
+        headers = {
+            "X-DB-Query-Count": str(self.count),
+            "X-DB-Time-Ms": f"{self.total_ms:.2f}",
+            "X-DB-Slowest-Ms": f"{self.slowest_ms:.2f}",
+            "Server-Timing": f'db;dur={self.total_ms:.2f};desc="{self.count} queries"',
+        }
+        if include_max_repeat:
+            headers["X-DB-Max-Repeat"] = str(self.max_repeat)
+        return headers
+
+
+_request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def begin_request_stats() -> Tuple[RequestQueryStats, Token]:
+    """현재 컨텍스트(요청)에 새 통계 객체를 연결"""
+    stats = RequestQueryStats()
+    return stats, _request_stats.set(stats)
+
+
+def end_request_stats(token: Token) -> None:
+    _request_stats.reset(token)
+
+
+def current_request_stats() -> Optional[RequestQueryStats]:
+    return _request_stats.get()
+
+
+def install_query_listeners(
+    engine: Engine,
+    slow_query_ms: float,
+    n_plus_one_threshold: int = 0,
+    n_plus_one_raise: bool = False,
+) -> None:
+    """쿼리 실행 시간을 측정하고 N+1 패턴을 감지하는 엔진 이벤트 등록
+
+    n_plus_one_threshold가 0이면 N+1 감지를 하지 않습니다.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _request_stats.get()
+        if n_plus_one_threshold and stats is not None:
+            repeats = stats.count_shape(statement)
+            if repeats == n_plus_one_threshold + 1:
+                if n_plus_one_raise:
+                    # 실행 전에 실패시켜 N+1을 일으킨 호출 위치가 traceback에 남도록 함
+                    raise NPlusOneQueryError(
+                        f"같은 형태의 쿼리가 한 요청에서 {repeats}번 실행되었습니다 "
+                        f"(임계값 {n_plus_one_threshold}): {statement_shape(statement)}"
+                    )
+                logger.warning("N+1 의심 쿼리 (%d회 이상): %s", repeats, statement_shape(statement))
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed_ms)
+        if elapsed_ms >= slow_query_ms:
+            logger.warning("느린 쿼리 (%.1fms): %s", elapsed_ms, statement)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_time"):
+            conn.info["query_start_time"].pop()
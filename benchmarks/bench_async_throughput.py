@@ -0,0 +1,176 @@
+"""
+동기(스레드 풀) / 비동기(AsyncSession) 라우트 처리량 비교
+
+같은 crud 경로를 두 방식으로 노출한 벤치마크 전용 앱을 만들고,
+httpx.AsyncClient(ASGI 직접 호출)로 동시 요청을 보내 초당 처리 수와 지연 시간을 비교합니다.
+- sync: def 라우트 + get_db (anyio 스레드 풀, 기본 40개 스레드에서 실행)
+- async: async def 라우트 + get_async_db (이벤트 루프에서 실행, 동시 처리 수는 DB 풀 크기로 제한)
+
+시나리오:
+- meeting: 모임 조회 (GET /meetings/{id})
+- participants: 모임별 참가자 목록 조회
+- slow: 모임 조회 + pg_sleep(--sleep-ms) (느린 쿼리/네트워크 지연 재현)
+
+사용법:
+    DB_POOL_MODE=queue DB_POOL_SIZE=20 python benchmarks/bench_async_throughput.py
+    python benchmarks/bench_async_throughput.py --concurrency 10 50 200 --requests 2000 --sleep-ms 50
+
+스레드 풀 한도의 영향을 보려면 --concurrency를 40보다 크게, DB_POOL_SIZE + DB_MAX_OVERFLOW도 40보다 크게 설정하세요.
+.env의 DATABASE_URL이 가리키는 DB에 임시 데이터를 만들고 종료 시 삭제합니다.
+운영 DB가 아닌 개발용 DB에서 실행하세요.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app.database import SessionLocal, get_async_db, get_async_engine, get_db  # noqa: E402
+from app.models import User, Meeting, Participant  # noqa: E402
+from app import crud  # noqa: E402
+
+SCENARIOS = ["meeting", "participants", "slow"]
+
+
+def build_app(sleep_seconds: float) -> FastAPI:
+    """같은 crud 경로를 sync/async 라우트로 노출한 벤치마크 앱"""
+    app = FastAPI()
+
+    @app.get("/sync/meeting/{meeting_id}")
+    def sync_meeting(meeting_id: uuid.UUID, db=Depends(get_db)):
+        return crud.meeting.get_meeting(db, meeting_id=meeting_id) is not None
+
+    @app.get("/async/meeting/{meeting_id}")
+    async def async_meeting(meeting_id: uuid.UUID, db=Depends(get_async_db)):
+        return await crud.aio.meeting.get_meeting(db, meeting_id=meeting_id) is not None
+
+    @app.get("/sync/participants/{meeting_id}")
+    def sync_participants(meeting_id: uuid.UUID, db=Depends(get_db)):
+        return len(crud.participant.get_participants_by_meeting(db, meeting_id=meeting_id))
+
+    @app.get("/async/participants/{meeting_id}")
+    async def async_participants(meeting_id: uuid.UUID, db=Depends(get_async_db)):
+        return len(await crud.aio.participant.get_participants_by_meeting(db, meeting_id=meeting_id))
+
+    @app.get("/sync/slow/{meeting_id}")
+    def sync_slow(meeting_id: uuid.UUID, db=Depends(get_db)):
+        db.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": sleep_seconds})
+        return crud.meeting.get_meeting(db, meeting_id=meeting_id) is not None
+
+    @app.get("/async/slow/{meeting_id}")
+    async def async_slow(meeting_id: uuid.UUID, db=Depends(get_async_db)):
+        await db.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": sleep_seconds})
+        return await crud.aio.meeting.get_meeting(db, meeting_id=meeting_id) is not None
+
+    return app
+
+
+def seed(db, participant_count: int):
+    """임시 사용자/모임/참가자 생성"""
+    tag = uuid.uuid4().hex[:8]
+    user = User(
+        name=f"bench-{tag}",
+        email=f"bench-{tag}@example.com",
+        oauth_provider="kakao",
+        oauth_id=f"bench-{tag}",
+    )
+    db.add(user)
+    db.flush()
+    meeting = Meeting(name=f"bench-{tag}", purpose=["dining"], creator_id=user.id)
+    db.add(meeting)
+    db.flush()
+    db.add_all([Participant(meeting_id=meeting.id) for _ in range(participant_count)])
+    db.commit()
+    return user, meeting.id
+
+
+def cleanup(db, user, meeting_id):
+    db.query(Participant).filter(Participant.meeting_id == meeting_id).delete()
+    db.query(Meeting).filter(Meeting.id == meeting_id).delete()
+    db.query(User).filter(User.id == user.id).delete()
+    db.commit()
+
+
+async def run_load(client: httpx.AsyncClient, path: str, concurrency: int, total: int):
+    """concurrency개의 작업자가 total개의 요청을 나눠 보내고 (초당 처리 수, p50, p95, 실패 수) 반환"""
+    latencies = []
+    failures = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal failures
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code != 200:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    return total / elapsed, statistics.median(latencies), p95, failures
+
+
+async def benchmark(args, meeting_id):
+    app = build_app(args.sleep_ms / 1000)
+    transport = httpx.ASGITransport(app=app)
+    results = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for scenario in args.scenarios:
+            for concurrency in args.concurrency:
+                row = [scenario, concurrency]
+                for mode in ("sync", "async"):
+                    path = f"/{mode}/{scenario}/{meeting_id}"
+                    await run_load(client, path, min(concurrency, args.warmup), args.warmup)
+                    row.append(await run_load(client, path, concurrency, args.requests))
+                results.append(row)
+    await get_async_engine().dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동기/비동기 라우트 처리량 비교")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--participants", type=int, default=20)
+    parser.add_argument("--sleep-ms", type=float, default=20.0, help="slow 시나리오의 pg_sleep 시간")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    user, meeting_id = seed(db, args.participants)
+    try:
+        results = asyncio.run(benchmark(args, meeting_id))
+
+        print(f"\nrequests={args.requests} participants={args.participants} sleep_ms={args.sleep_ms}")
+        print(
+            f"{'scenario':<13} {'conc':>5} {'sync rps':>9} {'async rps':>10} "
+            f"{'sync p50':>9} {'async p50':>10} {'sync p95':>9} {'async p95':>10} {'fail':>6}"
+        )
+        print("=" * 90)
+        for scenario, concurrency, sync, async_ in results:
+            print(
+                f"{scenario:<13} {concurrency:>5} {sync[0]:>9.0f} {async_[0]:>10.0f} "
+                f"{sync[1]:>9.1f} {async_[1]:>10.1f} {sync[2]:>9.1f} {async_[2]:>10.1f} "
+                f"{sync[3] + async_[3]:>6}"
+            )
+        print("\n지연 시간 단위: ms (p50/p95)")
+    finally:
+        cleanup(db, user, meeting_id)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
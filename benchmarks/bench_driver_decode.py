@@ -0,0 +1,201 @@
+"""
+PostgreSQL 드라이버별 결과 디코딩 속도 비교 (DB_DRIVER)
+
+같은 데이터를 드라이버마다 엔진을 따로 만들어 읽고 초당 처리 행 수(rows/sec)를 비교합니다.
+- read_meetings: crud.meeting.get_all_meetings (모임 목록 API)
+- read_time_votes_by_candidate: crud.time_vote.get_time_votes_by_candidate (시간 후보별 투표 목록 API)
+각 쿼리는 ORM 변환까지 포함한 시간(orm)과 드라이버 fetchall만 한 시간(driver)을 따로 측정합니다.
+
+사용법:
+    python benchmarks/bench_driver_decode.py
+    python benchmarks/bench_driver_decode.py --drivers pg8000 psycopg --meetings 2000 --votes 2000 --repeat 20
+
+설치되지 않은 드라이버는 건너뜁니다. (psycopg: pip install "psycopg[binary]")
+.env의 DATABASE_URL이 가리키는 DB에 임시 데이터를 만들고 종료 시 삭제합니다.
+운영 DB가 아닌 개발용 DB에서 실행하세요.
+"""
+import argparse
+import importlib
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import NullPool  # noqa: E402
+
+from app.database import SessionLocal, base_url  # noqa: E402
+from app.db_driver import SYNC_DRIVERS, build_connect_args, driver_url  # noqa: E402
+from app.models import User, Meeting, Participant, MeetingTimeCandidate, TimeVote  # noqa: E402
+from app import crud  # noqa: E402
+
+
+def seed(db, meeting_count: int, vote_count: int):
+    """모임 목록용 모임과, 시간 후보 하나에 몰린 투표 생성"""
+    tag = uuid.uuid4().hex[:8]
+    user = User(
+        name=f"bench-{tag}",
+        email=f"bench-{tag}@example.com",
+        oauth_provider="kakao",
+        oauth_id=f"bench-{tag}",
+    )
+    db.add(user)
+    db.flush()
+
+    start = datetime(2025, 1, 1)
+    meeting_ids = [uuid.uuid4() for _ in range(meeting_count)]
+    db.execute(insert(Meeting), [
+        {
+            "id": meeting_id,
+            "name": f"bench-{tag}-{i}",
+            "purpose": ["dining", "drink"],
+            "creator_id": user.id,
+            "available_times": [start + timedelta(hours=hour) for hour in range(24)],
+            "created_at": start + timedelta(minutes=i),
+        }
+        for i, meeting_id in enumerate(meeting_ids)
+    ])
+    candidate = MeetingTimeCandidate(meeting_id=meeting_ids[0], candidate_time={})
+    db.add(candidate)
+    db.flush()
+    participant_ids = [uuid.uuid4() for _ in range(vote_count)]
+    db.execute(insert(Participant), [
+        {"id": participant_id, "meeting_id": meeting_ids[0]} for participant_id in participant_ids
+    ])
+    db.execute(insert(TimeVote), [
+        {
+            "participant_id": participant_id,
+            "meeting_id": meeting_ids[0],
+            "time_candidate_id": candidate.id,
+            "time_list": [f"2025-01-01 {hour:02d}:00" for hour in range(0, 24, 2)],
+        }
+        for participant_id in participant_ids
+    ])
+    db.commit()
+    return user, meeting_ids, candidate.id
+
+
+def cleanup(db, user, meeting_ids, candidate_id):
+    db.query(TimeVote).filter(TimeVote.time_candidate_id == candidate_id).delete()
+    db.query(MeetingTimeCandidate).filter(MeetingTimeCandidate.id == candidate_id).delete()
+    db.query(Participant).filter(Participant.meeting_id.in_(meeting_ids)).delete()
+    db.query(Meeting).filter(Meeting.creator_id == user.id).delete()
+    db.query(User).filter(User.id == user.id).delete()
+    db.commit()
+
+
+def installed(driver: str) -> bool:
+    try:
+        importlib.import_module(driver)
+    except ImportError:
+        return False
+    return True
+
+
+def measure(call, repeat: int):
+    """call()을 repeat번 실행해 (행 수, 중앙값 ms) 반환"""
+    timings = []
+    rows = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return rows, statistics.median(timings)
+
+
+def capture_statement(engine, call):
+    """call()이 마지막으로 보낸 (SQL, 파라미터)"""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return captured[-1]
+
+
+def bench_driver(driver: str, meeting_count: int, candidate_id, repeat: int):
+    engine = create_engine(
+        driver_url(base_url, driver), connect_args=build_connect_args(driver), poolclass=NullPool
+    )
+    Session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    results = {}
+    try:
+        with engine.connect() as conn, Session(bind=conn) as db:
+            # 한 연결에서 측정해 연결 비용은 제외
+            queries = {
+                "read_meetings": lambda: crud.meeting.get_all_meetings(db, limit=meeting_count),
+                "read_time_votes_by_candidate": lambda: crud.time_vote.get_time_votes_by_candidate(
+                    db, candidate_id=candidate_id
+                ),
+            }
+            raw = conn.connection.dbapi_connection
+            for name, query in queries.items():
+                def orm_call():
+                    db.expunge_all()
+                    return len(query())
+
+                rows, orm_ms = measure(orm_call, repeat)
+
+                # 같은 SQL을 드라이버 커서로 직접 실행 (ORM 변환 제외, 디코딩만)
+                statement, parameters = capture_statement(engine, query)
+
+                def driver_call():
+                    cursor = raw.cursor()
+                    try:
+                        cursor.execute(statement, parameters)
+                        return len(cursor.fetchall())
+                    finally:
+                        cursor.close()
+
+                _, driver_ms = measure(driver_call, repeat)
+                results[name] = (rows, orm_ms, driver_ms)
+            conn.rollback()
+    finally:
+        engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PostgreSQL 드라이버별 결과 디코딩 속도 비교")
+    parser.add_argument("--drivers", nargs="+", choices=SYNC_DRIVERS, default=list(SYNC_DRIVERS))
+    parser.add_argument("--meetings", type=int, default=1000)
+    parser.add_argument("--votes", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    drivers = [driver for driver in args.drivers if installed(driver)]
+    for driver in set(args.drivers) - set(drivers):
+        print(f"{driver}: 설치되지 않아 건너뜁니다.")
+
+    db = SessionLocal()
+    user, meeting_ids, candidate_id = seed(db, args.meetings, args.votes)
+    try:
+        results = {driver: bench_driver(driver, args.meetings, candidate_id, args.repeat) for driver in drivers}
+
+        print(f"\nmeetings={args.meetings} votes={args.votes} repeat={args.repeat}")
+        print(f"{'query':<30} {'driver':<8} {'rows':>6} {'orm(ms)':>9} {'orm rows/s':>11} {'driver(ms)':>11} {'driver rows/s':>14}")
+        print("=" * 95)
+        for name in ("read_meetings", "read_time_votes_by_candidate"):
+            for driver in drivers:
+                rows, orm_ms, driver_ms = results[driver][name]
+                print(
+                    f"{name:<30} {driver:<8} {rows:>6} {orm_ms:>9.2f} {rows / orm_ms * 1000:>11.0f} "
+                    f"{driver_ms:>11.2f} {rows / driver_ms * 1000:>14.0f}"
+                )
+    finally:
+        cleanup(db, user, meeting_ids, candidate_id)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+소프트 삭제 부분 인덱스 EXPLAIN 비교
+
+삭제된 행이 섞인 모임/리뷰 데이터를 만들고, 목록 crud 함수가 실제로 보내는 SQL
+(deleted_at IS NULL 조건이 자동으로 붙은 쿼리)을 인덱스 구성별로 EXPLAIN (ANALYZE, BUFFERS) 합니다.
+- full: 비교용 전체 (created_at, id) 인덱스 (deleted_at 조건 없음, review.meeting_id 인덱스 없음)
+- before: 0005 부분 인덱스 (WHERE deleted_at IS NULL), review.meeting_id 인덱스 없음
+- after: 0005 부분 인덱스 + 0006 review.meeting_id 인덱스
+
+사용법:
+    python benchmarks/bench_soft_delete_explain.py
+    python benchmarks/bench_soft_delete_explain.py --meetings 50000 --deleted-ratio 0.7 --plans
+
+인덱스 교체는 트랜잭션 안에서 하고 rollback하므로 기존 인덱스는 그대로 남습니다.
+.env의 DATABASE_URL이 가리키는 DB에 임시 데이터를 만들고 종료 시 삭제합니다.
+운영 DB가 아닌 개발용 DB에서 실행하세요.
+"""
+import argparse
+import os
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, insert  # noqa: E402
+
+from app.database import SessionLocal, get_engine  # noqa: E402
+from app.models import User, Meeting, Review  # noqa: E402
+from app import crud  # noqa: E402
+
+INDEX_NAMES = [
+    "ix_meeting_created_at_id",
+    "ix_meeting_creator_created_at_id",
+    "ix_review_created_at_id",
+    "ix_review_meeting_created_at_id",
+    "ix_review_user_created_at_id",
+    "ix_meeting_active_created_at_id",
+    "ix_meeting_active_creator_created_at_id",
+    "ix_review_active_created_at_id",
+    "ix_review_active_meeting_created_at_id",
+    "ix_review_active_user_created_at_id",
+    "ix_review_meeting_id",
+]
+
+# 0005 목록 부분 인덱스
+PARTIAL_INDEXES = [
+    "CREATE INDEX ix_meeting_active_created_at_id ON meeting (created_at, id) WHERE deleted_at IS NULL",
+    "CREATE INDEX ix_meeting_active_creator_created_at_id ON meeting (creator_id, created_at, id) "
+    "WHERE deleted_at IS NULL",
+    "CREATE INDEX ix_review_active_created_at_id ON review (created_at, id) WHERE deleted_at IS NULL",
+    "CREATE INDEX ix_review_active_meeting_created_at_id ON review (meeting_id, created_at, id) "
+    "WHERE deleted_at IS NULL",
+    "CREATE INDEX ix_review_active_user_created_at_id ON review (user_id, created_at, id) "
+    "WHERE deleted_at IS NULL",
+]
+
+SCENARIOS = {
+    "full": [
+        "CREATE INDEX ix_meeting_created_at_id ON meeting (created_at, id)",
+        "CREATE INDEX ix_meeting_creator_created_at_id ON meeting (creator_id, created_at, id)",
+        "CREATE INDEX ix_review_created_at_id ON review (created_at, id)",
+        "CREATE INDEX ix_review_meeting_created_at_id ON review (meeting_id, created_at, id)",
+        "CREATE INDEX ix_review_user_created_at_id ON review (user_id, created_at, id)",
+    ],
+    "before": PARTIAL_INDEXES,
+    "after": PARTIAL_INDEXES + ["CREATE INDEX ix_review_meeting_id ON review (meeting_id)"],
+}
+
+
+def seed(db, meeting_count: int, review_count: int, deleted_ratio: float):
+    """삭제된 행이 deleted_ratio 비율로 섞인 임시 모임/리뷰 생성"""
+    tag = uuid.uuid4().hex[:8]
+    user = User(
+        name=f"bench-{tag}",
+        email=f"bench-{tag}@example.com",
+        oauth_provider="kakao",
+        oauth_id=f"bench-{tag}",
+    )
+    db.add(user)
+    db.flush()
+
+    start = datetime(2025, 1, 1)
+    now = datetime.utcnow()
+    meeting_ids = [uuid.uuid4() for _ in range(meeting_count)]
+    db.execute(insert(Meeting), [
+        {
+            "id": meeting_id,
+            "name": f"bench-{tag}",
+            "purpose": ["dining"],
+            "creator_id": user.id,
+            "created_at": start + timedelta(minutes=i),
+            "deleted_at": now if random.random() < deleted_ratio else None,
+        }
+        for i, meeting_id in enumerate(meeting_ids)
+    ])
+    # 리뷰는 앞쪽 모임 하나에 몰아서 모임별 목록 쿼리를 측정
+    target_meeting_id = meeting_ids[0]
+    db.execute(insert(Review), [
+        {
+            "id": uuid.uuid4(),
+            "meeting_id": target_meeting_id if i % 2 == 0 else random.choice(meeting_ids),
+            "user_id": user.id,
+            "rating": 5,
+            "created_at": start + timedelta(minutes=i),
+            "deleted_at": now if random.random() < deleted_ratio else None,
+        }
+        for i in range(review_count)
+    ])
+    db.commit()
+    return user, target_meeting_id
+
+
+def cleanup(db, user):
+    db.query(Review).filter(Review.user_id == user.id).delete()
+    db.query(Meeting).filter(Meeting.creator_id == user.id).delete()
+    db.query(User).filter(User.id == user.id).delete()
+    db.commit()
+
+
+def capture_statements(calls):
+    """crud 함수가 실제로 보내는 (SQL, 파라미터) 수집 (소프트 삭제 조건 포함)"""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(get_engine(), "before_cursor_execute", before_cursor_execute)
+    try:
+        statements = {}
+        for name, call in calls.items():
+            db = SessionLocal()
+            try:
+                captured.clear()
+                call(db)
+                statements[name] = captured[-1]
+            finally:
+                db.close()
+        return statements
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", before_cursor_execute)
+
+
+def explain(statements, scenario: str, show_plans: bool):
+    """인덱스를 scenario 구성으로 바꾼 트랜잭션에서 EXPLAIN 실행 후 rollback"""
+    results = {}
+    with get_engine().connect() as conn:
+        transaction = conn.begin()
+        try:
+            for name in INDEX_NAMES:
+                conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+            for ddl in SCENARIOS[scenario]:
+                conn.exec_driver_sql(ddl)
+            conn.exec_driver_sql("ANALYZE meeting")
+            conn.exec_driver_sql("ANALYZE review")
+
+            index_size = conn.exec_driver_sql(
+                "SELECT COALESCE(SUM(pg_relation_size(indexrelid)), 0) FROM pg_index "
+                "JOIN pg_class ON pg_class.oid = pg_index.indexrelid WHERE relname = ANY(%s)",
+                (INDEX_NAMES,),
+            ).scalar()
+
+            for name, (statement, parameters) in statements.items():
+                plan = [
+                    row[0] for row in conn.exec_driver_sql(
+                        f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+                    )
+                ]
+                execution_ms = next(
+                    (float(line.split(":")[1].split()[0]) for line in plan if line.startswith("Execution Time")),
+                    float("nan"),
+                )
+                uses_index = any("Index" in line for line in plan)
+                results[name] = (execution_ms, uses_index)
+                if show_plans:
+                    print(f"\n[{scenario}] {name}")
+                    print("\n".join(plan))
+        finally:
+            transaction.rollback()
+    return results, index_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="소프트 삭제 부분 인덱스 EXPLAIN 비교")
+    parser.add_argument("--meetings", type=int, default=20000)
+    parser.add_argument("--reviews", type=int, default=20000)
+    parser.add_argument("--deleted-ratio", type=float, default=0.5)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--plans", action="store_true", help="EXPLAIN 결과 전체 출력")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    user, target_meeting_id = seed(db, args.meetings, args.reviews, args.deleted_ratio)
+    try:
+        statements = capture_statements({
+            "get_all_meetings": lambda s: crud.meeting.get_all_meetings(s, limit=args.limit),
+            "get_meetings_by_creator": lambda s: crud.meeting.get_meetings_by_creator(s, user.id, limit=args.limit),
+            "get_all_reviews": lambda s: crud.review.get_all_reviews(s, limit=args.limit),
+            "get_reviews_by_meeting": lambda s: crud.review.get_reviews_by_meeting(
+                s, target_meeting_id, limit=args.limit
+            ),
+            "get_reviews_by_user": lambda s: crud.review.get_reviews_by_user(s, user.id, limit=args.limit),
+        })
+        results = {scenario: explain(statements, scenario, args.plans) for scenario in SCENARIOS}
+
+        print(f"\nmeetings={args.meetings} reviews={args.reviews} deleted_ratio={args.deleted_ratio}")
+        print(f"{'query':<26}" + "".join(f" {scenario + '(ms)':>12} {'idx':>4}" for scenario in SCENARIOS))
+        print("=" * (26 + 18 * len(SCENARIOS)))
+        for name in statements:
+            row = f"{name:<26}"
+            for scenario in SCENARIOS:
+                execution_ms, uses_index = results[scenario][0][name]
+                row += f" {execution_ms:>12.3f} {'yes' if uses_index else 'no':>4}"
+            print(row)
+        sizes = ", ".join(f"{scenario} {results[scenario][1] / 1024:.0f} KiB" for scenario in SCENARIOS)
+        print(f"\n인덱스 크기: {sizes}")
+    finally:
+        cleanup(db, user)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+시간 투표 집계 벤치마크
+
+시간 후보의 슬롯 수(10, 50, 200)와 참가자 수에 따라
+update_vote_count(투표 쓰기 시 호출되는 집계)의 지연 시간을 측정합니다.
+기존 방식(슬롯마다 COUNT + LIKE 쿼리)과 단일 집계 쿼리 방식을 비교합니다.
+
+사용법:
+    python benchmarks/bench_vote_count.py
+    python benchmarks/bench_vote_count.py --slots 10 50 200 --participants 10 50 --repeat 20
+
+.env의 DATABASE_URL이 가리키는 DB에 임시 데이터를 만들고 종료 시 삭제합니다.
+운영 DB가 아닌 개발용 DB에서 실행하세요.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func  # noqa: E402
+
+from app.database import SessionLocal  # noqa: E402
+from app.models import User, Meeting, Participant, MeetingTimeCandidate, TimeVote  # noqa: E402
+from app.crud.meeting_time_candidate import update_vote_count  # noqa: E402
+
+
+def legacy_update_vote_count(db, candidate_id):
+    """기존 구현: 슬롯마다 array_to_string(...) LIKE 쿼리를 실행"""
+    db_candidate = db.query(MeetingTimeCandidate).filter(MeetingTimeCandidate.id == candidate_id).first()
+    candidate_time = dict(db_candidate.candidate_time)
+    for time_string in candidate_time.keys():
+        candidate_time[time_string] = db.query(TimeVote).filter(
+            TimeVote.time_candidate_id == candidate_id,
+            TimeVote.is_available == True,
+            func.array_to_string(TimeVote.time_list, ',').contains(time_string)
+        ).count()
+    db_candidate.candidate_time = candidate_time
+    db.commit()
+    db.refresh(db_candidate)
+    return db_candidate
+
+
+def seed(db, slot_count: int, participant_count: int):
+    """슬롯 수와 참가자 수에 맞는 임시 모임 데이터 생성"""
+    tag = uuid.uuid4().hex[:8]
+    user = User(
+        name=f"bench-{tag}",
+        email=f"bench-{tag}@example.com",
+        oauth_provider="kakao",
+        oauth_id=f"bench-{tag}",
+    )
+    db.add(user)
+    db.flush()
+
+    start = datetime(2025, 11, 1, 9, 0)
+    slots = [(start + timedelta(minutes=30 * i)).strftime("%Y-%m-%d %H:%M") for i in range(slot_count)]
+    meeting = Meeting(name=f"bench-{tag}", purpose=["dining"], creator_id=user.id)
+    db.add(meeting)
+    db.flush()
+    candidate = MeetingTimeCandidate(meeting_id=meeting.id, candidate_time={slot: 0 for slot in slots})
+    db.add(candidate)
+    db.flush()
+
+    for _ in range(participant_count):
+        participant = Participant(meeting_id=meeting.id)
+        db.add(participant)
+        db.flush()
+        db.add(TimeVote(
+            participant_id=participant.id,
+            meeting_id=meeting.id,
+            time_candidate_id=candidate.id,
+            time_list=random.sample(slots, k=max(1, slot_count // 2)),
+            is_available=True,
+        ))
+    db.commit()
+    return user, meeting, candidate
+
+
+def cleanup(db, user, meeting):
+    db.query(TimeVote).filter(TimeVote.meeting_id == meeting.id).delete()
+    db.query(MeetingTimeCandidate).filter(MeetingTimeCandidate.meeting_id == meeting.id).delete()
+    db.query(Participant).filter(Participant.meeting_id == meeting.id).delete()
+    db.query(Meeting).filter(Meeting.id == meeting.id).delete()
+    db.query(User).filter(User.id == user.id).delete()
+    db.commit()
+
+
+def measure(fn, db, candidate_id, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(db, candidate_id)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시간 투표 집계 벤치마크")
+    parser.add_argument("--slots", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--participants", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'slots':>6} {'participants':>13} {'legacy p50(ms)':>15} {'single p50(ms)':>15} {'speedup':>8}")
+    print("=" * 62)
+    for slot_count in args.slots:
+        for participant_count in args.participants:
+            db = SessionLocal()
+            user, meeting, candidate = seed(db, slot_count, participant_count)
+            try:
+                legacy_p50, _ = measure(legacy_update_vote_count, db, candidate.id, args.repeat)
+                single_p50, _ = measure(update_vote_count, db, candidate.id, args.repeat)
+                speedup = legacy_p50 / single_p50 if single_p50 else float("inf")
+                print(
+                    f"{slot_count:>6} {participant_count:>13} "
+                    f"{legacy_p50:>15.2f} {single_p50:>15.2f} {speedup:>7.1f}x"
+                )
+            finally:
+                cleanup(db, user, meeting)
+                db.close()
+
+
+if __name__ == "__main__":
+    main()
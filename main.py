@@ -1,32 +1,44 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
+import math
 import os
 
-# 모델 import (테이블 생성용)
-from app.database import engine, Base, settings
-from app.models import (
-    User,
-    Meeting,
-    Participant,
-    MeetingTimeCandidate,
-    TimeVote,
-    Place,
-    PlaceCandidate,
-    PlaceVote,
-    Review,
-)
-from app.api import api_router
+from app.database import get_engine, get_replicas, replica_urls, settings
+from app.api import include_routers
+from app.db_pool import pool_status
+from app.crud.meeting import share_code_cache
+from app.crud.base import RowNotFoundError
+from app.crud.pagination import InvalidCursorError
+from app.services.slots import SlotRangeTooLargeError
+from app.sql_metrics import begin_request_stats, end_request_stats
+from app.db_routing import READ_METHODS, STICKY_COOKIE, begin_read_only, end_read_only
+from app.migrate import check_schema_version
+from app.services.events import get_broker
 
-# 개발 환경에서만 테이블 자동 생성 (프로덕션에서는 마이그레이션 사용)
 is_production = os.getenv("ENVIRONMENT", "development").lower() == "production"
-if not is_production:
-    Base.metadata.create_all(bind=engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 스키마 버전만 확인하고 DDL은 실행하지 않음 (테이블 생성/변경은 python -m app.migrate up)
+    # import 시점이 아닌 서버 시작 시 실행해 import(콜드 스타트)에는 DB 왕복이 없도록 함
+    app.state.schema = await run_in_threadpool(
+        check_schema_version, get_engine(), settings.SCHEMA_VERSION_CHECK.lower()
+    )
+    # 이벤트 백엔드(EVENT_BACKEND) 설정 오류는 첫 투표 commit이 아닌 서버 시작 시 드러나도록 미리 생성
+    get_broker()
+    yield
+
 
 app = FastAPI(
     title="EasyMoim API",
     description="EasyMoim 백엔드 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -49,8 +61,63 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def sql_metrics_middleware(request: Request, call_next):
+    """요청별 쿼리 수, 총 DB 시간, 가장 느린 쿼리 시간을 응답 헤더로 반환"""
+    stats, token = begin_request_stats()
+    try:
+        response = await call_next(request)
+    finally:
+        end_request_stats(token)
+    if settings.SQL_METRICS_HEADERS:
+        response.headers.update(stats.as_headers(include_max_repeat=settings.SQL_N_PLUS_ONE_THRESHOLD > 0))
+    return response
+
+
+@app.middleware("http")
+async def replica_routing_middleware(request: Request, call_next):
+    """읽기 전용 요청은 복제본에서 읽고, 쓰기에 성공한 클라이언트는 잠시 primary에서 읽도록 쿠키 설정"""
+    if not replica_urls:
+        return await call_next(request)
+    is_read = request.method in READ_METHODS
+    token = begin_read_only(is_read and STICKY_COOKIE not in request.cookies)
+    try:
+        response = await call_next(request)
+    finally:
+        end_read_only(token)
+    if not is_read and response.status_code < 400:
+        response.set_cookie(
+            STICKY_COOKIE,
+            "1",
+            max_age=math.ceil(settings.DB_REPLICA_STICKY_SECONDS),
+            httponly=True,
+            secure=True,
+            samesite="none",
+        )
+    return response
+
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    """목록 API의 잘못된 cursor 값 → 400"""
+    return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+
+
+@app.exception_handler(RowNotFoundError)
+async def row_not_found_handler(request: Request, exc: RowNotFoundError):
+    """일괄 수정 대상 중 없는 행 → 404"""
+    return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": str(exc)})
+
+
+@app.exception_handler(SlotRangeTooLargeError)
+async def slot_range_too_large_handler(request: Request, exc: SlotRangeTooLargeError):
+    """분석 격자가 너무 큰 요청 (시간 범위 / 간격) → 400"""
+    return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+
+
 # API 라우터 등록
-app.include_router(api_router, prefix="/api/v1")
+include_routers(app, prefix="/api/v1")
 
 
 @app.get("/")
@@ -65,7 +132,26 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/db")
+async def db_pool_health():
+    """DB 커넥션 풀 상태 (체크아웃 대기 시간, 연결 나이 등 풀 크기 조정용 지표), 서버 시작 시 확인한 스키마 버전, 읽기 복제본 상태"""
+    pool_info = pool_status(get_engine())
+    pool_info["schema"] = getattr(app.state, "schema", None)
+    replicas = get_replicas()
+    if replicas is not None:
+        pool_info["replicas"] = replicas.status()
+    return pool_info
+
+
+@app.get("/health/cache")
+async def cache_health():
+    """공유 코드 캐시 상태 (크기, 적중/미스/병합 횟수)"""
+    return {"share_code": share_code_cache.stats()}
+
+
 if __name__ == "__main__":
+    import uvicorn
+
     # 환경 변수에서 포트 가져오기 (기본값: 8000)
     port = int(os.getenv("PORT", 8000))
     
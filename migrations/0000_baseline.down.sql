@@ -0,0 +1,9 @@
+DROP TABLE IF EXISTS time_vote;
+DROP TABLE IF EXISTS place_vote;
+DROP TABLE IF EXISTS review;
+DROP TABLE IF EXISTS place_candidate;
+DROP TABLE IF EXISTS participant;
+DROP TABLE IF EXISTS meeting_time_candidate;
+DROP TABLE IF EXISTS meeting;
+DROP TABLE IF EXISTS "user";
+DROP TABLE IF EXISTS place;
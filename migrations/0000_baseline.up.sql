@@ -0,0 +1,160 @@
+-- 기준 스키마: 마이그레이션 도입 전 Base.metadata.create_all이 만들던 테이블
+-- 이후 변경(0001~)은 각 마이그레이션에서 추가합니다. 이 파일은 새 DB에서만 의미가 있으며,
+-- create_all로 이미 테이블이 있는 DB는 `python -m app.migrate stamp <버전>`으로 현재 버전만 기록하세요.
+
+CREATE TABLE IF NOT EXISTS place (
+    id VARCHAR(255) NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    category VARCHAR(255),
+    address TEXT,
+    location VARCHAR(255),
+    rating FLOAT,
+    thumbnail TEXT,
+    updated_at TIMESTAMP WITHOUT TIME ZONE,
+    PRIMARY KEY (id)
+);
+CREATE INDEX IF NOT EXISTS ix_place_id ON place (id);
+
+CREATE TABLE IF NOT EXISTS "user" (
+    id SERIAL NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL,
+    oauth_provider VARCHAR(50) NOT NULL,
+    oauth_id VARCHAR(255) NOT NULL,
+    is_active BOOLEAN,
+    created_at TIMESTAMP WITHOUT TIME ZONE,
+    updated_at TIMESTAMP WITHOUT TIME ZONE,
+    PRIMARY KEY (id),
+    UNIQUE (oauth_id)
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_user_email ON "user" (email);
+CREATE INDEX IF NOT EXISTS ix_user_id ON "user" (id);
+
+CREATE TABLE IF NOT EXISTS meeting (
+    id UUID NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    creator_id INTEGER NOT NULL,
+    purpose VARCHAR[] NOT NULL,
+    is_one_place BOOLEAN,
+    location_choice_type VARCHAR(50),
+    location_choice_value VARCHAR(255),
+    preference_place JSON,
+    deadline TIMESTAMP WITHOUT TIME ZONE,
+    expected_participant_count INTEGER,
+    share_code VARCHAR(255),
+    status VARCHAR(50),
+    available_times TIMESTAMP WITHOUT TIME ZONE[],
+    confirmed_time TIMESTAMP WITHOUT TIME ZONE,
+    confirmed_location VARCHAR(255),
+    confirmed_at TIMESTAMP WITHOUT TIME ZONE,
+    created_at TIMESTAMP WITHOUT TIME ZONE,
+    updated_at TIMESTAMP WITHOUT TIME ZONE,
+    deleted_at TIMESTAMP WITHOUT TIME ZONE,
+    PRIMARY KEY (id),
+    FOREIGN KEY(creator_id) REFERENCES "user" (id)
+);
+CREATE INDEX IF NOT EXISTS ix_meeting_id ON meeting (id);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_meeting_share_code ON meeting (share_code);
+
+CREATE TABLE IF NOT EXISTS meeting_time_candidate (
+    id UUID NOT NULL,
+    meeting_id UUID NOT NULL,
+    candidate_time JSON NOT NULL,
+    created_at TIMESTAMP WITHOUT TIME ZONE,
+    PRIMARY KEY (id),
+    FOREIGN KEY(meeting_id) REFERENCES meeting (id)
+);
+CREATE INDEX IF NOT EXISTS ix_meeting_time_candidate_id ON meeting_time_candidate (id);
+CREATE INDEX IF NOT EXISTS ix_meeting_time_candidate_meeting_id ON meeting_time_candidate (meeting_id);
+
+CREATE TABLE IF NOT EXISTS participant (
+    id UUID NOT NULL,
+    meeting_id UUID NOT NULL,
+    user_id INTEGER,
+    nickname VARCHAR(255),
+    oauth_key VARCHAR(255),
+    is_invited BOOLEAN,
+    has_responded BOOLEAN,
+    preference_place JSON,
+    location VARCHAR(255),
+    created_at TIMESTAMP WITHOUT TIME ZONE,
+    updated_at TIMESTAMP WITHOUT TIME ZONE,
+    PRIMARY KEY (id),
+    FOREIGN KEY(meeting_id) REFERENCES meeting (id),
+    FOREIGN KEY(user_id) REFERENCES "user" (id)
+);
+CREATE INDEX IF NOT EXISTS ix_participant_id ON participant (id);
+CREATE INDEX IF NOT EXISTS ix_participant_meeting_id ON participant (meeting_id);
+CREATE INDEX IF NOT EXISTS ix_participant_user_id ON participant (user_id);
+
+CREATE TABLE IF NOT EXISTS place_candidate (
+    id VARCHAR(255) NOT NULL,
+    meeting_id UUID NOT NULL,
+    location VARCHAR(255),
+    preference_subway JSON,
+    preference_area JSON,
+    food VARCHAR(255),
+    condition VARCHAR(255),
+    location_type VARCHAR(50),
+    PRIMARY KEY (id),
+    FOREIGN KEY(meeting_id) REFERENCES meeting (id)
+);
+CREATE INDEX IF NOT EXISTS ix_place_candidate_id ON place_candidate (id);
+CREATE INDEX IF NOT EXISTS ix_place_candidate_meeting_id ON place_candidate (meeting_id);
+
+CREATE TABLE IF NOT EXISTS review (
+    id UUID NOT NULL,
+    meeting_id UUID NOT NULL,
+    user_id INTEGER NOT NULL,
+    rating INTEGER,
+    image_list VARCHAR[],
+    text TEXT,
+    like_count INTEGER NOT NULL,
+    created_at TIMESTAMP WITHOUT TIME ZONE,
+    updated_at TIMESTAMP WITHOUT TIME ZONE,
+    deleted_at TIMESTAMP WITHOUT TIME ZONE,
+    PRIMARY KEY (id),
+    FOREIGN KEY(meeting_id) REFERENCES meeting (id),
+    FOREIGN KEY(user_id) REFERENCES "user" (id)
+);
+CREATE INDEX IF NOT EXISTS ix_review_id ON review (id);
+
+CREATE TABLE IF NOT EXISTS place_vote (
+    id UUID NOT NULL,
+    participant_id UUID NOT NULL,
+    meeting_id UUID NOT NULL,
+    time_candidate_id UUID NOT NULL,
+    is_available BOOLEAN NOT NULL,
+    memo TEXT,
+    created_at TIMESTAMP WITHOUT TIME ZONE,
+    updated_at TIMESTAMP WITHOUT TIME ZONE,
+    PRIMARY KEY (id),
+    FOREIGN KEY(participant_id) REFERENCES participant (id),
+    FOREIGN KEY(meeting_id) REFERENCES meeting (id),
+    FOREIGN KEY(time_candidate_id) REFERENCES meeting_time_candidate (id)
+);
+CREATE INDEX IF NOT EXISTS ix_place_vote_id ON place_vote (id);
+CREATE INDEX IF NOT EXISTS ix_place_vote_meeting_id ON place_vote (meeting_id);
+CREATE INDEX IF NOT EXISTS ix_place_vote_participant_id ON place_vote (participant_id);
+CREATE INDEX IF NOT EXISTS ix_place_vote_time_candidate_id ON place_vote (time_candidate_id);
+
+CREATE TABLE IF NOT EXISTS time_vote (
+    id UUID NOT NULL,
+    participant_id UUID NOT NULL,
+    meeting_id UUID NOT NULL,
+    time_candidate_id UUID NOT NULL,
+    time_list TEXT[] NOT NULL,
+    is_available BOOLEAN NOT NULL,
+    memo TEXT,
+    created_at TIMESTAMP WITHOUT TIME ZONE,
+    updated_at TIMESTAMP WITHOUT TIME ZONE,
+    PRIMARY KEY (id),
+    CONSTRAINT uq_participant_time_candidate UNIQUE (participant_id, time_candidate_id),
+    FOREIGN KEY(participant_id) REFERENCES participant (id),
+    FOREIGN KEY(meeting_id) REFERENCES meeting (id),
+    FOREIGN KEY(time_candidate_id) REFERENCES meeting_time_candidate (id)
+);
+CREATE INDEX IF NOT EXISTS ix_time_vote_id ON time_vote (id);
+CREATE INDEX IF NOT EXISTS ix_time_vote_meeting_id ON time_vote (meeting_id);
+CREATE INDEX IF NOT EXISTS ix_time_vote_participant_id ON time_vote (participant_id);
+CREATE INDEX IF NOT EXISTS ix_time_vote_time_candidate_id ON time_vote (time_candidate_id);
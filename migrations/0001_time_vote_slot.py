@@ -0,0 +1,66 @@
+"""time_vote.time_list(text[])를 정규화한 time_vote_slot 테이블 추가
+
+전환 순서:
+  1. 이 마이그레이션 적용 (테이블 생성 + 기존 투표 백필)
+     애플리케이션은 배포 시점부터 time_list와 time_vote_slot에 함께 씀 (이중 쓰기)
+  2. 집계 비교(verify_vote_count) 후 TIME_VOTE_SLOT_READS=true 로 읽기 전환
+
+백필은 time_vote를 배치로 나눠 배치마다 커밋하므로 time_vote 전체를 한 트랜잭션으로 잡지 않습니다.
+ON CONFLICT DO NOTHING이므로 중간에 실패해도 다시 실행할 수 있습니다.
+"""
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS time_vote_slot (
+    time_vote_id UUID NOT NULL REFERENCES time_vote(id) ON DELETE CASCADE,
+    slot TIMESTAMP NOT NULL,
+    time_candidate_id UUID NOT NULL REFERENCES meeting_time_candidate(id) ON DELETE CASCADE,
+    participant_id UUID NOT NULL REFERENCES participant(id) ON DELETE CASCADE,
+    PRIMARY KEY (time_vote_id, slot)
+)
+"""
+
+CREATE_INDEX = """
+CREATE INDEX IF NOT EXISTS ix_time_vote_slot_candidate_slot
+    ON time_vote_slot (time_candidate_id, slot, participant_id)
+"""
+
+# 시간 문자열 → naive(UTC) timestamp, 해석할 수 없으면 NULL (app/services/slots.py의 parse_slot에 대응)
+# time_list는 검증하지 않은 문자열이므로 "2025-02-30 10:00", "2025-11-01 10:00 저녁" 같은 값이 있어도
+# 배치가 실패하지 않도록 변환 오류를 NULL로 바꿈. 시간대가 없는 문자열은 UTC로 해석 (함수 실행 중에만 TimeZone=UTC)
+# pg_temp 함수이므로 마이그레이션 연결이 끝나면 사라짐
+CREATE_PARSE_SLOT = """
+CREATE OR REPLACE FUNCTION pg_temp.parse_slot(value TEXT) RETURNS TIMESTAMP
+LANGUAGE plpgsql STABLE SET TimeZone = 'UTC' AS $$
+BEGIN
+    IF value !~ '^\\d{4}-\\d{2}-\\d{2}' THEN
+        RETURN NULL;
+    END IF;
+    RETURN replace(value, 'T', ' ')::timestamptz AT TIME ZONE 'UTC';
+EXCEPTION WHEN invalid_datetime_format OR datetime_field_overflow OR invalid_parameter_value THEN
+    RETURN NULL;
+END
+$$
+"""
+
+# 가능 투표의 시간 중 해석되는 것만
+BACKFILL = """
+INSERT INTO time_vote_slot (time_vote_id, slot, time_candidate_id, participant_id)
+SELECT DISTINCT v.id, pg_temp.parse_slot(s.slot), v.time_candidate_id, v.participant_id
+FROM time_vote v
+CROSS JOIN LATERAL unnest(v.time_list) AS s(slot)
+WHERE v.id = ANY(:ids)
+  AND pg_temp.parse_slot(s.slot) IS NOT NULL
+ON CONFLICT DO NOTHING
+"""
+
+
+def up(ctx):
+    with ctx.transaction():
+        ctx.execute(CREATE_TABLE)
+        ctx.execute(CREATE_INDEX)
+    ctx.execute(CREATE_PARSE_SLOT)
+    ctx.backfill(BACKFILL, table="time_vote", where="is_available")
+
+
+def down(ctx):
+    ctx.execute("DROP TABLE IF EXISTS time_vote_slot")
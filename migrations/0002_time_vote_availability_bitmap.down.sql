@@ -0,0 +1 @@
+ALTER TABLE time_vote DROP COLUMN IF EXISTS availability_bitmap;
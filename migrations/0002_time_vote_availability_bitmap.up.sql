@@ -0,0 +1,3 @@
+-- 모임 시간 격자(meeting.available_times 정렬 순) 기준 가능 시간 비트맵
+-- TIME_VOTE_BITMAP=true 인 동안 투표 저장 시 채워지며, 비어 있는 투표는 읽을 때 time_list로 변환
+ALTER TABLE time_vote ADD COLUMN IF NOT EXISTS availability_bitmap BYTEA;
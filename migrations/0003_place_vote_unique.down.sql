@@ -0,0 +1 @@
+ALTER TABLE place_vote DROP CONSTRAINT IF EXISTS uq_participant_place_time_candidate;
@@ -0,0 +1,18 @@
+-- place_vote에 (participant_id, time_candidate_id) 유니크 제약 추가
+-- INSERT ... ON CONFLICT 업서트의 충돌 대상으로 사용 (time_vote의 uq_participant_time_candidate와 동일)
+
+-- 기존 중복 투표는 가장 최근에 수정된 한 건만 남김
+DELETE FROM place_vote
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, row_number() OVER (
+            PARTITION BY participant_id, time_candidate_id
+            ORDER BY updated_at DESC NULLS LAST, created_at DESC NULLS LAST, id
+        ) AS rn
+        FROM place_vote
+    ) ranked
+    WHERE rn > 1
+);
+
+ALTER TABLE place_vote
+    ADD CONSTRAINT uq_participant_place_time_candidate UNIQUE (participant_id, time_candidate_id);
@@ -0,0 +1 @@
+ALTER TABLE meeting DROP COLUMN IF EXISTS version;
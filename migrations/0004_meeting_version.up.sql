@@ -0,0 +1,3 @@
+-- 모임 변경 버전 (투표/참가자/시간 후보 쓰기마다 1씩 증가)
+-- 집계 조회의 ETag와 롱 폴링(?wait=)에서 기본 키 조회 한 번으로 변경 여부를 판단
+ALTER TABLE meeting ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,47 @@
+"""목록 API 커서 페이지네이션용 (created_at, id) 복합 인덱스
+
+목록 쿼리에는 항상 deleted_at IS NULL 조건이 붙으므로 (app/models/soft_delete.py)
+삭제되지 않은 행만 담는 부분 인덱스로 만듭니다.
+(created_at, id) > (커서 값) 비교에서 NULL 행은 빠지므로 먼저 created_at을 채웁니다.
+채우기는 배치마다 커밋하고, 인덱스는 CONCURRENTLY로 만들어 쓰기를 막지 않습니다.
+"""
+
+# created_at이 비어 있으면 updated_at(없으면 현재 시각)으로 채울 테이블
+BACKFILL_TABLES = ("meeting", "review")
+
+BACKFILL = """
+UPDATE {table} SET created_at = COALESCE(updated_at, now() AT TIME ZONE 'UTC')
+WHERE id = ANY(:ids) AND created_at IS NULL
+"""
+
+CREATE_INDEXES = """
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_meeting_active_created_at_id
+    ON meeting (created_at, id) WHERE deleted_at IS NULL;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_meeting_active_creator_created_at_id
+    ON meeting (creator_id, created_at, id) WHERE deleted_at IS NULL;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_review_active_created_at_id
+    ON review (created_at, id) WHERE deleted_at IS NULL;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_review_active_meeting_created_at_id
+    ON review (meeting_id, created_at, id) WHERE deleted_at IS NULL;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_review_active_user_created_at_id
+    ON review (user_id, created_at, id) WHERE deleted_at IS NULL;
+"""
+
+DROP_INDEXES = """
+DROP INDEX CONCURRENTLY IF EXISTS ix_review_active_user_created_at_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_review_active_meeting_created_at_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_review_active_created_at_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_meeting_active_creator_created_at_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_meeting_active_created_at_id;
+"""
+
+
+def up(ctx):
+    for table in BACKFILL_TABLES:
+        ctx.backfill(BACKFILL.format(table=table), table=table, where="created_at IS NULL")
+    ctx.execute_concurrently(CREATE_INDEXES)
+
+
+def down(ctx):
+    ctx.execute_concurrently(DROP_INDEXES)
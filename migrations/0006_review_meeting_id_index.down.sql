@@ -0,0 +1 @@
+DROP INDEX CONCURRENTLY IF EXISTS ix_review_meeting_id;
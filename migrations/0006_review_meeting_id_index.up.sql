@@ -0,0 +1,7 @@
+-- review.meeting_id 인덱스 (소프트 삭제)
+-- 모임을 삭제하거나 리뷰를 모임과 조인할 때 review 전체를 스캔하지 않도록 일반 인덱스를 추가합니다.
+-- 삭제된 리뷰도 모임 삭제 시 함께 찾아야 하므로 부분 인덱스가 아닌 전체 인덱스입니다.
+-- CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 python -m app.migrate가 이 파일을 문장마다 따로(autocommit) 실행
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_review_meeting_id
+    ON review (meeting_id);
@@ -0,0 +1,32 @@
+"""콜드 스타트 import 테스트 (DB 연결 없음, benchmarks/bench_import_time.py와 같은 기준)"""
+import os
+import subprocess
+import sys
+
+from benchmarks.bench_import_time import FORBIDDEN_MODULES, ROOT, run_importtime, summarize
+
+
+def test_main_import_skips_heavy_modules():
+    modules = summarize(run_importtime("main"))
+    assert "main" in modules
+    loaded = [module for module in FORBIDDEN_MODULES if module in modules]
+    assert loaded == []
+
+
+def test_main_import_creates_no_engine():
+    # 엔진은 첫 요청(get_db) 또는 시작 시 lifespan에서 만들어야 함
+    code = (
+        "import main\n"
+        "from app import database\n"
+        "assert database._engine is None and database._replicas is None\n"
+        "assert database._async_engine is None and database._async_replicas is None\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        env={"ENVIRONMENT": "production", **os.environ},
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
@@ -0,0 +1,169 @@
+"""마이그레이션 도구 테스트 (실제 migrations/ 파일 사용)"""
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.migrate import (
+    CREATE_VERSION_TABLE,
+    MIGRATIONS_DIR,
+    MigrationContext,
+    current_version,
+    discover,
+    downgrade,
+    latest_version,
+    split_statements,
+    upgrade,
+)
+
+VOTE_COUNT = 5
+LIST_INDEXES = [
+    "ix_meeting_active_created_at_id",
+    "ix_meeting_active_creator_created_at_id",
+    "ix_review_active_created_at_id",
+    "ix_review_active_meeting_created_at_id",
+    "ix_review_active_user_created_at_id",
+]
+
+
+def test_discover_real_migrations():
+    migrations = discover()
+    versions = [migration.version for migration in migrations]
+    assert versions == list(range(len(migrations)))
+    assert latest_version() == versions[-1]
+    for migration in migrations:
+        # 모든 마이그레이션은 되돌릴 수 있어야 함
+        assert migration.script is not None or migration.down_sql is not None, migration.label
+    # 큰 테이블 백필이 있는 마이그레이션은 배치 백필(ctx.backfill)을 쓰는 파이썬 마이그레이션
+    by_version = {migration.version: migration for migration in migrations}
+    assert by_version[1].script is not None
+    assert by_version[5].script is not None
+
+
+def test_split_statements_real_files():
+    for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+        statements = split_statements(path.read_text(encoding="utf-8"))
+        assert statements, path.name
+        for statement in statements:
+            assert not statement.startswith("--"), path.name
+            assert not statement.endswith(";"), path.name
+
+
+def test_split_statements_quotes_and_dollar():
+    sql = """
+    -- 주석; 무시
+    SELECT 'a;b', "x;y" FROM t; /* c; */
+    DO $body$ BEGIN PERFORM 1; END $body$;
+    SELECT 'it''s'
+    """
+    assert split_statements(sql) == [
+        "SELECT 'a;b', \"x;y\" FROM t",
+        "DO $body$ BEGIN PERFORM 1; END $body$",
+        "SELECT 'it''s'",
+    ]
+
+
+@pytest.fixture
+def conn(pg_engine):
+    """python -m app.migrate와 같은 autocommit 연결 (빈 임시 스키마)"""
+    with pg_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.exec_driver_sql(CREATE_VERSION_TABLE)
+        yield connection
+
+
+def _seed_votes(conn) -> None:
+    """baseline 스키마에 가능 투표 VOTE_COUNT개와 불가능 투표 1개"""
+    user_id = conn.execute(text(
+        "INSERT INTO \"user\" (name, email, oauth_provider, oauth_id) "
+        "VALUES ('u', 'u@example.com', 'kakao', 'u') RETURNING id"
+    )).scalar()
+    meeting_id, candidate_id = uuid.uuid4(), uuid.uuid4()
+    conn.execute(
+        text("INSERT INTO meeting (id, name, creator_id, purpose) VALUES (:id, 'm', :user_id, ARRAY['dining'])"),
+        {"id": meeting_id, "user_id": user_id},
+    )
+    conn.execute(
+        text("INSERT INTO meeting_time_candidate (id, meeting_id, candidate_time) VALUES (:id, :meeting_id, '{}')"),
+        {"id": candidate_id, "meeting_id": meeting_id},
+    )
+    for index in range(VOTE_COUNT + 1):
+        participant_id = uuid.uuid4()
+        conn.execute(
+            text("INSERT INTO participant (id, meeting_id) VALUES (:id, :meeting_id)"),
+            {"id": participant_id, "meeting_id": meeting_id},
+        )
+        conn.execute(
+            text(
+                "INSERT INTO time_vote (id, participant_id, meeting_id, time_candidate_id, time_list, is_available) "
+                "VALUES (:id, :participant_id, :meeting_id, :candidate_id, :time_list, :is_available)"
+            ),
+            {
+                "id": uuid.uuid4(),
+                "participant_id": participant_id,
+                "meeting_id": meeting_id,
+                "candidate_id": candidate_id,
+                # 해석할 수 없는 값(형식 오류, 없는 날짜, 뒤에 붙은 글자)은 배치를 실패시키지 않고 제외
+                "time_list": [
+                    "2025-01-01 10:00",
+                    "2025-01-01T10:30",
+                    "언제든",
+                    "2025-02-30 10:00",
+                    "2025-11-01 10:00 저녁",
+                    "2025-11-01 25:00",
+                ],
+                "is_available": index < VOTE_COUNT,
+            },
+        )
+
+
+def test_upgrade_backfills_and_downgrade(conn):
+    migrations = discover()
+    upgrade(conn, migrations, target=0)
+    _seed_votes(conn)
+    # 시간대가 없는 투표 시간은 세션 시간대와 관계없이 UTC로 해석
+    conn.exec_driver_sql("SET TIME ZONE 'Asia/Seoul'")
+
+    assert upgrade(conn, migrations) == len(migrations) - 1
+    assert current_version(conn) == migrations[-1].version
+    slots = conn.execute(text("SELECT DISTINCT slot FROM time_vote_slot ORDER BY slot")).scalars().all()
+    assert [f"{slot:%H:%M}" for slot in slots] == ["10:00", "10:30"]
+    assert conn.execute(text("SELECT count(*) FROM time_vote_slot")).scalar() == VOTE_COUNT * 2
+    assert conn.execute(text("SHOW TimeZone")).scalar() == "Asia/Seoul"
+    assert conn.execute(text("SELECT count(*) FROM meeting WHERE created_at IS NULL")).scalar() == 0
+    # 목록 인덱스는 처음부터 삭제되지 않은 행만 담는 부분 인덱스
+    partial = conn.execute(text(
+        "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE c.relname = ANY(:names) AND i.indpred IS NOT NULL AND pg_table_is_visible(c.oid)"
+    ), {"names": LIST_INDEXES}).scalars().all()
+    assert sorted(partial) == sorted(LIST_INDEXES)
+    assert conn.execute(text("SELECT to_regclass('ix_review_meeting_id')")).scalar() is not None
+
+    assert downgrade(conn, migrations, target=0) == len(migrations) - 1
+    assert current_version(conn) == 0
+    for relation in ("time_vote_slot", "ix_review_active_user_created_at_id", "ix_review_meeting_id"):
+        assert conn.execute(text("SELECT to_regclass(:name)"), {"name": relation}).scalar() is None
+
+
+def test_backfill_batches(conn):
+    migrations = discover()
+    upgrade(conn, migrations, target=0)
+    _seed_votes(conn)
+    conn.exec_driver_sql("ALTER TABLE time_vote ADD COLUMN slot_count INTEGER")
+
+    ctx = MigrationContext(conn)
+    updated = ctx.backfill(
+        "UPDATE time_vote SET slot_count = cardinality(time_list) WHERE id = ANY(:ids)",
+        table="time_vote",
+        where="slot_count IS NULL AND is_available",
+        batch_size=2,
+    )
+    assert updated == VOTE_COUNT
+    counts = conn.execute(text("SELECT is_available, slot_count FROM time_vote")).all()
+    assert sorted(counts, key=lambda row: row[0]) == [(False, None)] + [(True, 6)] * VOTE_COUNT
+    # 다시 실행해도 남은 대상이 없음
+    assert ctx.backfill(
+        "UPDATE time_vote SET slot_count = 0 WHERE id = ANY(:ids)",
+        table="time_vote",
+        where="slot_count IS NULL AND is_available",
+        batch_size=2,
+    ) == 0
@@ -0,0 +1,108 @@
+"""요청 단위 SQL 계측과 N+1 감지(테스트 모드) 테스트"""
+import uuid
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app import crud
+from app.database import Base
+from app.models import MeetingTimeCandidate, Meeting, Participant, Review, TimeVote, User
+from app.sql_metrics import (
+    NPlusOneQueryError,
+    RequestQueryStats,
+    begin_request_stats,
+    end_request_stats,
+    install_query_listeners,
+)
+
+THRESHOLD = 3
+MEMBER_COUNT = 6  # THRESHOLD보다 많아야 lazy load 반복이 감지됨
+
+
+@pytest.fixture
+def db(pg_engine):
+    """N+1 테스트 모드(SQL_N_PLUS_ONE_RAISE)로 계측하는 세션"""
+    Base.metadata.create_all(pg_engine)
+    install_query_listeners(pg_engine, slow_query_ms=1000, n_plus_one_threshold=THRESHOLD, n_plus_one_raise=True)
+    session = sessionmaker(bind=pg_engine, autoflush=False, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def meeting_id(db):
+    """작성자가 모두 다른 리뷰, 참가자, 시간 후보/투표가 있는 모임"""
+    users = [
+        User(name=f"user-{i}", email=f"user-{i}@example.com", oauth_provider="kakao", oauth_id=f"user-{i}")
+        for i in range(MEMBER_COUNT)
+    ]
+    db.add_all(users)
+    db.flush()
+    meeting = Meeting(name="n+1", purpose=["dining"], creator_id=users[0].id)
+    db.add(meeting)
+    db.flush()
+    participants = [Participant(meeting_id=meeting.id, user_id=user.id) for user in users]
+    candidates = [MeetingTimeCandidate(meeting_id=meeting.id, candidate_time={}) for _ in range(MEMBER_COUNT)]
+    db.add_all(participants + candidates)
+    db.add_all([Review(meeting_id=meeting.id, user_id=user.id, text="좋아요") for user in users])
+    db.flush()
+    db.add_all([
+        TimeVote(
+            participant_id=participant.id,
+            meeting_id=meeting.id,
+            time_candidate_id=candidate.id,
+            time_list=["2025-01-01 10:00"],
+            is_available=True,
+        )
+        for participant in participants
+        for candidate in candidates
+    ])
+    db.commit()
+    db.expunge_all()
+    return meeting.id
+
+
+@pytest.fixture
+def request_stats():
+    stats, token = begin_request_stats()
+    try:
+        yield stats
+    finally:
+        end_request_stats(token)
+
+
+def test_lazy_load_loop_raises(db, meeting_id, request_stats):
+    reviews = db.query(Review).filter(Review.meeting_id == meeting_id).all()
+    with pytest.raises(NPlusOneQueryError):
+        for review in reviews:
+            review.user.name
+
+
+def test_reviews_by_meeting_joinedload(db, meeting_id, request_stats):
+    reviews = crud.review.get_reviews_by_meeting(db, meeting_id=meeting_id)
+    assert len({review.user.id for review in reviews}) == MEMBER_COUNT
+    assert request_stats.max_repeat <= THRESHOLD
+
+
+def test_meeting_dashboard_fixed_queries(db, meeting_id, request_stats):
+    dashboard = crud.meeting.get_meeting_dashboard(db, meeting_id=meeting_id)
+    assert dashboard["meeting"].creator.name == "user-0"
+    assert len(dashboard["participants"]) == MEMBER_COUNT
+    assert sum(len(candidate.votes) for candidate in dashboard["time_candidates"]) == MEMBER_COUNT ** 2
+    assert request_stats.count == 6
+    assert request_stats.max_repeat <= THRESHOLD
+
+
+def test_outside_request_not_counted(db, meeting_id):
+    # 요청 컨텍스트 밖(배치 작업 등)에서는 감지하지 않음
+    for review in db.query(Review).filter(Review.meeting_id == meeting_id).all():
+        review.user.name
+
+
+def test_max_repeat_header_only_when_detection_on():
+    stats = RequestQueryStats()
+    stats.count_shape("SELECT 1")
+    assert "X-DB-Max-Repeat" not in stats.as_headers()
+    assert stats.as_headers(include_max_repeat=True)["X-DB-Max-Repeat"] == "1"
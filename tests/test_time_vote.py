@@ -0,0 +1,95 @@
+"""시간 투표 쓰기 테스트"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app import crud
+from app.database import Base, settings
+from app.models import Meeting, MeetingTimeCandidate, Participant, TimeVoteSlot, User
+from app.schemas.time_vote import TimeVoteCreate, TimeVoteUpdate
+
+MEETING_UPDATED_AT = datetime(2025, 1, 1, 9, 0)
+CANDIDATE_TIME = {"2025-01-01 10:00": 0, "2025-01-01 11:00": 0}
+
+
+@pytest.fixture
+def db(pg_engine):
+    Base.metadata.create_all(pg_engine)
+    session = sessionmaker(bind=pg_engine, autoflush=False, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def candidate(db):
+    """참가자 두 명이 있는 모임의 시간 후보"""
+    user = User(name="u", email="u@example.com", oauth_provider="kakao", oauth_id="u")
+    db.add(user)
+    db.flush()
+    meeting = Meeting(name="m", purpose=["dining"], creator_id=user.id, updated_at=MEETING_UPDATED_AT)
+    db.add(meeting)
+    db.flush()
+    db.add_all([
+        Participant(meeting_id=meeting.id, user_id=user.id),
+        Participant(meeting_id=meeting.id, nickname="guest"),
+        MeetingTimeCandidate(meeting_id=meeting.id, candidate_time=dict(CANDIDATE_TIME)),
+    ])
+    db.commit()
+    return db.query(MeetingTimeCandidate).filter(MeetingTimeCandidate.meeting_id == meeting.id).one()
+
+
+def _participants(db, candidate):
+    return db.query(Participant).filter(Participant.meeting_id == candidate.meeting_id).order_by(Participant.id).all()
+
+
+def _vote(db, candidate, time_list, participant=None):
+    participant = participant or _participants(db, candidate)[0]
+    return crud.time_vote.create_time_vote(db, TimeVoteCreate(
+        participant_id=participant.id,
+        meeting_id=candidate.meeting_id,
+        time_candidate_id=candidate.id,
+        time_list=time_list,
+        is_available=True,
+    ))
+
+
+def _meeting(db, meeting_id) -> Meeting:
+    db.expire_all()
+    return db.query(Meeting).filter(Meeting.id == meeting_id).one()
+
+
+def _stored_counts(db, candidate):
+    db.expire_all()
+    return crud.meeting_time_candidate.get_time_candidate(db, candidate.id).candidate_time
+
+
+def test_vote_bumps_version_not_updated_at(db, candidate):
+    version = _meeting(db, candidate.meeting_id).version
+    _vote(db, candidate, ["2025-01-01 10:00"])
+    meeting = _meeting(db, candidate.meeting_id)
+    assert meeting.version == version + 1
+    assert meeting.updated_at == MEETING_UPDATED_AT
+
+
+def test_same_instant_spellings_keep_slot_row(db, candidate):
+    vote = _vote(db, candidate, ["2025-01-01 10:00", "2025-01-01T10:00"])
+    crud.time_vote.update_time_vote(db, vote.id, TimeVoteUpdate(time_list=["2025-01-01T10:00"]))
+    slots = db.query(TimeVoteSlot.slot).filter(TimeVoteSlot.time_vote_id == vote.id).all()
+    assert [slot for (slot,) in slots] == [datetime(2025, 1, 1, 10, 0)]
+    assert _stored_counts(db, candidate) == {"2025-01-01 10:00": 1, "2025-01-01 11:00": 0}
+
+
+@pytest.mark.parametrize("slot_reads", [False, True])
+def test_incremental_counts_match_recount(db, candidate, monkeypatch, slot_reads):
+    monkeypatch.setattr(settings, "TIME_VOTE_SLOT_READS", slot_reads)
+    first, second = _participants(db, candidate)
+    _vote(db, candidate, ["2025-01-01 10:00", "2025-01-01T10:00", "2025-01-01T11:00:00"], first)
+    _vote(db, candidate, ["2025-01-01T10:00", "언제든"], second)
+
+    expected = {"2025-01-01 10:00": 2, "2025-01-01 11:00": 1}
+    assert _stored_counts(db, candidate) == expected
+    assert crud.meeting_time_candidate.verify_vote_count(db, candidate.id) == {}
+    assert crud.meeting_time_candidate.update_vote_count(db, candidate.id).candidate_time == expected